@@ -1,11 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 from sqlmodel.ext.asyncio.session import AsyncSession
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Tuple
+import csv
+import io
+import json
 from datetime import date, time, datetime, timezone
 
-from db.database import get_session
+from db.database import get_session, async_session_factory
 from db import crud
-from db.models import User, Attendance
+from db.pagination import PageParams, page_params, set_next_cursor
+from db.models import Attendance
 from schemas.attendance import (
     CheckInRequest,
     CheckOutRequest,
@@ -13,8 +19,16 @@ from schemas.attendance import (
     AttendanceRead,
     AttendanceStats,
     AttendanceReadWithUser,
+    AttendanceMonthlyStats,
+    AttendanceUserStats,
+    PunchEvent,
+    PunchResult,
+    PunchIngestResponse,
 )
-from core.security import get_current_user, get_current_admin_user
+from schemas.user import UserPrincipal
+from core.security import get_current_user, get_current_admin_user, get_current_device
+from core.config import settings
+from utils import checkin_batcher
 
 router = APIRouter(prefix="/attendance", tags=["Attendance"])
 
@@ -22,7 +36,7 @@ router = APIRouter(prefix="/attendance", tags=["Attendance"])
 @router.post("/check-in", response_model=AttendanceRead)
 async def check_in(
     check_in_data: CheckInRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ):
     """
@@ -30,8 +44,16 @@ async def check_in(
     - work_date: 근무일 (기본값: 오늘)
     - check_in: 출근 시각
     - 09:00 이후 출근 시 자동으로 '지각'으로 표시됩니다.
+    - CHECKIN_BATCH_ENABLED=true면 짧은 시간 동안 모인 체크인과 함께 묶어서 저장합니다.
     """
     try:
+        if settings.CHECKIN_BATCH_ENABLED:
+            return await checkin_batcher.submit(
+                user_id=current_user.id,
+                work_date=check_in_data.work_date,
+                check_in_time=check_in_data.check_in,
+                notes=check_in_data.notes,
+            )
         attendance = await crud.check_in_attendance(
             session=session,
             user_id=current_user.id,
@@ -50,7 +72,7 @@ async def check_in(
 async def check_out(
     check_out_data: CheckOutRequest,
     work_date: date = Query(..., description="퇴근할 근무일"),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ):
     """
@@ -77,7 +99,7 @@ async def check_out(
 async def get_my_attendance_records(
     start_date: Optional[date] = Query(None, description="조회 시작일"),
     end_date: Optional[date] = Query(None, description="조회 종료일"),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ):
     """
@@ -97,7 +119,7 @@ async def get_my_attendance_records(
 async def get_my_attendance_stats(
     start_date: date = Query(..., description="통계 시작일"),
     end_date: date = Query(..., description="통계 종료일"),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ):
     """
@@ -113,9 +135,23 @@ async def get_my_attendance_stats(
     return AttendanceStats(**stats)
 
 
+@router.get("/my-stats/monthly", response_model=List[AttendanceMonthlyStats])
+async def get_my_monthly_attendance_stats(
+    year: int = Query(..., ge=2000, le=2100, description="통계 연도"),
+    current_user: UserPrincipal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    로그인한 사용자의 월별(1~12월) 근태 통계를 한 번에 조회합니다.
+    """
+    return await crud.get_monthly_attendance_stats(
+        session=session, user_id=current_user.id, year=year
+    )
+
+
 @router.get("/today", response_model=AttendanceRead)
 async def get_today_attendance(
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ):
     """
@@ -138,31 +174,104 @@ async def get_today_attendance(
 
 @router.get("/admin/all-records", response_model=List[AttendanceReadWithUser])
 async def get_all_attendance_records_admin(
+    response: Response,
     work_date: Optional[date] = Query(None, description="특정 날짜 조회"),
     start_date: Optional[date] = Query(None, description="조회 시작일"),
     end_date: Optional[date] = Query(None, description="조회 종료일"),
-    current_admin: User = Depends(get_current_admin_user),
+    page: PageParams = Depends(page_params),
+    current_admin: UserPrincipal = Depends(get_current_admin_user),
     session: AsyncSession = Depends(get_session),
 ):
     """
     [관리자 전용] 전체 사용자의 근태 기록을 조회합니다.
     - work_date: 특정 날짜만 조회
     - start_date, end_date: 기간으로 조회
+    - limit, cursor로 페이지 단위 조회 (다음 페이지 커서는 X-Next-Cursor 헤더)
     """
     attendances = await crud.get_all_attendances(
         session=session,
         work_date=work_date,
         start_date=start_date,
         end_date=end_date,
+        page=page,
     )
+    set_next_cursor(response, page)
     return attendances
 
 
+_EXPORT_FIELDS = [column.key for column in crud.ATTENDANCE_EXPORT_COLUMNS]
+
+
+def _export_value(value):
+    if isinstance(value, (date, time, datetime)):
+        return value.isoformat()
+    return value
+
+
+async def _export_attendance_rows(
+    export_format: str,
+    work_date: Optional[date],
+    start_date: Optional[date],
+    end_date: Optional[date],
+) -> AsyncIterator[str]:
+    # 응답 스트리밍이 끝날 때까지 유지되는 전용 세션 사용
+    async with async_session_factory() as session:
+        if export_format == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(_EXPORT_FIELDS)
+            yield buffer.getvalue()
+
+        async for rows in crud.stream_all_attendances(
+            session,
+            work_date=work_date,
+            start_date=start_date,
+            end_date=end_date,
+            chunk_size=settings.EXPORT_CHUNK_SIZE,
+        ):
+            # 청크 단위로 직렬화하여 전송 (행 단위 전송보다 write 호출 수가 적음)
+            if export_format == "csv":
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                writer.writerows([_export_value(v) for v in row] for row in rows)
+                yield buffer.getvalue()
+            else:
+                yield "".join(
+                    json.dumps(
+                        {field: _export_value(v) for field, v in zip(_EXPORT_FIELDS, row)},
+                        ensure_ascii=False,
+                    ) + "\n"
+                    for row in rows
+                )
+
+
+@router.get("/admin/export")
+async def export_attendance_records_admin(
+    export_format: str = Query("csv", alias="format", pattern="^(csv|ndjson)$", description="csv 또는 ndjson"),
+    work_date: Optional[date] = Query(None, description="특정 날짜 조회"),
+    start_date: Optional[date] = Query(None, description="조회 시작일"),
+    end_date: Optional[date] = Query(None, description="조회 종료일"),
+    current_admin: UserPrincipal = Depends(get_current_admin_user),
+):
+    """
+    [관리자 전용] 전체 사용자의 근태 기록을 CSV 또는 NDJSON으로 내보냅니다.
+    - 서버 사이드 커서로 읽은 행을 바로 전송하므로 기간이 길어도 메모리 사용량이 일정합니다.
+    - 정렬: work_date 내림차순, user_id 오름차순
+    """
+    media_type = "text/csv; charset=utf-8" if export_format == "csv" else "application/x-ndjson"
+    filename = f"attendance_{start_date or work_date or 'all'}_{end_date or work_date or 'all'}.{export_format}"
+    return StreamingResponse(
+        _export_attendance_rows(export_format, work_date, start_date, end_date),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @router.post("/admin/create/{user_id}", response_model=AttendanceRead)
 async def create_attendance_record_admin(
     user_id: int,
     attendance_in: AttendanceCreate,
-    current_admin: User = Depends(get_current_admin_user),
+    current_admin: UserPrincipal = Depends(get_current_admin_user),
     session: AsyncSession = Depends(get_session),
 ):
     """
@@ -180,12 +289,45 @@ async def create_attendance_record_admin(
         )
 
 
+@router.get("/admin/stats", response_model=List[AttendanceUserStats])
+async def get_org_attendance_stats_admin(
+    start_date: date = Query(..., description="통계 시작일"),
+    end_date: date = Query(..., description="통계 종료일"),
+    user_ids: Optional[List[int]] = Query(None, description="특정 사용자만 조회 (반복 지정: user_ids=1&user_ids=2)"),
+    sort: str = Query(
+        "attendance_rate",
+        description="정렬 기준 (앞에 '-'를 붙이면 내림차순). 기본값은 출석률 낮은 순",
+    ),
+    limit: Optional[int] = Query(None, ge=1, le=settings.PAGE_SIZE_MAX, description="상위 N명만 반환"),
+    current_admin: UserPrincipal = Depends(get_current_admin_user),
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    [관리자 전용] 재직 중인 전체 사용자의 근태 통계를 한 번에 조회합니다.
+    - 사용자별로 /admin/user/{user_id}/stats를 반복 호출하는 대신 사용
+    - sort: user_id, total_days, present_days, late_days, early_leave_days, absent_days, attendance_rate
+    """
+    try:
+        return await crud.get_org_attendance_stats(
+            session=session,
+            start_date=start_date,
+            end_date=end_date,
+            user_ids=user_ids,
+            sort=sort,
+            limit=limit,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        )
+
+
 @router.get("/admin/user/{user_id}/stats", response_model=AttendanceStats)
 async def get_user_attendance_stats_admin(
     user_id: int,
     start_date: date = Query(..., description="통계 시작일"),
     end_date: date = Query(..., description="통계 종료일"),
-    current_admin: User = Depends(get_current_admin_user),
+    current_admin: UserPrincipal = Depends(get_current_admin_user),
     session: AsyncSession = Depends(get_session),
 ):
     """
@@ -198,3 +340,112 @@ async def get_user_attendance_stats_admin(
         end_date=end_date,
     )
     return AttendanceStats(**stats)
+
+
+@router.get("/admin/user/{user_id}/stats/monthly", response_model=List[AttendanceMonthlyStats])
+async def get_user_monthly_attendance_stats_admin(
+    user_id: int,
+    year: int = Query(..., ge=2000, le=2100, description="통계 연도"),
+    current_admin: UserPrincipal = Depends(get_current_admin_user),
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    [관리자 전용] 특정 사용자의 월별(1~12월) 근태 통계를 한 번에 조회합니다.
+    """
+    return await crud.get_monthly_attendance_stats(
+        session=session, user_id=user_id, year=year
+    )
+
+
+# === 출입 단말기 연동 ===
+
+async def _ndjson_lines(request: Request) -> AsyncIterator[Tuple[int, Optional[bytes]]]:
+    """
+    요청 본문을 읽는 대로 (줄 번호, 줄 내용)으로 나눕니다.
+    PUNCH_MAX_LINE_BYTES를 넘는 줄은 버퍼에 쌓지 않고 내용 대신 None을 반환합니다.
+    """
+    line_no = 0
+    buffer = b""
+    too_long = False  # 버퍼에 있던 줄이 이미 한도를 넘어 버려졌는지
+    limit = settings.PUNCH_MAX_LINE_BYTES
+    async for chunk in request.stream():
+        lines = (buffer + chunk).split(b"\n")
+        buffer = lines.pop()
+        for line in lines:
+            line_no += 1
+            yield line_no, None if too_long or len(line) > limit else line
+            too_long = False
+        if len(buffer) > limit:
+            buffer = b""
+            too_long = True
+    if buffer or too_long:
+        yield line_no + 1, None if too_long else buffer
+
+
+def _punch_local(timestamp: datetime) -> Tuple[date, time]:
+    """시간대가 있는 타임스탬프는 서버 현지 시각으로 바꾼 뒤 (근무일, 시각)으로 나눕니다."""
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone().replace(tzinfo=None)
+    return timestamp.date(), timestamp.time().replace(microsecond=0)
+
+
+@router.post("/device/punches", response_model=PunchIngestResponse)
+async def ingest_punch_events(
+    request: Request,
+    device_key: str = Depends(get_current_device),
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    [출입 단말기 전용] NDJSON 본문의 출입 기록을 체크인/체크아웃으로 반영합니다.
+    - 인증: X-Device-Key 헤더 (DEVICE_API_KEYS)
+    - 한 줄에 이벤트 1건: {"user_id": 1, "timestamp": "2025-10-01T08:57:00+09:00", "direction": "in"}
+    - 본문을 읽는 대로 PUNCH_BATCH_SIZE건씩 묶어서 반영하며, 같은 근무일의 두 번째 in,
+      두 번째 out 등은 체크인/체크아웃 API와 같은 이유로 거절됩니다.
+    - 지각(09:00 이후 출근)·조퇴(18:00 이전 퇴근) 판정은 체크인/체크아웃 API와 같습니다.
+    - 동시 갱신과 충돌해 재시도로도 반영하지 못한 묶음의 이벤트는 error로 반환합니다. (다시 전송)
+    """
+    results: List[PunchResult] = []
+    batch: List[Tuple[int, PunchEvent]] = []
+
+    async def flush():
+        if not batch:
+            return
+        outcomes = await crud.apply_punch_events(
+            session,
+            [(event.user_id, *_punch_local(event.timestamp), event.direction) for _, event in batch],
+        )
+        for (line_no, event), (result, attendance_status, detail) in zip(batch, outcomes):
+            results.append(PunchResult(
+                line=line_no,
+                user_id=event.user_id,
+                result=result,
+                status=attendance_status,
+                detail=detail,
+            ))
+        batch.clear()
+
+    async for line_no, line in _ndjson_lines(request):
+        if line is None:
+            results.append(PunchResult(line=line_no, result="invalid", detail="Line too long"))
+            continue
+        if not line.strip():
+            continue
+        try:
+            batch.append((line_no, PunchEvent.model_validate_json(line)))
+        except ValidationError as e:
+            results.append(PunchResult(
+                line=line_no, result="invalid", detail=e.errors(include_url=False)[0]["msg"]
+            ))
+            continue
+        if len(batch) >= settings.PUNCH_BATCH_SIZE:
+            await flush()
+    await flush()
+
+    results.sort(key=lambda item: item.line)
+    applied = sum(1 for item in results if item.result in ("checked_in", "checked_out"))
+    return PunchIngestResponse(
+        received=len(results),
+        applied=applied,
+        rejected=len(results) - applied,
+        results=results,
+    )
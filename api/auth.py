@@ -7,7 +7,7 @@ from db.database import get_session
 from db import crud
 from schemas.user import UserCreate, UserRead
 from schemas.token import Token
-from core.security import create_access_token, verify_password
+from core.security import create_access_token, verify_password_async
 from core.config import settings
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
@@ -49,7 +49,8 @@ async def login_for_access_token(
         )
     
     # 2. 비밀번호 확인
-    if not verify_password(form_data.password, user.hashed_password):
+    # bcrypt는 스레드 풀에서 실행 (이벤트 루프 블로킹 방지)
+    if not await verify_password_async(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
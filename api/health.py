@@ -0,0 +1,48 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import text
+
+from db.database import get_session, get_pool_stats
+from core.security import principal_cache
+from utils import checkin_batcher, payslip_jobs
+from utils.pdf_extractor import payslip_cache
+
+router = APIRouter(prefix="/health", tags=["Health"])
+
+
+@router.get("/live")
+async def liveness():
+    """
+    프로세스 생존 여부를 확인합니다. (DB 접근 없음)
+    """
+    return {"status": "ok"}
+
+
+@router.get("/ready")
+async def readiness(
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    DB 연결 가능 여부와 커넥션 풀 현황을 반환합니다.
+    - checked_out: 현재 사용 중인 커넥션 수
+    - overflow: pool_size를 초과해 열린 커넥션 수
+    - avg_wait_ms / max_wait_ms: 커넥션 획득 대기 시간
+    - principal_cache: 인증 사용자 캐시 hit/miss 통계
+    - payslip_cache: 급여명세서 추출 결과 캐시 hit/miss 통계
+    - checkin_batch: 체크인 묶음 쓰기 통계 (CHECKIN_BATCH_ENABLED일 때)
+    """
+    try:
+        await session.execute(text("SELECT 1"))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Database unavailable: {str(e)}",
+        )
+    return {
+        "status": "ok",
+        "pool": get_pool_stats(),
+        "principal_cache": principal_cache.stats(),
+        "payslip_queue_depth": payslip_jobs.queue_depth(),
+        "payslip_cache": payslip_cache.stats(),
+        "checkin_batch": checkin_batcher.stats(),
+    }
@@ -1,22 +1,30 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import List, Optional # 파이썬 3.9는 List 임포트 필요
+from datetime import date
 
 from db.database import get_session
 from db import crud
-from db.models import User, LeaveBalance, LeaveRequest
+from db.pagination import PageParams, page_params, set_next_cursor
+from db.models import LeaveBalance, LeaveRequest
 from schemas.leave import (
     LeaveRequestCreate,
     LeaveRequestRead,
     LeaveBalanceRead,
+    LeaveBulkDecision,
+    LeaveDecisionResult,
+    LeaveCalendarDay,
+    LeaveCalendarEntry,
 )
+from schemas.user import UserPrincipal
 from core.security import get_current_user, get_current_admin_user
+from core.config import settings
 
 router = APIRouter(prefix="/leave", tags=["Leave"])
 
 @router.get("/balance", response_model=LeaveBalanceRead)
 async def get_my_leave_balance(
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ):
     """
@@ -31,13 +39,14 @@ async def get_my_leave_balance(
             detail="Leave balance data not found.",
         )
 
-    # 남은 연차 일수 계산
-    remaining_days = balance.total_granted - balance.total_used
+    # 남은 연차 일수 계산 (승인 대기 중인 신청분 제외)
+    remaining_days = balance.total_granted - balance.total_used - balance.total_reserved
 
     # 스키마에 맞춰서 응답
     return LeaveBalanceRead(
         total_granted=balance.total_granted,
         total_used=balance.total_used,
+        total_reserved=balance.total_reserved,
         remaining_days=remaining_days,
     )
 
@@ -45,11 +54,12 @@ async def get_my_leave_balance(
 @router.post("/request", response_model=LeaveRequestRead)
 async def create_my_leave_request(
     request_in: LeaveRequestCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ):
     """
     새로운 연차를 신청합니다.
+    - 신청 일수는 승인/거부 전까지 남은 연차에서 예약(total_reserved)됩니다.
     """
     # 1. 날짜 검증: start_date가 end_date보다 이전이어야 함
     if request_in.start_date > request_in.end_date:
@@ -58,39 +68,44 @@ async def create_my_leave_request(
             detail="Start date must be before or equal to end date"
         )
 
-    # 2. 잔여 연차 확인
-    balance = await crud.get_leave_balance_by_user(session, user_id=current_user.id)
-    if not balance:
+    # 2. 잔여 연차 예약 + 연차 신청 생성 (잔여 연차 확인은 조건부 UPDATE로 처리)
+    try:
+        new_request = await crud.create_leave_request(
+            session=session, user_id=current_user.id, request_in=request_in
+        )
+    except crud.LeaveBalanceNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Leave balance data not found"
+            detail=str(e)
         )
-
-    remaining_days = balance.total_granted - balance.total_used
-    if request_in.days_used > remaining_days:
+    except crud.InsufficientLeaveBalanceError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Insufficient leave balance. You have {remaining_days} days remaining, but requested {request_in.days_used} days."
+            detail=str(e)
+        )
+    except crud.OverlappingLeaveRequestError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
         )
-
-    # 3. 연차 신청 생성
-    new_request = await crud.create_leave_request(
-        session=session, user_id=current_user.id, request_in=request_in
-    )
     return new_request
 
 
 @router.get("/requests", response_model=List[LeaveRequestRead])
 async def get_my_leave_requests(
-    current_user: User = Depends(get_current_user),
+    response: Response,
+    page: PageParams = Depends(page_params),
+    current_user: UserPrincipal = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ):
     """
     로그인된 사용자의 모든 연차 신청 내역을 조회합니다.
+    - limit, cursor로 페이지 단위 조회 (다음 페이지 커서는 X-Next-Cursor 헤더)
     """
     requests = await crud.get_leave_requests_by_user(
-        session=session, user_id=current_user.id
+        session=session, user_id=current_user.id, page=page
     )
+    set_next_cursor(response, page)
     return requests
 
 
@@ -98,24 +113,74 @@ async def get_my_leave_requests(
 
 @router.get("/admin/all-requests", response_model=List[LeaveRequestRead])
 async def get_all_leave_requests_admin(
+    response: Response,
     status_filter: Optional[str] = None,
-    current_admin: User = Depends(get_current_admin_user),
+    page: PageParams = Depends(page_params),
+    current_admin: UserPrincipal = Depends(get_current_admin_user),
     session: AsyncSession = Depends(get_session),
 ):
     """
     [관리자 전용] 모든 사용자의 연차 신청 내역을 조회합니다.
     status_filter: pending, approved, rejected 중 하나 (선택사항)
+    - limit, cursor로 페이지 단위 조회 (다음 페이지 커서는 X-Next-Cursor 헤더)
     """
     requests = await crud.get_all_leave_requests(
-        session=session, status=status_filter
+        session=session, status=status_filter, page=page
     )
+    set_next_cursor(response, page)
     return requests
 
 
+@router.get("/admin/calendar", response_model=List[LeaveCalendarDay])
+async def get_leave_calendar_admin(
+    start_date: date = Query(..., description="조회 시작일"),
+    end_date: date = Query(..., description="조회 종료일"),
+    current_admin: UserPrincipal = Depends(get_current_admin_user),
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    [관리자 전용] 기간 내 날짜별로 연차(승인/대기) 중인 사용자를 조회합니다.
+    - 조회 기간은 최대 LEAVE_CALENDAR_MAX_DAYS일
+    """
+    if start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Start date must be before or equal to end date"
+        )
+    if (end_date - start_date).days + 1 > settings.LEAVE_CALENDAR_MAX_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Date range must be at most {settings.LEAVE_CALENDAR_MAX_DAYS} days"
+        )
+
+    calendar = await crud.get_leave_calendar(
+        session=session, start_date=start_date, end_date=end_date
+    )
+    return [
+        LeaveCalendarDay(
+            date=day,
+            entries=[
+                LeaveCalendarEntry(
+                    request_id=row.id,
+                    user_id=row.user_id,
+                    user_name=row.user_name,
+                    user_email=row.user_email,
+                    start_date=row.start_date,
+                    end_date=row.end_date,
+                    days_used=row.days_used,
+                    status=row.status,
+                )
+                for row in rows
+            ],
+        )
+        for day, rows in calendar.items()
+    ]
+
+
 @router.patch("/admin/approve/{request_id}", response_model=LeaveRequestRead)
 async def approve_leave_request_admin(
     request_id: int,
-    current_admin: User = Depends(get_current_admin_user),
+    current_admin: UserPrincipal = Depends(get_current_admin_user),
     session: AsyncSession = Depends(get_session),
 ):
     """
@@ -137,7 +202,7 @@ async def approve_leave_request_admin(
 @router.patch("/admin/reject/{request_id}", response_model=LeaveRequestRead)
 async def reject_leave_request_admin(
     request_id: int,
-    current_admin: User = Depends(get_current_admin_user),
+    current_admin: UserPrincipal = Depends(get_current_admin_user),
     session: AsyncSession = Depends(get_session),
 ):
     """
@@ -152,4 +217,26 @@ async def reject_leave_request_admin(
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
-        )
\ No newline at end of file
+        )
+
+
+@router.post("/admin/bulk-decision", response_model=List[LeaveDecisionResult])
+async def decide_leave_requests_admin(
+    decision: LeaveBulkDecision,
+    current_admin: UserPrincipal = Depends(get_current_admin_user),
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    [관리자 전용] 여러 연차 신청을 한 번에 승인(approve) 또는 거부(reject)합니다.
+    - 한 트랜잭션에서 처리하며, 신청 건별 결과(outcome)를 반환합니다.
+    - pending이 아닌 신청은 not_pending, 없는 신청은 not_found로 표시되고 건너뜁니다.
+    """
+    outcomes = await crud.decide_leave_requests(
+        session=session,
+        request_ids=decision.request_ids,
+        approve=decision.action == "approve",
+    )
+    return [
+        LeaveDecisionResult(request_id=request_id, outcome=outcome, status=request_status)
+        for request_id, outcome, request_status in outcomes
+    ]
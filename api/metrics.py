@@ -0,0 +1,31 @@
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import PlainTextResponse
+
+from core.config import settings
+from db.database import get_pool_stats
+from utils import metrics
+
+router = APIRouter(tags=["Metrics"])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """
+    Prometheus 텍스트 형식의 지표를 반환합니다. (워커 프로세스별 값)
+    - http_requests_total: 라우트/상태 코드별 요청 수
+    - http_request_duration_seconds: 라우트별 처리 시간 히스토그램
+    - http_request_db_queries / http_request_db_duration_seconds: 요청당 SQL 수/DB 시간 (N+1 탐지)
+    - db_queries_total / db_query_duration_seconds_total: 전체 SQL 실행 수/시간
+    - db_pool_*: 커넥션 풀 현황
+    """
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Metrics disabled")
+
+    pool = get_pool_stats()
+    gauges = {
+        "db_pool_checked_out": ("Connections currently checked out", pool["checked_out"]),
+        "db_pool_overflow": ("Connections opened beyond pool_size", pool["overflow"]),
+    }
+    return PlainTextResponse(metrics.render(gauges), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -1,52 +1,121 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, Response, status, UploadFile, File, Query
 from sqlmodel.ext.asyncio.session import AsyncSession
-from typing import List # 파이썬 3.9는 List 임포트 필요
-import tempfile
-import os
+from typing import List, Optional # 파이썬 3.9는 List 임포트 필요
+from collections import Counter
 
 from db.database import get_session
 from db import crud
-from db.models import User
-from schemas.salary import SalaryStatementCreate, SalaryStatementRead, PayslipUploadResponse
+from db.pagination import PageParams, page_params, set_next_cursor
+from schemas.salary import (
+    SalaryStatementCreate,
+    SalaryStatementRead,
+    PayslipUploadResponse,
+    PayslipJobRead,
+    PayslipBulkItemResult,
+    PayslipBulkUploadResponse,
+)
+from schemas.user import UserPrincipal
 from core.security import get_current_user
-from utils.pdf_extractor import extract_payslip_data, validate_payslip_data
+from core.config import settings
+from utils.pdf_extractor import (
+    extract_payslip_data,
+    validate_payslip_data,
+    content_digest,
+    payslip_cache,
+)
+from utils import payslip_jobs
 
 router = APIRouter(prefix="/salary", tags=["Salary"])
 
+_UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _upload_too_large(filename: str, limit: Optional[int] = None) -> HTTPException:
+    limit = limit or settings.PAYSLIP_MAX_UPLOAD_BYTES
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"{filename}: 파일 크기는 최대 {limit // (1024 * 1024)}MB까지 업로드 가능합니다."
+    )
+
+
+async def _ensure_upload_size(file: UploadFile, limit: Optional[int] = None) -> None:
+    """
+    업로드 파일이 limit(기본 PAYSLIP_MAX_UPLOAD_BYTES) 이하인지 확인합니다.
+    크기를 알 수 없으면 내용을 읽지 않고 끝으로 이동해 크기를 구합니다.
+    """
+    limit = limit or settings.PAYSLIP_MAX_UPLOAD_BYTES
+    size = file.size
+    if size is None:
+        size = file.file.seek(0, 2)
+        await file.seek(0)
+    if size > limit:
+        raise _upload_too_large(file.filename, limit)
+
+
+async def _read_upload_limited(file: UploadFile, limit: Optional[int] = None) -> bytes:
+    """
+    업로드 파일을 청크 단위로 읽으면서 크기 제한(기본 PAYSLIP_MAX_UPLOAD_BYTES)을 넘는 즉시 413을 반환합니다.
+    (프로세스 풀로 넘길 때처럼 바이트가 꼭 필요한 경우에만 사용)
+    """
+    limit = limit or settings.PAYSLIP_MAX_UPLOAD_BYTES
+    await _ensure_upload_size(file, limit)
+    chunks = []
+    total = 0
+    while chunk := await file.read(_UPLOAD_CHUNK_SIZE):
+        total += len(chunk)
+        if total > limit:
+            raise _upload_too_large(file.filename, limit)
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
 @router.get("", response_model=List[SalaryStatementRead])
 async def get_my_salary_statements(
-    current_user: User = Depends(get_current_user),
+    response: Response,
+    page: PageParams = Depends(page_params),
+    current_user: UserPrincipal = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ):
     """
     로그인된 사용자가 입력한 모든 급여 명세서 내역을 조회합니다.
+    - limit, cursor로 페이지 단위 조회 (다음 페이지 커서는 X-Next-Cursor 헤더)
     """
     statements = await crud.get_salary_statements_by_user(
-        session=session, user_id=current_user.id
+        session=session, user_id=current_user.id, page=page
     )
+    set_next_cursor(response, page)
     return statements
 
 
 @router.post("", response_model=SalaryStatementRead)
 async def create_my_salary_statement(
     statement_in: SalaryStatementCreate,
-    current_user: User = Depends(get_current_user),
+    replace: bool = Query(False, description="같은 지급월 명세서가 있으면 덮어쓰기"),
+    current_user: UserPrincipal = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ):
     """
     새로운 급여 명세서를 입력합니다.
     (예: pay_month: "2025-10")
+    - 같은 지급월의 명세서가 이미 있으면 409를 반환합니다. (replace=true면 덮어씀)
     """
-    new_statement = await crud.create_salary_statement(
-        session=session, user_id=current_user.id, statement_in=statement_in
-    )
+    try:
+        new_statement = await crud.create_salary_statement(
+            session=session,
+            user_id=current_user.id,
+            statement_in=statement_in,
+            replace=replace,
+        )
+    except crud.DuplicateRecordError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     return new_statement
 
 
 @router.post("/upload-pdf", response_model=PayslipUploadResponse)
 async def upload_payslip_pdf(
     file: UploadFile = File(...),
-    current_user: User = Depends(get_current_user),
+    replace: bool = Query(False, description="같은 지급월 명세서가 있으면 덮어쓰기"),
+    current_user: UserPrincipal = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ):
     """
@@ -54,6 +123,7 @@ async def upload_payslip_pdf(
 
     - PDF 파일에서 급여년월, 지급액계, 공제액계, 차인지급액을 추출합니다.
     - 추출된 데이터로 salary_statement 테이블에 레코드를 생성합니다.
+    - 같은 급여년월의 명세서가 이미 있으면 409를 반환합니다. (replace=true면 덮어씀)
     """
     # PDF 파일 형식 검증
     if not file.filename.lower().endswith('.pdf'):
@@ -62,20 +132,22 @@ async def upload_payslip_pdf(
             detail="PDF 파일만 업로드 가능합니다."
         )
 
-    # 임시 파일로 저장하여 처리
-    temp_file = None
-    try:
-        # 임시 파일 생성
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-            # 업로드된 파일 내용을 임시 파일에 저장
-            content = await file.read()
-            temp_file.write(content)
-            temp_file_path = temp_file.name
+    # 크기 제한 확인 (본문을 다시 읽지 않음)
+    await _ensure_upload_size(file)
 
+    try:
         # PDF에서 데이터 추출
+        # (임시 파일을 만들지 않고 업로드 버퍼(SpooledTemporaryFile)를 그대로 전달)
+        # 같은 내용의 PDF를 이미 추출한 적이 있으면 파싱을 건너뜀
         try:
-            payslip_data = extract_payslip_data(temp_file_path)
-            validate_payslip_data(payslip_data)
+            digest = content_digest(file.file)
+            payslip_data = payslip_cache.get(digest)
+            if payslip_data is None:
+                payslip_data = extract_payslip_data(
+                    file.file, mode=settings.PAYSLIP_EXTRACT_MODE
+                )
+                validate_payslip_data(payslip_data)
+                payslip_cache.set(digest, payslip_data)
         except ValueError as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -91,23 +163,19 @@ async def upload_payslip_pdf(
             net_pay=payslip_data.net_pay
         )
 
-        # 중복 확인: 동일한 급여년월의 레코드가 이미 있는지 확인
-        existing_statements = await crud.get_salary_statements_by_user(
-            session=session, user_id=current_user.id
-        )
-        for statement in existing_statements:
-            if statement.pay_month == payslip_data.pay_month:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"{payslip_data.pay_month} 급여명세서가 이미 등록되어 있습니다."
-                )
-
         # 데이터베이스에 저장
-        new_statement = await crud.create_salary_statement(
-            session=session,
-            user_id=current_user.id,
-            statement_in=salary_create
-        )
+        # (중복 확인은 (user_id, pay_month) 유니크 인덱스로 INSERT 시 처리)
+        try:
+            new_statement = await crud.create_salary_statement(
+                session=session,
+                user_id=current_user.id,
+                statement_in=salary_create,
+                replace=replace,
+            )
+        except crud.DuplicateRecordError as e:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT, detail=str(e)
+            )
 
         return PayslipUploadResponse(
             message="급여명세서가 성공적으로 등록되었습니다.",
@@ -122,11 +190,223 @@ async def upload_payslip_pdf(
             detail=f"급여명세서 처리 중 오류가 발생했습니다: {str(e)}"
         )
 
-    finally:
-        # 임시 파일 삭제
-        if temp_file and os.path.exists(temp_file_path):
+
+
+def _to_job_read(job: payslip_jobs.PayslipJob) -> PayslipJobRead:
+    return PayslipJobRead(
+        job_id=job.job_id,
+        status=job.status,
+        filename=job.filename,
+        created_at=job.created_at,
+        finished_at=job.finished_at,
+        error=job.error,
+        salary_statement=job.salary_statement,
+    )
+
+
+@router.post(
+    "/upload-pdf/async",
+    response_model=PayslipJobRead,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def upload_payslip_pdf_async(
+    file: UploadFile = File(...),
+    current_user: UserPrincipal = Depends(get_current_user),
+):
+    """
+    PDF 급여명세서를 비동기로 처리합니다.
+
+    - 업로드 즉시 job_id를 반환하고, 추출/저장은 백그라운드 프로세스 풀에서 진행됩니다.
+    - 처리 결과는 GET /salary/upload-jobs/{job_id} 로 확인합니다.
+    - 대기열(PAYSLIP_QUEUE_SIZE)이 가득 차면 503을 반환합니다.
+    """
+    if not file.filename.lower().endswith('.pdf'):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="PDF 파일만 업로드 가능합니다."
+        )
+
+    content = await _read_upload_limited(file)
+    try:
+        job = payslip_jobs.submit(
+            user_id=current_user.id, filename=file.filename, content=content
+        )
+    except payslip_jobs.QueueFullError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "5"},
+        )
+    return _to_job_read(job)
+
+
+@router.get("/upload-jobs/{job_id}", response_model=PayslipJobRead)
+async def get_payslip_job(
+    job_id: str,
+    current_user: UserPrincipal = Depends(get_current_user),
+):
+    """
+    비동기 급여명세서 처리 작업의 상태를 조회합니다.
+    - status: queued, processing, completed, failed
+    - completed인 경우 생성된 salary_statement가 포함됩니다.
+    """
+    job = payslip_jobs.get_job(job_id)
+    # 다른 사용자의 작업은 존재하지 않는 것으로 처리
+    if not job or job.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Upload job not found",
+        )
+    return _to_job_read(job)
+
+
+@router.post("/upload-pdf/bulk", response_model=PayslipBulkUploadResponse)
+async def upload_payslip_pdf_bulk(
+    files: List[UploadFile] = File(...),
+    current_user: UserPrincipal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    여러 PDF 급여명세서(또는 PDF를 담은 ZIP)를 한 번에 업로드합니다.
+
+    - 모든 PDF를 프로세스 풀에서 병렬로 추출합니다.
+    - 기존 급여년월 조회 1회, multi-row INSERT 1회로 저장합니다.
+    - 파일별 결과(created, duplicate, error)를 반환합니다.
+    - PDF는 PAYSLIP_MAX_UPLOAD_BYTES, ZIP은 PAYSLIP_ZIP_MAX_UPLOAD_BYTES까지 (초과 시 해당 파일만 error)
+    - ZIP 내부의 암호화·손상된 파일도 해당 파일만 error로 처리합니다.
+    - 전체 PDF 개수(PAYSLIP_BULK_MAX_FILES)와 압축 해제 후 합계 크기
+      (PAYSLIP_BULK_MAX_UNCOMPRESSED_BYTES)는 ZIP을 풀기 전에 확인하며, 넘으면 400
+    """
+    results: list[PayslipBulkItemResult] = []
+    entries: list[tuple[str, bytes]] = []
+    total_bytes = 0
+    for upload in files:
+        is_zip = (upload.filename or "").lower().endswith(".zip")
+        try:
+            content = await _read_upload_limited(
+                upload,
+                settings.PAYSLIP_ZIP_MAX_UPLOAD_BYTES if is_zip else settings.PAYSLIP_MAX_UPLOAD_BYTES,
+            )
+            collected = payslip_jobs.collect_pdf_entries(
+                upload.filename,
+                content,
+                max_entry_bytes=settings.PAYSLIP_MAX_UPLOAD_BYTES,
+                max_files=settings.PAYSLIP_BULK_MAX_FILES - len(entries),
+                max_total_bytes=settings.PAYSLIP_BULK_MAX_UNCOMPRESSED_BYTES - total_bytes,
+            )
+        except payslip_jobs.BulkLimitError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"{str(e)} (최대 {settings.PAYSLIP_BULK_MAX_FILES}개, "
+                       f"{settings.PAYSLIP_BULK_MAX_UNCOMPRESSED_BYTES // (1024 * 1024)}MB)"
+            )
+        except ValueError as e:
+            results.append(PayslipBulkItemResult(
+                filename=upload.filename, status="error", error=str(e)
+            ))
+            continue
+        except HTTPException as e:
+            # 파일 하나가 너무 커도 요청 전체가 아니라 해당 파일만 실패 처리
+            if e.status_code != status.HTTP_413_REQUEST_ENTITY_TOO_LARGE:
+                raise
+            results.append(PayslipBulkItemResult(
+                filename=upload.filename, status="error", error=e.detail
+            ))
+            continue
+        for entry_name, entry_content in collected:
+            if isinstance(entry_content, ValueError):
+                # ZIP 내부 파일 하나가 손상/암호화된 경우 해당 파일만 error
+                results.append(PayslipBulkItemResult(
+                    filename=entry_name, status="error", error=str(entry_content)
+                ))
+                continue
+            entries.append((entry_name, entry_content))
+            total_bytes += len(entry_content)
+
+    # 1. 병렬 추출
+    extracted = await payslip_jobs.extract_many([content for _, content in entries])
+
+    # 2. 기존 등록 여부를 한 번에 조회
+    parsed = [
+        (filename, data) for (filename, _), data in zip(entries, extracted)
+        if not isinstance(data, BaseException)
+    ]
+    existing_months = {
+        statement.pay_month
+        for statement in await crud.get_salary_statements_by_months(
+            session,
+            user_id=current_user.id,
+            pay_months=list({data.pay_month for _, data in parsed}),
+        )
+    }
+
+    # 3. 파일별 판정 (배치 내 같은 급여년월은 첫 번째만 저장)
+    to_create: list[tuple[str, SalaryStatementCreate]] = []
+    seen_months: set[str] = set()
+    for (filename, _), data in zip(entries, extracted):
+        if isinstance(data, ValueError):
+            results.append(PayslipBulkItemResult(
+                filename=filename, status="error", error=f"PDF 데이터 추출 실패: {str(data)}"
+            ))
+        elif isinstance(data, BaseException):
+            results.append(PayslipBulkItemResult(
+                filename=filename, status="error", error=f"급여명세서 처리 중 오류가 발생했습니다: {str(data)}"
+            ))
+        elif data.pay_month in existing_months or data.pay_month in seen_months:
+            results.append(PayslipBulkItemResult(
+                filename=filename,
+                status="duplicate",
+                pay_month=data.pay_month,
+                error=f"{data.pay_month} 급여명세서가 이미 등록되어 있습니다.",
+            ))
+        else:
+            seen_months.add(data.pay_month)
+            to_create.append((filename, SalaryStatementCreate(
+                pay_month=data.pay_month,
+                base_pay=data.base_pay,
+                bonus=0,  # PDF에서 보너스 정보가 없으므로 0으로 설정
+                deductions=data.deductions,
+                net_pay=data.net_pay
+            )))
+
+    # 4. 일괄 저장
+    try:
+        created = await crud.bulk_create_salary_statements(
+            session,
+            user_id=current_user.id,
+            statements_in=[statement_in for _, statement_in in to_create],
+        )
+    except crud.DuplicateRecordError:
+        # 조회 이후 동시에 처리된 요청과 급여년월이 겹친 경우: 한 건씩 다시 저장해 파일별로 판정
+        created = []
+        for filename, statement_in in list(to_create):
             try:
-                os.unlink(temp_file_path)
-            except Exception as e:
-                # 파일 삭제 실패는 로그만 남기고 계속 진행
-                print(f"임시 파일 삭제 실패: {str(e)}")
\ No newline at end of file
+                created.append(await crud.create_salary_statement(
+                    session, user_id=current_user.id, statement_in=statement_in
+                ))
+            except crud.DuplicateRecordError as e:
+                to_create.remove((filename, statement_in))
+                results.append(PayslipBulkItemResult(
+                    filename=filename,
+                    status="duplicate",
+                    pay_month=statement_in.pay_month,
+                    error=str(e),
+                ))
+    created_by_month = {statement.pay_month: statement for statement in created}
+    for filename, statement_in in to_create:
+        statement = created_by_month.get(statement_in.pay_month)
+        results.append(PayslipBulkItemResult(
+            filename=filename,
+            status="created",
+            pay_month=statement_in.pay_month,
+            salary_statement_id=statement.id if statement else None,
+        ))
+
+    counts = Counter(result.status for result in results)
+    return PayslipBulkUploadResponse(
+        total=len(results),
+        created=counts["created"],
+        duplicates=counts["duplicate"],
+        errors=counts["error"],
+        results=results,
+    )
@@ -1,11 +1,11 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import List
 
-from db.models import User
 from db.database import get_session
 from db import crud
-from schemas.user import UserRead
+from db.pagination import PageParams, page_params, set_next_cursor
+from schemas.user import UserRead, UserPrincipal, UserStatusUpdate
 from core.security import get_current_user, get_current_admin_user
 
 router = APIRouter(prefix="/users", tags=["Users"])
@@ -13,23 +13,66 @@ router = APIRouter(prefix="/users", tags=["Users"])
 @router.get("/me", response_model=UserRead)
 async def read_users_me(
     # 이 Dependency가 토큰을 검증하고 로그인된 유저 정보를 반환
-    current_user: User = Depends(get_current_user)
+    current_user: UserPrincipal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
 ):
     """
     로그인된 내 정보 확인
     """
-    return current_user
+    # principal 캐시에는 최소 정보만 있으므로 전체 정보는 DB에서 조회
+    user = await crud.get_user_by_id(session, user_id=current_user.id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found",
+        )
+    return user
 
 
 # === 관리자 전용 엔드포인트 ===
 
 @router.get("/admin/all", response_model=List[UserRead])
 async def get_all_users_admin(
-    current_admin: User = Depends(get_current_admin_user),
+    response: Response,
+    page: PageParams = Depends(page_params),
+    current_admin: UserPrincipal = Depends(get_current_admin_user),
     session: AsyncSession = Depends(get_session),
 ):
     """
     [관리자 전용] 모든 사용자 목록을 조회합니다.
+    - limit, cursor로 페이지 단위 조회 (다음 페이지 커서는 X-Next-Cursor 헤더)
+    """
+    users = await crud.get_all_users(session, page=page)
+    set_next_cursor(response, page)
+    return users
+
+
+@router.patch("/admin/{user_id}/status", response_model=UserRead)
+async def update_user_status_admin(
+    user_id: int,
+    status_in: UserStatusUpdate,
+    current_admin: UserPrincipal = Depends(get_current_admin_user),
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    [관리자 전용] 사용자의 권한(role) 또는 재직 여부(is_active)를 변경합니다.
+    - role: user 또는 admin
+    - is_active: 퇴사 처리 시 false
     """
-    users = await crud.get_all_users(session)
-    return users
\ No newline at end of file
+    if status_in.role is not None and status_in.role not in ("user", "admin"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="role must be 'user' or 'admin'",
+        )
+    try:
+        user = await crud.update_user_status(
+            session=session,
+            user_id=user_id,
+            role=status_in.role,
+            is_active=status_in.is_active,
+        )
+        return user
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=str(e)
+        )
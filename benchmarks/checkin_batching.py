@@ -0,0 +1,117 @@
+"""
+출근 체크인 저장 방식 비교: 요청마다 commit vs 묶음 쓰기(group commit).
+
+- single:  요청마다 crud.check_in_attendance (INSERT + 집계 갱신 + commit)
+- batched: utils.checkin_batcher.submit (window/max-rows 단위로 multi-row INSERT + commit 1회)
+
+DATABASE_URL의 DB에 직접 연결해(서버 불필요) 재직 중인 사용자 --users 명이 동시에
+체크인하는 상황을 --concurrency 개의 동시 요청으로 재현하고, 방식별 처리량과 지연 시간을 출력합니다.
+방식마다 다른 근무일(--work-date, 다음 날)을 사용하며, --cleanup을 주면 측정 후 생성한
+근태 기록을 지우고 해당 월의 월별 집계를 다시 만듭니다.
+체크인 경로가 MySQL 전용 구문(ON DUPLICATE KEY UPDATE)을 쓰므로 MySQL에서만 실행되며,
+실패한 체크인이 하나라도 있으면 처리량을 출력하지 않고 중단합니다. (실패 속도를 재는 것을 방지)
+
+실행 예:
+    python -m benchmarks.checkin_batching --users 1000 --concurrency 200 --window-ms 5 --cleanup
+"""
+import argparse
+import asyncio
+import time
+from datetime import date, time as dtime, timedelta
+
+from sqlalchemy import delete
+from sqlmodel import select
+
+from benchmarks.common import summarize
+from core.config import settings
+from db import crud
+from db.database import async_session_factory, engine
+from db.models import Attendance, User
+from utils import checkin_batcher
+
+
+async def _single(user_id: int, work_date: date, check_in_time: dtime):
+    async with async_session_factory() as session:
+        return await crud.check_in_attendance(session, user_id, work_date, check_in_time)
+
+
+async def _batched(user_id: int, work_date: date, check_in_time: dtime):
+    return await checkin_batcher.submit(user_id, work_date, check_in_time)
+
+
+async def run_mode(name, check_in, user_ids, work_date, concurrency) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    errors: list[Exception] = []
+
+    async def one(index: int, user_id: int):
+        # 08:55:00 ~ 09:04:59 사이 출근 시각
+        seconds = 8 * 3600 + 55 * 60 + index % 600
+        check_in_time = dtime(seconds // 3600, seconds % 3600 // 60, seconds % 60)
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await check_in(user_id, work_date, check_in_time)
+            except Exception as e:
+                errors.append(e)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*[one(index, user_id) for index, user_id in enumerate(user_ids)])
+    elapsed = time.perf_counter() - started
+
+    if errors:
+        raise SystemExit(
+            f"{name.strip()}: {len(errors)}/{len(user_ids)}건 체크인 실패로 측정을 중단합니다. "
+            f"(첫 오류: {errors[0]!r})"
+        )
+    print(summarize(f"{name} check-in", latencies))
+    print(f"  throughput: {len(user_ids) / elapsed:.1f} rows/s ({elapsed:.2f}s)")
+
+
+async def main(args) -> None:
+    if engine.dialect.name != "mysql":
+        raise SystemExit(f"MySQL 전용 벤치마크입니다. (현재 DB: {engine.dialect.name})")
+    settings.CHECKIN_BATCH_WINDOW_MS = args.window_ms
+    settings.CHECKIN_BATCH_MAX_ROWS = args.max_rows
+    work_dates = {
+        "single": date.fromisoformat(args.work_date),
+        "batched": date.fromisoformat(args.work_date) + timedelta(days=1),
+    }
+
+    async with async_session_factory() as session:
+        statement = select(User.id).where(User.is_active == True).order_by(User.id).limit(args.users)
+        user_ids = list((await session.exec(statement)).all())
+    if not user_ids:
+        raise SystemExit("재직 중인 사용자가 없습니다.")
+    print(f"{len(user_ids)} users, concurrency={args.concurrency}, "
+          f"window={args.window_ms}ms, max_rows={args.max_rows}")
+
+    try:
+        await run_mode("single ", _single, user_ids, work_dates["single"], args.concurrency)
+        await run_mode("batched", _batched, user_ids, work_dates["batched"], args.concurrency)
+        print(f"  batcher: {checkin_batcher.stats()}")
+    finally:
+        if args.cleanup:
+            async with async_session_factory() as session:
+                await session.execute(
+                    delete(Attendance).where(
+                        Attendance.user_id.in_(user_ids),
+                        Attendance.work_date.in_(list(work_dates.values())),
+                    )
+                )
+                await session.commit()
+                for month in sorted({f"{day.year:04d}-{day.month:02d}" for day in work_dates.values()}):
+                    await crud.rebuild_attendance_monthly(session, start_month=month, end_month=month)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=500, help="체크인할 재직 사용자 수")
+    parser.add_argument("--concurrency", type=int, default=100, help="동시 요청 수")
+    parser.add_argument("--window-ms", type=float, default=settings.CHECKIN_BATCH_WINDOW_MS)
+    parser.add_argument("--max-rows", type=int, default=settings.CHECKIN_BATCH_MAX_ROWS)
+    parser.add_argument("--work-date", default="2030-01-02", help="single 방식 근무일 (batched는 다음 날)")
+    parser.add_argument("--cleanup", action="store_true", help="측정 후 생성한 기록 삭제")
+    asyncio.run(main(parser.parse_args()))
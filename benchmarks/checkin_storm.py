@@ -0,0 +1,113 @@
+"""
+출근 시간대(08:55~09:05) 체크인 폭주 부하 테스트.
+
+--users 명의 계정을 준비(없으면 가입)하고 로그인한 뒤, 각 사용자가 08:55~09:05 사이의
+출근 시각으로 /attendance/check-in을 동시에 호출합니다. --duplicate-rate 비율의 사용자는
+같은 체크인을 한 번 더 보내(더블 탭/재시도) unique_user_date 중복 처리 경로도 함께 측정합니다.
+
+결과로 처리량(req/s), 지연 시간 분포, 상태 코드별 건수, 오류율을 출력합니다.
+- 중복 체크인에 대한 400 "Already checked in"은 정상 응답으로 집계합니다.
+- 같은 --work-date로 다시 실행하면 모두 중복이 되므로 실행마다 날짜를 바꾸세요.
+
+실행 예:
+    uvicorn main:app --workers 1 &
+    python -m benchmarks.checkin_storm --users 500 --concurrency 64 --work-date 2030-01-02
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+from benchmarks.common import login, request, summarize
+
+
+def _ensure_user(base_url: str, email: str, password: str) -> None:
+    body = json.dumps({
+        "email": email,
+        "password": password,
+        "name": email.split("@")[0],
+        "hire_date": "2024-01-01",
+    }).encode()
+    code, payload, _ = request(
+        "POST", f"{base_url}/auth/signup", body=body,
+        headers={"Content-Type": "application/json"},
+    )
+    if code not in (200, 400):  # 400: 이미 가입된 계정
+        raise SystemExit(f"signup failed ({code}): {payload[:200]!r}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--users", type=int, default=200, help="체크인할 사용자 수")
+    parser.add_argument("--concurrency", type=int, default=32, help="동시 요청 스레드 수")
+    parser.add_argument("--email-prefix", default="storm")
+    parser.add_argument("--password", default="storm-pw")
+    parser.add_argument("--work-date", default=date.today().isoformat(), help="체크인 근무일 (YYYY-MM-DD)")
+    parser.add_argument("--duplicate-rate", type=float, default=0.05, help="중복 체크인을 한 번 더 보내는 사용자 비율")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    emails = [f"{args.email_prefix}{i}@bench.local" for i in range(args.users)]
+
+    # 1) 계정 준비 + 로그인 (측정 대상 아님)
+    print(f"preparing {args.users} users...")
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        list(pool.map(lambda email: _ensure_user(args.base_url, email, args.password), emails))
+        tokens = list(pool.map(lambda email: login(args.base_url, email, args.password), emails))
+
+    # 2) 08:55:00 ~ 09:05:00 사이의 출근 시각 배정 + 중복 요청 추가
+    jobs = []
+    for token in tokens:
+        total = 8 * 3600 + 55 * 60 + rng.randint(0, 600)
+        check_in = f"{total // 3600:02d}:{total % 3600 // 60:02d}:{total % 60:02d}"
+        jobs.append((token, check_in))
+        if rng.random() < args.duplicate_rate:
+            jobs.append((token, check_in))
+    rng.shuffle(jobs)
+
+    latencies: list[float] = []
+    statuses: Counter = Counter()
+    unexpected = [0]
+    lock = threading.Lock()
+
+    def check_in(job):
+        token, check_in_time = job
+        body = json.dumps({"work_date": args.work_date, "check_in": check_in_time}).encode()
+        try:
+            code, payload, elapsed = request(
+                "POST", f"{args.base_url}/attendance/check-in", body=body,
+                headers={"Content-Type": "application/json", "Authorization": f"Bearer {token}"},
+            )
+        except OSError:
+            with lock:
+                statuses["connection_error"] += 1
+                unexpected[0] += 1
+            return
+        duplicate = code == 400 and b"Already checked in" in payload
+        with lock:
+            latencies.append(elapsed)
+            statuses[code] += 1
+            if code != 200 and not duplicate:
+                unexpected[0] += 1
+
+    # 3) 폭주 구간 측정
+    print(f"firing {len(jobs)} check-ins with {args.concurrency} threads...")
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        list(pool.map(check_in, jobs))
+    elapsed = time.perf_counter() - started
+
+    print(summarize("/attendance/check-in", latencies))
+    print(f"throughput: {len(jobs) / elapsed:.1f} req/s ({len(jobs)} requests in {elapsed:.2f}s)")
+    print(f"status codes: {dict(sorted(statuses.items(), key=lambda item: str(item[0])))}")
+    print(f"error rate (excluding duplicate check-ins): {unexpected[0] / len(jobs) * 100:.2f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+벤치마크 스크립트 공용 헬퍼 (표준 라이브러리만 사용).
+"""
+import json
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from typing import Optional
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """정렬된 표본에서 nearest-rank 방식으로 백분위수를 구합니다."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+def summarize(name: str, samples_ms: list[float]) -> str:
+    if not samples_ms:
+        return f"{name}: no samples"
+    return (
+        f"{name}: n={len(samples_ms)} "
+        f"p50={percentile(samples_ms, 50):.1f}ms "
+        f"p95={percentile(samples_ms, 95):.1f}ms "
+        f"p99={percentile(samples_ms, 99):.1f}ms "
+        f"max={max(samples_ms):.1f}ms"
+    )
+
+
+def request(
+    method: str,
+    url: str,
+    body: Optional[bytes] = None,
+    headers: Optional[dict] = None,
+    timeout: float = 30.0,
+) -> tuple[int, bytes, float]:
+    """HTTP 요청을 보내고 (status, body, elapsed_ms)를 반환합니다."""
+    req = urllib.request.Request(url, data=body, method=method, headers=headers or {})
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            payload = resp.read()
+            code = resp.status
+    except urllib.error.HTTPError as e:
+        payload = e.read()
+        code = e.code
+    return code, payload, (time.perf_counter() - started) * 1000
+
+
+def login(base_url: str, email: str, password: str) -> str:
+    """/auth/token으로 로그인하여 access token을 반환합니다."""
+    form = urllib.parse.urlencode({"username": email, "password": password}).encode()
+    code, payload, _ = request(
+        "POST",
+        f"{base_url}/auth/token",
+        body=form,
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    if code != 200:
+        raise SystemExit(f"login failed ({code}): {payload[:200]!r}")
+    return json.loads(payload)["access_token"]
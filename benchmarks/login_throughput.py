@@ -0,0 +1,76 @@
+"""
+로그인 폭주 중 /attendance/today 응답 지연 측정.
+
+N개의 스레드가 /auth/token을 반복 호출하는 동안, 별도 프로브가
+/attendance/today를 순차 호출하며 지연 시간을 기록합니다.
+bcrypt가 이벤트 루프를 막으면 프로브의 p99가 로그인 1회 시간 수준으로 튀어 오릅니다.
+
+실행 예:
+    uvicorn main:app --workers 1 &
+    python -m benchmarks.login_throughput --email a@b.com --password pw --logins 16
+"""
+import argparse
+import threading
+import time
+
+from benchmarks.common import login, request, summarize
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--email", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--logins", type=int, default=16, help="동시 로그인 스레드 수")
+    parser.add_argument("--duration", type=float, default=20.0, help="측정 시간(초)")
+    args = parser.parse_args()
+
+    token = login(args.base_url, args.email, args.password)
+    probe_headers = {"Authorization": f"Bearer {token}"}
+    stop = threading.Event()
+    login_ms: list[float] = []
+    login_errors = [0]
+    lock = threading.Lock()
+
+    def login_worker():
+        while not stop.is_set():
+            started = time.perf_counter()
+            try:
+                login(args.base_url, args.email, args.password)
+            except SystemExit:
+                with lock:
+                    login_errors[0] += 1
+                continue
+            with lock:
+                login_ms.append((time.perf_counter() - started) * 1000)
+
+    # 1) 기준선: 로그인 부하 없이 프로브만 실행
+    baseline_ms = []
+    deadline = time.perf_counter() + min(5.0, args.duration / 4)
+    while time.perf_counter() < deadline:
+        _, _, elapsed = request("GET", f"{args.base_url}/attendance/today", headers=probe_headers)
+        baseline_ms.append(elapsed)
+
+    # 2) 로그인 폭주 중 프로브 실행
+    workers = [threading.Thread(target=login_worker, daemon=True) for _ in range(args.logins)]
+    for w in workers:
+        w.start()
+
+    loaded_ms = []
+    started = time.perf_counter()
+    while time.perf_counter() - started < args.duration:
+        _, _, elapsed = request("GET", f"{args.base_url}/attendance/today", headers=probe_headers)
+        loaded_ms.append(elapsed)
+    stop.set()
+    for w in workers:
+        w.join(timeout=30)
+
+    print(summarize("/attendance/today (idle)", baseline_ms))
+    print(summarize(f"/attendance/today (during {args.logins} concurrent logins)", loaded_ms))
+    print(summarize("/auth/token", login_ms))
+    print(f"login throughput: {len(login_ms) / args.duration:.1f} req/s")
+    print(f"login errors (incl. 503 queue timeouts): {login_errors[0]}")
+
+
+if __name__ == "__main__":
+    main()
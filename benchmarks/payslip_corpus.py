@@ -0,0 +1,144 @@
+"""
+합성 급여명세서 PDF 생성기 (외부 라이브러리 없이 PDF를 직접 작성).
+
+한글은 Adobe-Korea1 CID 폰트(HYGoThic-Medium, UniKS-UCS2-H 인코딩)로 기록하므로
+폰트 파일을 포함하지 않아도 pdfplumber에서 텍스트로 추출됩니다.
+"""
+import os
+import random
+from typing import Optional
+
+
+def _pdf_string(text: str) -> str:
+    return f"<{text.encode('utf-16-be').hex()}>"
+
+
+def build_pdf(pages: list[list[tuple[float, float, str]]], padding_bytes: int = 0) -> bytes:
+    """
+    (x, y, 텍스트) 목록으로 이루어진 페이지들로 PDF 바이트를 만듭니다.
+    - padding_bytes: 스캔 이미지처럼 파싱과 무관한 바이너리 스트림을 추가해 파일 크기를 키움
+    """
+    objects: list[Optional[bytes]] = []
+
+    def add(obj: Optional[bytes]) -> int:
+        objects.append(obj)
+        return len(objects)
+
+    font_id = add(
+        b"<< /Type /Font /Subtype /Type0 /BaseFont /HYGoThic-Medium "
+        b"/Encoding /UniKS-UCS2-H /DescendantFonts [ << /Type /Font "
+        b"/Subtype /CIDFontType0 /BaseFont /HYGoThic-Medium "
+        b"/CIDSystemInfo << /Registry (Adobe) /Ordering (Korea1) /Supplement 1 >> "
+        b"/FontDescriptor << /Type /FontDescriptor /FontName /HYGoThic-Medium "
+        b"/Flags 6 /FontBBox [0 -148 1001 880] /ItalicAngle 0 /Ascent 880 "
+        b"/Descent -120 /CapHeight 880 /StemV 93 >> >> ] >>"
+    )
+    pages_id = add(None)
+    page_ids = []
+    for items in pages:
+        ops = ["BT /F1 10 Tf"]
+        ops += [f"1 0 0 1 {x} {y} Tm {_pdf_string(text)} Tj" for x, y, text in items]
+        ops.append("ET")
+        stream = "\n".join(ops).encode()
+        content_id = add(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        page_ids.append(add(
+            f"<< /Type /Page /Parent {pages_id} 0 R /MediaBox [0 0 595 842] "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {content_id} 0 R >>".encode()
+        ))
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects[pages_id - 1] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode()
+    catalog_id = add(f"<< /Type /Catalog /Pages {pages_id} 0 R >>".encode())
+    if padding_bytes:
+        padding = os.urandom(padding_bytes)
+        add(b"<< /Length %d >>\nstream\n" % len(padding) + padding + b"\nendstream")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, obj in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + obj + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, catalog_id, xref
+    )
+    return bytes(out)
+
+
+def _filler_page(page_no: int, rows: int = 50) -> list[tuple[float, float, str]]:
+    """근태/수당 내역처럼 보이는 채움 페이지 (추출 대상 필드 없음)"""
+    return [
+        (50, 800 - i * 14, f"{page_no}-{i:02d} 근무 내역 시간외 {i * 1.5:.1f}시간 수당 {(i + 1) * 12345:,}")
+        for i in range(rows)
+    ]
+
+
+def make_payslip_pdf(
+    pay_month: str,
+    base_pay: int,
+    deductions: int,
+    net_pay: int,
+    filler_pages: int = 0,
+    summary_page_first: bool = True,
+    padding_bytes: int = 0,
+) -> bytes:
+    """
+    급여명세서 PDF를 만듭니다.
+    - filler_pages: 요약 페이지 외에 추가할 채움 페이지 수 (대용량 PDF 재현)
+    - summary_page_first: False면 요약 페이지를 맨 마지막에 둡니다.
+    - padding_bytes: 파싱과 무관한 바이너리 데이터 크기 (스캔 이미지 등)
+    """
+    year, month = pay_month.split("-")
+    summary = [
+        (220, 800, f"{year}년 {int(month)}월 급여명세서"),
+        (50, 770, "성 명 홍길동        사 번 20250001"),
+        (50, 740, "기 본 급"), (300, 740, f"{base_pay - 200000:,}"),
+        (50, 726, "식 대"), (300, 726, "200,000"),
+        (50, 700, "지 급 액 계"), (300, 700, f"{base_pay:,}"),
+        (50, 670, "국 민 연 금"), (300, 670, f"{deductions // 2:,}"),
+        (50, 656, "소 득 세"), (300, 656, f"{deductions - deductions // 2:,}"),
+        (50, 630, "공 제 액 계"), (300, 630, f"{deductions:,}"),
+        (50, 600, "차 인 지 급 액"), (300, 600, f"{net_pay:,}"),
+    ]
+    fillers = [_filler_page(i + 1) for i in range(filler_pages)]
+    pages = [summary] + fillers if summary_page_first else fillers + [summary]
+    return build_pdf(pages, padding_bytes=padding_bytes)
+
+
+def _spaced(label: str, spaced: bool) -> str:
+    return " ".join(label) if spaced else label
+
+
+def generate_corpus(count: int = 100, seed: int = 42) -> list[tuple[bytes, dict]]:
+    """
+    다양한 형태의 급여명세서 PDF와 정답 데이터를 생성합니다.
+    - 항목명 띄어쓰기 유무, 요약 페이지 위치(처음/마지막), 채움 페이지 수, 한 자리 월 등
+    """
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(count):
+        pay_month = f"{rng.randint(2020, 2026)}-{rng.randint(1, 12):02d}"
+        base_pay = rng.randrange(2_000_000, 9_000_000, 10)
+        deductions = rng.randrange(100_000, base_pay // 3, 10)
+        net_pay = base_pay - deductions
+        spaced = rng.random() < 0.5
+        year, month = pay_month.split("-")
+        summary = [
+            (220, 800, f"{year}년 {int(month)}월 급여명세서"),
+            (50, 770, "성 명 홍길동        사 번 20250001"),
+            (50, 700, _spaced("지급액계", spaced)), (300, 700, f"{base_pay:,}"),
+            (50, 630, _spaced("공제액계", spaced)), (300, 630, f"{deductions:,}"),
+            (50, 600, _spaced("차인지급액", spaced)), (300, 600, f"{net_pay:,}"),
+        ]
+        fillers = [_filler_page(i + 1, rows=rng.randint(20, 50)) for i in range(rng.randint(0, 4))]
+        pages = [summary] + fillers if rng.random() < 0.7 else fillers + [summary]
+        expected = {
+            "pay_month": pay_month,
+            "base_pay": base_pay,
+            "deductions": deductions,
+            "net_pay": net_pay,
+        }
+        corpus.append((build_pdf(pages), expected))
+    return corpus
@@ -0,0 +1,86 @@
+"""
+급여명세서 추출기 비교: 이전 구현(페이지 순차 + 필드별 re.search) vs 현재 구현.
+
+합성 급여명세서 묶음(benchmarks.payslip_corpus)을 각 방식으로 추출하여
+처리 시간과 정확도(4개 항목 모두 정답과 일치한 비율)를 출력합니다.
+
+실행 예:
+    python -m benchmarks.payslip_extractor --count 100
+"""
+import argparse
+import io
+import re
+import time
+
+import pdfplumber
+
+from benchmarks.common import percentile
+from benchmarks.payslip_corpus import generate_corpus
+from utils.pdf_extractor import PayslipData, extract_payslip_data
+
+
+def legacy_extract(pdf_file) -> PayslipData:
+    """변경 전 extract_payslip_data 구현 (비교 기준)"""
+    data = PayslipData()
+    with pdfplumber.open(pdf_file) as pdf:
+        for page in pdf.pages:
+            text = page.extract_text()
+            if not text:
+                continue
+            if not data.pay_month:
+                year_month_match = re.search(r'(\d{4})년\s*(\d{1,2})월', text)
+                if year_month_match:
+                    data.pay_month = f"{year_month_match.group(1)}-{year_month_match.group(2).zfill(2)}"
+            if not data.base_pay and "지" in text and "급" in text and "액" in text and "계" in text:
+                match = re.search(r'지\s*급\s*액\s*계\s+([0-9,]+)', text)
+                if match:
+                    data.base_pay = int(match.group(1).replace(',', ''))
+            if not data.deductions and "공" in text and "제" in text and "액" in text and "계" in text:
+                match = re.search(r'공\s*제\s*액\s*계\s+([0-9,]+)', text)
+                if match:
+                    data.deductions = int(match.group(1).replace(',', ''))
+            if not data.net_pay and "차" in text and "인" in text and "지" in text and "급" in text and "액" in text:
+                match = re.search(r'차\s*인\s*지\s*급\s*액\s+([0-9,]+)', text)
+                if match:
+                    data.net_pay = int(match.group(1).replace(',', ''))
+            if all([data.pay_month, data.base_pay, data.deductions, data.net_pay]):
+                break
+    return data
+
+
+def run(name: str, extractor, corpus) -> None:
+    timings = []
+    correct = 0
+    for pdf_bytes, expected in corpus:
+        started = time.perf_counter()
+        try:
+            data = extractor(io.BytesIO(pdf_bytes))
+            result = {key: getattr(data, key) for key in expected}
+        except ValueError:
+            result = None
+        timings.append((time.perf_counter() - started) * 1000)
+        if result == expected:
+            correct += 1
+    print(
+        f"{name:>8}: total={sum(timings) / 1000:.2f}s "
+        f"p50={percentile(timings, 50):.1f}ms p99={percentile(timings, 99):.1f}ms "
+        f"accuracy={correct}/{len(corpus)}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100, help="합성 급여명세서 수")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    corpus = generate_corpus(args.count, args.seed)
+    # CMap 로딩 등 최초 1회 비용 제외
+    extract_payslip_data(io.BytesIO(corpus[0][0]))
+    run("legacy", legacy_extract, corpus)
+    run("text", lambda f: extract_payslip_data(f, mode="text"), corpus)
+    run("simple", lambda f: extract_payslip_data(f, mode="simple"), corpus)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+/salary/upload-pdf 처리 방식 비교: 임시 파일 경유 vs 업로드 버퍼 직접 전달.
+
+- tempfile: 업로드 전체를 bytes로 읽음 -> NamedTemporaryFile에 기록 -> 경로로 다시 열기 (이전 방식)
+- spooled:  Starlette가 만든 SpooledTemporaryFile을 그대로 pdfplumber에 전달 (현재 방식)
+
+각 방식의 추가 메모리(tracemalloc peak)와 처리 시간을 출력합니다.
+
+실행 예:
+    python -m benchmarks.pdf_upload_memory --size-mb 8 --repeat 5
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.common import percentile
+from benchmarks.payslip_corpus import make_payslip_pdf
+from utils.pdf_extractor import extract_payslip_data
+
+# Starlette UploadFile의 스풀 임계값과 동일
+SPOOL_MAX_SIZE = 1024 * 1024
+
+
+def _as_upload(pdf_bytes: bytes):
+    """요청 본문 파싱이 끝난 직후의 UploadFile.file 상태를 재현"""
+    spooled = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    spooled.write(pdf_bytes)
+    spooled.seek(0)
+    return spooled
+
+
+def via_tempfile(upload) -> None:
+    content = upload.read()
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
+        temp_file.write(content)
+        temp_file_path = temp_file.name
+    try:
+        extract_payslip_data(temp_file_path)
+    finally:
+        os.unlink(temp_file_path)
+
+
+def via_spooled(upload) -> None:
+    upload.seek(0)
+    extract_payslip_data(upload)
+
+
+def measure(func, pdf_bytes: bytes, repeat: int) -> tuple[list[float], int]:
+    # 시간 측정 (tracemalloc은 매우 느리므로 끈 상태로 측정)
+    timings = []
+    for _ in range(repeat):
+        upload = _as_upload(pdf_bytes)
+        started = time.perf_counter()
+        func(upload)
+        timings.append((time.perf_counter() - started) * 1000)
+        upload.close()
+
+    # 메모리 측정 (1회)
+    upload = _as_upload(pdf_bytes)
+    tracemalloc.start()
+    func(upload)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    upload.close()
+    return timings, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=5, help="채움 페이지 수")
+    parser.add_argument("--size-mb", type=float, default=8.0, help="이미지 등 비텍스트 데이터 크기(MB)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # 요약 페이지를 맨 뒤에 두어 모든 페이지를 읽도록 함
+    pdf_bytes = make_payslip_pdf(
+        "2025-10", 3500000, 400000, 3100000,
+        filler_pages=args.pages, summary_page_first=False,
+        padding_bytes=int(args.size_mb * 1024 * 1024),
+    )
+    print(f"PDF size: {len(pdf_bytes) / 1024 / 1024:.2f} MB, pages: {args.pages + 1}")
+
+    for name, func in (("tempfile", via_tempfile), ("spooled", via_spooled)):
+        timings, peak = measure(func, pdf_bytes, args.repeat)
+        print(
+            f"{name:>8}: p50={percentile(timings, 50):.1f}ms "
+            f"max={max(timings):.1f}ms peak_alloc={peak / 1024 / 1024:.2f}MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
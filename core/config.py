@@ -9,5 +9,60 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # DB 커넥션 풀 설정
+    DB_ECHO: bool = False  # SQL 로그 출력 여부 (운영에서는 끌 것)
+    DB_POOL_SIZE: int = 10  # 상시 유지하는 커넥션 수
+    DB_MAX_OVERFLOW: int = 20  # pool_size 초과 시 추가로 열 수 있는 커넥션 수
+    DB_POOL_RECYCLE: int = 1800  # 커넥션 재사용 최대 시간(초), MySQL wait_timeout보다 짧게
+    DB_POOL_PRE_PING: bool = True  # 체크아웃 시 커넥션 유효성 확인
+    DB_POOL_TIMEOUT: float = 10.0  # 커넥션 획득 대기 최대 시간(초)
+
+    # 모니터링 설정
+    METRICS_ENABLED: bool = True  # 라우트별 처리 시간/요청당 SQL 수 수집 및 /metrics 노출
+
+    # 팀 연차 캘린더 최대 조회 기간(일)
+    LEAVE_CALENDAR_MAX_DAYS: int = 93
+
+    # 목록 API 페이지 크기
+    PAGE_SIZE_DEFAULT: int = 100
+    PAGE_SIZE_MAX: int = 1000
+    EXPORT_CHUNK_SIZE: int = 1000  # 스트리밍 내보내기 시 서버 사이드 커서에서 한 번에 읽는 행 수
+
+    # 출근 체크인 묶음 쓰기(group commit) 설정
+    CHECKIN_BATCH_ENABLED: bool = False  # True면 짧은 시간 동안 모인 체크인을 INSERT 1회로 저장
+    CHECKIN_BATCH_WINDOW_MS: float = 5.0  # 첫 체크인 후 묶음을 모으는 최대 대기 시간(ms)
+    CHECKIN_BATCH_MAX_ROWS: int = 200  # 이 개수가 모이면 대기 시간과 관계없이 바로 저장
+
+    # 출입 단말기 연동 설정
+    DEVICE_API_KEYS: str = ""  # 단말기 인증 키 목록 (쉼표 구분, 비어 있으면 단말기 API 비활성화)
+    PUNCH_BATCH_SIZE: int = 500  # 출입 기록 스트림을 이 개수 단위로 묶어서 반영
+    PUNCH_MAX_LINE_BYTES: int = 4096  # NDJSON 한 줄(이벤트 1건)의 최대 크기
+
+    # 스케줄러 작업 설정
+    SCHEDULER_ENABLED: bool = True  # API 서버(uvicorn 워커) 안에서 스케줄러 실행 여부, python -m scheduler 사용 시 false
+    SCHEDULER_LOCK_NAME: str = "erp_scheduler_leader"  # 리더 잠금 이름 (MySQL GET_LOCK)
+    SCHEDULER_LOCK_CHECK_SECONDS: float = 15.0  # 리더 잠금 획득 시도/보유 확인 주기(초)
+    JOB_CHUNK_SIZE: int = 1000  # 일괄 작업 시 user.id 구간 크기 (구간마다 commit)
+
+    # 인증 사용자(principal) 캐시 설정
+    PRINCIPAL_CACHE_SIZE: int = 10000  # 캐시할 최대 사용자 수 (0이면 비활성화)
+    PRINCIPAL_CACHE_TTL_SECONDS: float = 60.0  # 캐시 유지 시간(초), 다중 워커 간 불일치 허용 한도
+
+    # 비밀번호 해싱(bcrypt) 실행 설정
+    PASSWORD_HASH_WORKERS: int = 4  # bcrypt를 실행할 스레드 수 (동시 실행 상한)
+    PASSWORD_HASH_QUEUE_TIMEOUT: float = 5.0  # 실행 슬롯 대기 최대 시간(초), 초과 시 503
+
+    # 급여명세서 PDF 비동기 추출 작업 설정
+    PAYSLIP_WORKERS: int = 2  # PDF 추출 프로세스 수
+    PAYSLIP_QUEUE_SIZE: int = 50  # 대기+처리 중 작업 최대 개수, 초과 시 503
+    PAYSLIP_JOB_RETENTION_SECONDS: float = 3600.0  # 완료된 작업 상태 보관 시간(초)
+    PAYSLIP_BULK_MAX_FILES: int = 500  # 일괄 업로드 1회당 최대 PDF 개수 (ZIP 내부 포함)
+    PAYSLIP_MAX_UPLOAD_BYTES: int = 10 * 1024 * 1024  # PDF 1개당 최대 크기
+    PAYSLIP_BULK_MAX_UPLOAD_BYTES: int = 200 * 1024 * 1024  # 일괄 업로드 요청 본문 최대 크기
+    PAYSLIP_ZIP_MAX_UPLOAD_BYTES: int = 100 * 1024 * 1024  # 일괄 업로드의 ZIP 1개당 최대 크기
+    PAYSLIP_BULK_MAX_UNCOMPRESSED_BYTES: int = 500 * 1024 * 1024  # 일괄 업로드 1회의 PDF 합계 크기 (ZIP 압축 해제 후)
+    PAYSLIP_EXTRACT_MODE: str = "text"  # "text"(레이아웃 기반) 또는 "simple"(단순 줄 단위, 더 빠름)
+    PAYSLIP_CACHE_SIZE: int = 1024  # 추출 결과 캐시 항목 수 (PDF SHA-256 기준, 0이면 비활성화)
+
 # 전역 변수로 설정 객체 생성
-settings = Settings()
\ No newline at end of file
+settings = Settings()
@@ -1,16 +1,21 @@
+import asyncio
+import hmac
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Optional
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel import select
 
+from core.cache import TTLCache
 from core.config import settings
 from db.database import get_session
 from db.models import User
 from schemas.token import TokenData
+from schemas.user import UserPrincipal
 
 # 1. 비밀번호 해싱 설정
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -26,6 +31,46 @@ def verify_password(plain_password, hashed_password):
 def get_password_hash(password):
     return pwd_context.hash(password)
 
+# 4-1. bcrypt 전용 스레드 풀
+# bcrypt는 CPU를 오래 점유하므로 이벤트 루프에서 직접 호출하면 다른 요청이 모두 멈춤.
+# (bcrypt는 해싱 중 GIL을 해제하므로 스레드 풀로 충분)
+_password_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="bcrypt",
+)
+_password_slots: Optional[asyncio.Semaphore] = None
+
+async def _run_password_task(func, *args):
+    """
+    실행 슬롯을 확보한 뒤 스레드 풀에서 bcrypt 작업을 실행합니다.
+    슬롯 대기가 PASSWORD_HASH_QUEUE_TIMEOUT을 넘으면 503을 반환합니다.
+    """
+    global _password_slots
+    if _password_slots is None:
+        _password_slots = asyncio.Semaphore(settings.PASSWORD_HASH_WORKERS)
+
+    try:
+        await asyncio.wait_for(
+            _password_slots.acquire(), timeout=settings.PASSWORD_HASH_QUEUE_TIMEOUT
+        )
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many concurrent authentication requests. Please retry.",
+            headers={"Retry-After": "1"},
+        )
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_password_executor, func, *args)
+    finally:
+        _password_slots.release()
+
+async def verify_password_async(plain_password, hashed_password) -> bool:
+    return await _run_password_task(verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password) -> str:
+    return await _run_password_task(get_password_hash, password)
+
 # 5. Access Token 생성
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
@@ -37,11 +82,25 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
-# 6. (핵심) 현재 로그인한 사용자를 확인하는 Dependency
+# 6. 인증 사용자(principal) 캐시
+# 토큰 subject(email) -> UserPrincipal
+# 거의 모든 요청에서 발생하던 user 테이블 조회를 줄이기 위함
+principal_cache = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_SIZE,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+def invalidate_principal(email: str) -> None:
+    """
+    사용자의 role 또는 is_active가 변경되었을 때 캐시를 무효화합니다.
+    """
+    principal_cache.pop(email)
+
+# 7. (핵심) 현재 로그인한 사용자를 확인하는 Dependency
 async def get_current_user(
     session: AsyncSession = Depends(get_session), 
     token: str = Depends(oauth2_scheme)
-) -> User:
+) -> UserPrincipal:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -56,21 +115,29 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
     
-    # DB에서 실제 사용자 확인
-    statement = select(User).where(User.email == token_data.email)
-    result = await session.exec(statement)
-    user = result.first()
-    
+    # 캐시 확인 후, 없으면 DB에서 실제 사용자 확인 (필요한 컬럼만 조회)
+    user = principal_cache.get(token_data.email)
     if user is None:
-        raise credentials_exception
+        statement = select(User.id, User.email, User.role, User.is_active).where(
+            User.email == token_data.email
+        )
+        result = await session.exec(statement)
+        row = result.first()
+        if row is None:
+            raise credentials_exception
+        user = UserPrincipal(
+            id=row.id, email=row.email, role=row.role, is_active=row.is_active
+        )
+        principal_cache.set(token_data.email, user)
+
     if not user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     return user
 
-# 7. 관리자 권한 확인 Dependency
+# 8. 관리자 권한 확인 Dependency
 async def get_current_admin_user(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    current_user: UserPrincipal = Depends(get_current_user)
+) -> UserPrincipal:
     """
     현재 사용자가 관리자인지 확인합니다.
     관리자가 아니면 403 Forbidden 에러를 발생시킵니다.
@@ -80,4 +147,24 @@ async def get_current_admin_user(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin privileges required"
         )
-    return current_user
\ No newline at end of file
+    return current_user
+
+# 9. 출입 단말기 인증 Dependency
+def _device_keys() -> list[str]:
+    return [key.strip() for key in settings.DEVICE_API_KEYS.split(",") if key.strip()]
+
+async def get_current_device(
+    x_device_key: Optional[str] = Header(None, description="단말기 인증 키"),
+) -> str:
+    """
+    X-Device-Key 헤더가 DEVICE_API_KEYS 중 하나와 일치하는지 확인합니다.
+    단말기는 사용자 JWT 없이 여러 사용자의 출입 기록을 전송합니다.
+    """
+    if x_device_key:
+        for key in _device_keys():
+            if hmac.compare_digest(x_device_key.encode(), key.encode()):
+                return key
+    raise HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid device key",
+    )
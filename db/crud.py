@@ -1,16 +1,55 @@
-from typing import Optional
-from datetime import date, time, datetime
+from typing import AsyncIterator, Optional
+from datetime import date, time, datetime, timedelta
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel import select, func
+from sqlalchemy import case, delete, extract, insert, or_, tuple_, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.exc import DBAPIError, IntegrityError
 from sqlalchemy.orm import selectinload
 from db.models import (
-    User, LeaveBalance, LeaveRequest, SalaryStatement, Attendance
+    User, LeaveBalance, LeaveRequest, SalaryStatement, Attendance, AttendanceMonthly
 )
 from schemas.user import UserCreate
 from schemas.leave import LeaveRequestCreate
 from schemas.salary import SalaryStatementCreate
 from schemas.attendance import AttendanceCreate, CheckInRequest, CheckOutRequest
-from core.security import get_password_hash
+from core.security import get_password_hash_async, invalidate_principal
+from db import pagination
+from db.pagination import PageParams
+
+# 목록 조회 정렬 기준 [(컬럼, 내림차순 여부)] — 커서 페이지네이션 키로도 사용 (조합이 유일해야 함)
+USER_ORDER = [(User.id, False)]
+LEAVE_REQUEST_ORDER = [(LeaveRequest.start_date, True), (LeaveRequest.id, True)]
+SALARY_STATEMENT_ORDER = [(SalaryStatement.pay_month, True), (SalaryStatement.id, True)]
+ATTENDANCE_ADMIN_ORDER = [(Attendance.work_date, True), (Attendance.user_id, False)]
+
+
+class DuplicateRecordError(ValueError):
+    """유니크 제약 조건 위반 (이미 존재하는 레코드)"""
+
+
+class LeaveBalanceNotFoundError(ValueError):
+    """사용자의 연차 현황(LeaveBalance)이 없음"""
+
+
+class InsufficientLeaveBalanceError(ValueError):
+    """신청 일수가 남은 연차(부여 - 사용 - 대기)보다 많음"""
+
+
+class OverlappingLeaveRequestError(ValueError):
+    """같은 사용자의 승인/대기 중인 신청과 기간이 겹침"""
+
+
+def _is_duplicate_key(error: IntegrityError) -> bool:
+    # MySQL ER_DUP_ENTRY(1062)
+    args = getattr(error.orig, "args", ())
+    return bool(args) and args[0] == 1062
+
+
+def _is_deadlock(error: DBAPIError) -> bool:
+    # MySQL ER_LOCK_DEADLOCK(1213) — 서버가 트랜잭션 전체를 롤백함
+    args = getattr(error.orig, "args", ())
+    return bool(args) and args[0] == 1213
 
 # 1. 이메일로 유저 찾기
 async def get_user_by_email(session: AsyncSession, email: str) -> Optional[User]:
@@ -21,7 +60,7 @@ async def get_user_by_email(session: AsyncSession, email: str) -> Optional[User]
 # 2. 유저 생성 (회원가입)
 async def create_user(session: AsyncSession, user_create: UserCreate) -> User:
     # 비밀번호 해시
-    hashed_password = get_password_hash(user_create.password)
+    hashed_password = await get_password_hash_async(user_create.password)
     
     # DB에 저장할 User 객체 생성
     db_user = User(
@@ -53,67 +92,231 @@ async def get_leave_balance_by_user(
 
 # 4. 연차 신청 내역 조회
 async def get_leave_requests_by_user(
-    session: AsyncSession, user_id: int
+    session: AsyncSession, user_id: int, page: Optional[PageParams] = None
 ) -> list[LeaveRequest]:
-    statement = (
-        select(LeaveRequest)
-        .where(LeaveRequest.user_id == user_id)
-        .order_by(LeaveRequest.start_date.desc()) # 최근 신청 순
-    )
+    statement = select(LeaveRequest).where(LeaveRequest.user_id == user_id)
+    statement = pagination.apply(statement, LEAVE_REQUEST_ORDER, page) # 최근 신청 순
     result = await session.exec(statement)
-    return result.all()
+    return pagination.finish(result.all(), LEAVE_REQUEST_ORDER, page)
 
 # 5. 연차 신청 생성
 async def create_leave_request(
     session: AsyncSession, user_id: int, request_in: LeaveRequestCreate
 ) -> LeaveRequest:
-    # 1. 스키마를 DB 모델 객체로 변환
-    # (참고: status는 'pending'이 기본값임)
+    """
+    연차를 신청하고 신청 일수만큼 LeaveBalance.total_reserved를 예약합니다. (한 트랜잭션)
+    - 잔여 일수 확인과 예약을 조건부 UPDATE 1회로 처리하므로 동시에 신청해도 초과 사용되지 않음
+    - 승인 시 예약분이 total_used로 옮겨지고, 거부 시 예약이 해제됨
+
+    Raises:
+        LeaveBalanceNotFoundError: 연차 현황이 없을 경우
+        InsufficientLeaveBalanceError: 남은 연차가 부족할 경우
+        OverlappingLeaveRequestError: 승인/대기 중인 본인 신청과 기간이 겹칠 경우
+    """
+    # 1. 남은 연차(부여 - 사용 - 대기)가 충분할 때만 예약
+    reserve = await session.execute(
+        update(LeaveBalance)
+        .where(
+            LeaveBalance.user_id == user_id,
+            LeaveBalance.total_granted - LeaveBalance.total_used - LeaveBalance.total_reserved
+            >= request_in.days_used,
+        )
+        .values(total_reserved=LeaveBalance.total_reserved + request_in.days_used)
+        .execution_options(synchronize_session=False)
+    )
+    if reserve.rowcount == 0:
+        await session.rollback()
+        balance = await get_leave_balance_by_user(session, user_id)
+        if not balance:
+            raise LeaveBalanceNotFoundError("Leave balance data not found")
+        remaining_days = balance.total_granted - balance.total_used - balance.total_reserved
+        raise InsufficientLeaveBalanceError(
+            f"Insufficient leave balance. You have {remaining_days} days remaining, but requested {request_in.days_used} days."
+        )
+
+    # 2. 기간이 겹치는 본인 신청 확인
+    # (1의 UPDATE가 같은 사용자의 LeaveBalance 행을 잠그므로 동시 신청도 순서대로 확인됨)
+    overlap = select(LeaveRequest.id).where(
+        LeaveRequest.user_id == user_id,
+        LeaveRequest.status.in_(ACTIVE_LEAVE_STATUSES),
+        LeaveRequest.start_date <= request_in.end_date,
+        LeaveRequest.end_date >= request_in.start_date,
+    ).limit(1)
+    if (await session.exec(overlap)).first() is not None:
+        await session.rollback()
+        raise OverlappingLeaveRequestError(
+            "Leave request overlaps with an existing pending or approved request"
+        )
+
+    # 3. 스키마를 DB 모델 객체로 변환 후 추가
+    # (참고: status는 'pending'이 기본값임, id 외에는 모두 채워져 있으므로 refresh 불필요)
     db_request = LeaveRequest.model_validate(
         request_in, update={"user_id": user_id}
     )
-    
-    # 2. DB에 추가
     session.add(db_request)
     await session.commit()
-    await session.refresh(db_request)
+    return db_request
 
-    # (중요)
-    # 실제 운영에서는 관리자가 "승인"을 눌렀을 때
-    # LeaveBalance.total_used를 업데이트해야 하지만,
-    # 지금은 신청 기능만 먼저 구현합니다.
+# 5-1. 기간이 겹치는 연차 신청 조회 (팀 캘린더)
+# 캘린더 표시와 신청 기간 겹침 확인에 포함하는 상태
+ACTIVE_LEAVE_STATUSES = ("approved", "pending")
 
-    return db_request
+async def get_leave_calendar(
+    session: AsyncSession, start_date: date, end_date: date
+) -> dict:
+    """
+    기간과 겹치는 승인/대기 중인 연차를 날짜별로 묶어 반환합니다.
+    (status, start_date, end_date) 인덱스 범위만 읽습니다.
+
+    Returns:
+        {날짜: [(LeaveRequest 컬럼 + user_name, user_email) Row, ...]} — 기간 내 모든 날짜 포함
+    """
+    statement = (
+        select(
+            LeaveRequest.id,
+            LeaveRequest.user_id,
+            User.name.label("user_name"),
+            User.email.label("user_email"),
+            LeaveRequest.start_date,
+            LeaveRequest.end_date,
+            LeaveRequest.days_used,
+            LeaveRequest.status,
+        )
+        .join(User, User.id == LeaveRequest.user_id)
+        .where(
+            LeaveRequest.status.in_(ACTIVE_LEAVE_STATUSES),
+            LeaveRequest.start_date <= end_date,
+            LeaveRequest.end_date >= start_date,
+        )
+        .order_by(LeaveRequest.start_date, LeaveRequest.id)
+    )
+    rows = (await session.exec(statement)).all()
+
+    calendar = {
+        start_date + timedelta(days=offset): []
+        for offset in range((end_date - start_date).days + 1)
+    }
+    for row in rows:
+        day = max(row.start_date, start_date)
+        last = min(row.end_date, end_date)
+        while day <= last:
+            calendar[day].append(row)
+            day += timedelta(days=1)
+    return calendar
 
 # 6. 급여 명세서 목록 조회
 async def get_salary_statements_by_user(
-    session: AsyncSession, user_id: int
+    session: AsyncSession, user_id: int, page: Optional[PageParams] = None
 ) -> list[SalaryStatement]:
-    statement = (
-        select(SalaryStatement)
-        .where(SalaryStatement.user_id == user_id)
-        .order_by(SalaryStatement.pay_month.desc()) # 최근 지급월 순
-    )
+    statement = select(SalaryStatement).where(SalaryStatement.user_id == user_id)
+    statement = pagination.apply(statement, SALARY_STATEMENT_ORDER, page) # 최근 지급월 순
     result = await session.exec(statement)
-    return result.all()
+    return pagination.finish(result.all(), SALARY_STATEMENT_ORDER, page)
 
 # 7. 급여 명세서 생성 (입력)
 async def create_salary_statement(
-    session: AsyncSession, user_id: int, statement_in: SalaryStatementCreate
+    session: AsyncSession,
+    user_id: int,
+    statement_in: SalaryStatementCreate,
+    replace: bool = False
 ) -> SalaryStatement:
-    
+    """
+    급여 명세서를 저장합니다.
+    - 중복 확인은 (user_id, pay_month) 유니크 인덱스에 맡기고 INSERT 1회로 처리합니다.
+    - replace=True면 같은 지급월의 기존 명세서를 덮어씁니다. (INSERT ... ON DUPLICATE KEY UPDATE)
+
+    Raises:
+        DuplicateRecordError: replace=False이고 같은 지급월의 명세서가 이미 있을 경우
+    """
+    if replace:
+        values = {**statement_in.model_dump(), "user_id": user_id, "created_at": datetime.utcnow()}
+        upsert_stmt = mysql_insert(SalaryStatement).values(**values)
+        upsert_stmt = upsert_stmt.on_duplicate_key_update(
+            base_pay=upsert_stmt.inserted.base_pay,
+            bonus=upsert_stmt.inserted.bonus,
+            deductions=upsert_stmt.inserted.deductions,
+            net_pay=upsert_stmt.inserted.net_pay,
+            created_at=upsert_stmt.inserted.created_at,
+        )
+        await session.execute(upsert_stmt)
+        await session.commit()
+        return await get_salary_statement_by_month(
+            session, user_id=user_id, pay_month=statement_in.pay_month
+        )
+
     # 1. 스키마를 DB 모델 객체로 변환
     db_statement = SalaryStatement.model_validate(
         statement_in, update={"user_id": user_id}
     )
     
-    # 2. DB에 추가
+    # 2. DB에 추가 (id, created_at은 이미 채워지므로 refresh 불필요)
     session.add(db_statement)
-    await session.commit()
-    await session.refresh(db_statement)
+    try:
+        await session.commit()
+    except IntegrityError as e:
+        await session.rollback()
+        if _is_duplicate_key(e):
+            raise DuplicateRecordError(
+                f"{statement_in.pay_month} 급여명세서가 이미 등록되어 있습니다."
+            )
+        raise
 
     return db_statement
 
+# 7-1. 특정 지급월의 급여 명세서 조회
+async def get_salary_statement_by_month(
+    session: AsyncSession, user_id: int, pay_month: str
+) -> Optional[SalaryStatement]:
+    statement = select(SalaryStatement).where(
+        SalaryStatement.user_id == user_id,
+        SalaryStatement.pay_month == pay_month
+    )
+    result = await session.exec(statement)
+    return result.first()
+
+# 7-2. 여러 지급월의 급여 명세서 일괄 조회
+async def get_salary_statements_by_months(
+    session: AsyncSession, user_id: int, pay_months: list[str]
+) -> list[SalaryStatement]:
+    if not pay_months:
+        return []
+    statement = select(SalaryStatement).where(
+        SalaryStatement.user_id == user_id,
+        SalaryStatement.pay_month.in_(pay_months)
+    )
+    result = await session.exec(statement)
+    return result.all()
+
+# 7-3. 급여 명세서 일괄 생성 (multi-row INSERT 1회)
+async def bulk_create_salary_statements(
+    session: AsyncSession, user_id: int, statements_in: list[SalaryStatementCreate]
+) -> list[SalaryStatement]:
+    """
+    여러 급여 명세서를 하나의 INSERT 문으로 저장하고, 생성된 레코드를 반환합니다.
+    """
+    if not statements_in:
+        return []
+
+    now = datetime.utcnow()
+    rows = [
+        {**statement_in.model_dump(), "user_id": user_id, "created_at": now}
+        for statement_in in statements_in
+    ]
+    try:
+        await session.execute(insert(SalaryStatement).values(rows))
+        await session.commit()
+    except IntegrityError as e:
+        await session.rollback()
+        if _is_duplicate_key(e):
+            raise DuplicateRecordError(
+                "동시에 처리된 요청과 급여년월이 중복되어 저장하지 못했습니다. 다시 시도해주세요."
+            )
+        raise
+
+    return await get_salary_statements_by_months(
+        session, user_id=user_id, pay_months=[row["pay_month"] for row in rows]
+    )
+
 # 8. 연차 신청 ID로 조회
 async def get_leave_request_by_id(
     session: AsyncSession, request_id: int
@@ -123,79 +326,147 @@ async def get_leave_request_by_id(
     return result.first()
 
 # 9. 연차 승인 처리 (관리자 전용)
-async def approve_leave_request(
-    session: AsyncSession, request_id: int
-) -> LeaveRequest:
-    # 1. 연차 신청 조회
-    statement = select(LeaveRequest).where(LeaveRequest.id == request_id)
-    result = await session.exec(statement)
-    leave_request = result.first()
+async def _set_pending_leave_status(
+    session: AsyncSession, request_id: int, new_status: str
+) -> bool:
+    """
+    pending 상태인 신청만 new_status로 바꿉니다. (조건부 UPDATE, 동시 처리 시 한 건만 성공)
+    """
+    result = await session.execute(
+        update(LeaveRequest)
+        .where(LeaveRequest.id == request_id, LeaveRequest.status == "pending")
+        .values(status=new_status)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount == 1
 
-    if not leave_request:
+async def _raise_leave_decision_error(
+    session: AsyncSession, request_id: int, action: str
+) -> None:
+    await session.rollback()
+    if await get_leave_request_by_id(session, request_id) is None:
         raise ValueError("Leave request not found")
+    raise ValueError(f"Only pending requests can be {action}")
 
-    if leave_request.status != "pending":
-        raise ValueError("Only pending requests can be approved")
-
-    # 2. 상태를 approved로 변경
-    leave_request.status = "approved"
-
-    # 3. LeaveBalance의 total_used 업데이트
-    balance_statement = select(LeaveBalance).where(
-        LeaveBalance.user_id == leave_request.user_id
+def _settle_reserved_days(request_ids: list[int], approve: bool):
+    """
+    처리된 신청 일수를 사용자별로 합산해 예약(total_reserved)을 해제하는 UPDATE ... JOIN
+    승인이면 같은 일수를 total_used에 더합니다.
+    """
+    days = (
+        select(LeaveRequest.user_id, func.sum(LeaveRequest.days_used).label("days"))
+        .where(LeaveRequest.id.in_(request_ids))
+        .group_by(LeaveRequest.user_id)
+        .subquery()
+    )
+    values = {"total_reserved": func.greatest(LeaveBalance.total_reserved - days.c.days, 0)}
+    if approve:
+        values["total_used"] = LeaveBalance.total_used + days.c.days
+    return (
+        update(LeaveBalance)
+        .where(LeaveBalance.user_id == days.c.user_id)
+        .values(**values)
+        .execution_options(synchronize_session=False)
     )
-    balance_result = await session.exec(balance_statement)
-    leave_balance = balance_result.first()
 
-    if leave_balance:
-        leave_balance.total_used += leave_request.days_used
+async def approve_leave_request(
+    session: AsyncSession, request_id: int
+) -> LeaveRequest:
+    """
+    연차 신청을 승인하고 예약된 일수를 LeaveBalance.total_used로 SQL에서 옮깁니다. (한 트랜잭션)
+    두 관리자가 동시에 승인해도 상태 변경과 사용 일수 반영은 한 번만 일어납니다.
+    """
+    if not await _set_pending_leave_status(session, request_id, "approved"):
+        await _raise_leave_decision_error(session, request_id, "approved")
 
+    await session.execute(_settle_reserved_days([request_id], approve=True))
     await session.commit()
-    await session.refresh(leave_request)
-
-    return leave_request
+    return await get_leave_request_by_id(session, request_id)
 
 # 10. 연차 거부 처리 (관리자 전용)
 async def reject_leave_request(
     session: AsyncSession, request_id: int
 ) -> LeaveRequest:
-    # 1. 연차 신청 조회
-    statement = select(LeaveRequest).where(LeaveRequest.id == request_id)
-    result = await session.exec(statement)
-    leave_request = result.first()
+    if not await _set_pending_leave_status(session, request_id, "rejected"):
+        await _raise_leave_decision_error(session, request_id, "rejected")
 
-    if not leave_request:
-        raise ValueError("Leave request not found")
+    await session.execute(_settle_reserved_days([request_id], approve=False))
+    await session.commit()
+    return await get_leave_request_by_id(session, request_id)
+
+# 10-1. 연차 일괄 승인/거부 (관리자 전용)
+async def decide_leave_requests(
+    session: AsyncSession, request_ids: list[int], approve: bool
+) -> list[tuple]:
+    """
+    여러 연차 신청을 한 트랜잭션에서 승인(approve=True) 또는 거부합니다.
+    - 대상 행을 SELECT ... FOR UPDATE로 잠근 뒤, pending인 신청만
+      조건부 UPDATE 1회로 상태를 바꾸고 사용자별 예약 해제(승인 시 사용 일수 반영)를 UPDATE ... JOIN 1회로 처리
 
-    if leave_request.status != "pending":
-        raise ValueError("Only pending requests can be rejected")
+    Returns:
+        요청 순서대로 (request_id, outcome, 처리 후 status)
+        outcome: approved, rejected, not_found, not_pending
+    """
+    new_status = "approved" if approve else "rejected"
+    unique_ids = list(dict.fromkeys(request_ids))
+    if not unique_ids:
+        return []
 
-    # 2. 상태를 rejected로 변경
-    leave_request.status = "rejected"
+    statement = (
+        select(LeaveRequest.id, LeaveRequest.status)
+        .where(LeaveRequest.id.in_(unique_ids))
+        .with_for_update()
+    )
+    current = dict((await session.exec(statement)).all())
+    pending_ids = [request_id for request_id in unique_ids if current.get(request_id) == "pending"]
 
+    if pending_ids:
+        await session.execute(
+            update(LeaveRequest)
+            .where(LeaveRequest.id.in_(pending_ids), LeaveRequest.status == "pending")
+            .values(status=new_status)
+            .execution_options(synchronize_session=False)
+        )
+        await session.execute(_settle_reserved_days(pending_ids, approve=approve))
     await session.commit()
-    await session.refresh(leave_request)
 
-    return leave_request
+    outcomes = []
+    decided = set(pending_ids)
+    reported = set()
+    for request_id in request_ids:
+        if request_id not in current:
+            outcomes.append((request_id, "not_found", None))
+        elif request_id in decided and request_id not in reported:
+            reported.add(request_id)
+            outcomes.append((request_id, new_status, new_status))
+        else:
+            # pending이 아니었거나, 같은 요청에서 이미 처리된 중복 id
+            status = new_status if request_id in decided else current[request_id]
+            outcomes.append((request_id, "not_pending", status))
+    return outcomes
 
 # 11. 전체 사용자 목록 조회 (관리자 전용)
-async def get_all_users(session: AsyncSession) -> list[User]:
-    statement = select(User).order_by(User.id)
+async def get_all_users(
+    session: AsyncSession, page: Optional[PageParams] = None
+) -> list[User]:
+    statement = pagination.apply(select(User), USER_ORDER, page)
     result = await session.exec(statement)
-    return result.all()
+    return pagination.finish(result.all(), USER_ORDER, page)
 
 # 12. 전체 연차 신청 목록 조회 (관리자 전용)
 async def get_all_leave_requests(
-    session: AsyncSession, status: Optional[str] = None
+    session: AsyncSession,
+    status: Optional[str] = None,
+    page: Optional[PageParams] = None
 ) -> list[LeaveRequest]:
     statement = select(LeaveRequest)
 
     if status:
         statement = statement.where(LeaveRequest.status == status)
 
-    statement = statement.order_by(LeaveRequest.start_date.desc())
+    statement = pagination.apply(statement, LEAVE_REQUEST_ORDER, page)
     result = await session.exec(statement)
-    return result.all()
+    return pagination.finish(result.all(), LEAVE_REQUEST_ORDER, page)
 
 # ============ 근태 관리 CRUD 함수들 ============
 
@@ -205,17 +476,17 @@ async def check_in_attendance(
 ) -> Attendance:
     """
     출근 체크인을 기록합니다.
-    이미 해당 날짜에 기록이 있으면 에러를 발생시킵니다.
-    """
-    # 이미 체크인 기록이 있는지 확인
-    existing = await get_attendance_by_user_and_date(session, user_id, work_date)
-    if existing:
-        raise ValueError("Already checked in for this date")
+    - 사전 조회 없이 INSERT하고, 중복은 unique_user_date 인덱스 위반으로 판정합니다.
+      (동시에 들어온 체크인도 한 건만 성공)
 
+    Raises:
+        DuplicateRecordError: 이미 해당 날짜에 기록이 있을 경우
+    """
     # 지각 판정: 09:00 이후 출근은 지각
     standard_time = time(9, 0)
     status = "late" if check_in_time > standard_time else "present"
 
+    # id, created_at, updated_at이 INSERT 시점에 채워지므로 refresh 불필요
     attendance = Attendance(
         user_id=user_id,
         work_date=work_date,
@@ -224,36 +495,304 @@ async def check_in_attendance(
         notes=notes
     )
     session.add(attendance)
+    try:
+        await session.flush()
+    except IntegrityError as e:
+        await session.rollback()
+        if _is_duplicate_key(e):
+            raise DuplicateRecordError("Already checked in for this date")
+        raise
+    await _apply_monthly_delta(session, user_id, work_date, {status: 1})
     await session.commit()
-    await session.refresh(attendance)
     return attendance
 
+# 13-1. 출근 체크인 일괄 저장 (묶음 쓰기용)
+async def bulk_check_in_attendance(
+    session: AsyncSession, check_ins: list[tuple]
+) -> list:
+    """
+    여러 체크인(user_id, work_date, check_in_time, notes)을 한 트랜잭션에서
+    multi-row INSERT 1회로 저장합니다.
+    결과 목록의 각 항목은 저장된 Attendance 또는 DuplicateRecordError입니다.
+    - 이미 기록이 있거나 같은 묶음 안에서 중복된 체크인은 INSERT에서 제외합니다.
+
+    Raises:
+        DuplicateRecordError: 사전 확인 이후 다른 요청이 먼저 저장해 INSERT가 실패한 경우
+            (호출한 쪽에서 한 건씩 다시 처리)
+    """
+    if not check_ins:
+        return []
+
+    keys = [(user_id, work_date) for user_id, work_date, _, _ in check_ins]
+    statement = select(Attendance.user_id, Attendance.work_date).where(
+        tuple_(Attendance.user_id, Attendance.work_date).in_(set(keys))
+    )
+    taken = set((await session.exec(statement)).all())
+
+    now = datetime.utcnow()
+    results: list = [None] * len(check_ins)
+    rows = []
+    deltas_by_month: dict = {}
+    for index, (user_id, work_date, check_in_time, notes) in enumerate(check_ins):
+        if (user_id, work_date) in taken:
+            results[index] = DuplicateRecordError("Already checked in for this date")
+            continue
+        taken.add((user_id, work_date))
+
+        # 지각 판정: 09:00 이후 출근은 지각
+        status = "late" if check_in_time > time(9, 0) else "present"
+        rows.append({
+            "user_id": user_id,
+            "work_date": work_date,
+            "check_in": check_in_time,
+            "status": status,
+            "notes": notes,
+            "created_at": now,
+            "updated_at": now,
+        })
+        month_deltas = deltas_by_month.setdefault((user_id, _month_key(work_date)), {})
+        month_deltas[status] = month_deltas.get(status, 0) + 1
+
+    if not rows:
+        return results
+
+    try:
+        await session.execute(insert(Attendance).values(rows))
+        await _apply_monthly_deltas(session, deltas_by_month)
+        await session.commit()
+    except IntegrityError as e:
+        await session.rollback()
+        if _is_duplicate_key(e):
+            raise DuplicateRecordError("Already checked in for this date")
+        raise
+
+    statement = select(Attendance).where(
+        tuple_(Attendance.user_id, Attendance.work_date).in_(
+            [(row["user_id"], row["work_date"]) for row in rows]
+        )
+    )
+    saved = {
+        (attendance.user_id, attendance.work_date): attendance
+        for attendance in (await session.exec(statement)).all()
+    }
+    for index, key in enumerate(keys):
+        if results[index] is None:
+            results[index] = saved[key]
+    return results
+
+# 13-2. 출입 단말기 이벤트 일괄 반영
+# 새 기록 INSERT가 동시 체크인과 겹치거나 교착 상태(deadlock)로 롤백됐을 때
+# 다시 읽어서 적용하는 최대 횟수
+PUNCH_APPLY_ATTEMPTS = 3
+
+async def apply_punch_events(
+    session: AsyncSession, events: list[tuple]
+) -> list[tuple]:
+    """
+    출입 이벤트(user_id, work_date, punch_time, "in"/"out")를 순서대로 체크인/체크아웃으로 변환해
+    한 트랜잭션으로 반영합니다.
+    지각(09:00 이후 출근)·조퇴(18:00 이전 퇴근) 판정은 check_in/check_out_attendance와 같습니다.
+
+    - 기존 기록은 SELECT ... FOR UPDATE로 잠근 뒤 계산하므로, 결과와 월별 집계 증감이
+      실제로 저장되는 값과 같습니다. (동시 체크아웃은 commit까지 대기)
+    - 새 기록은 일반 INSERT로 저장하고, 그 사이 다른 경로의 체크인이 먼저 저장되어
+      중복 키가 나거나 교착 상태(1213)로 롤백되면 다시 읽어서 처음부터 적용합니다.
+    - PUNCH_APPLY_ATTEMPTS번 모두 실패하면 예외 대신 모든 이벤트를 error 결과로 반환합니다.
+      (앞선 묶음은 이미 commit되었으므로 요청 전체를 실패시키지 않음)
+
+    Returns:
+        이벤트별 (result, 반영 후 status, detail) 목록
+        result: checked_in, checked_out, already_checked_in, already_checked_out,
+                no_check_in, unknown_user, error
+    """
+    if not events:
+        return []
+
+    for _ in range(PUNCH_APPLY_ATTEMPTS):
+        try:
+            return await _apply_punch_events_once(session, events)
+        except DuplicateRecordError:
+            await session.rollback()
+        except DBAPIError as e:
+            await session.rollback()
+            if not _is_deadlock(e):
+                raise
+    return [("error", None, "Conflicted with concurrent updates, retry later")] * len(events)
+
+async def _apply_punch_events_once(
+    session: AsyncSession, events: list[tuple]
+) -> list[tuple]:
+    user_ids = {user_id for user_id, _, _, _ in events}
+    statement = select(User.id).where(User.id.in_(user_ids), User.is_active == True)
+    active_user_ids = set((await session.exec(statement)).all())
+
+    keys = {(user_id, work_date) for user_id, work_date, _, _ in events if user_id in active_user_ids}
+    rows: dict = {}
+    if keys:
+        # ORM 객체 대신 컬럼만 읽음 (재시도 시 identity map의 이전 값이 섞이지 않도록)
+        statement = (
+            select(
+                Attendance.user_id,
+                Attendance.work_date,
+                Attendance.check_in,
+                Attendance.check_out,
+                Attendance.status,
+                Attendance.notes,
+                Attendance.created_at,
+            )
+            .where(tuple_(Attendance.user_id, Attendance.work_date).in_(keys))
+            .with_for_update()
+        )
+        for attendance in (await session.exec(statement)).all():
+            rows[(attendance.user_id, attendance.work_date)] = {
+                "check_in": attendance.check_in,
+                "check_out": attendance.check_out,
+                "status": attendance.status,
+                "notes": attendance.notes,
+                "created_at": attendance.created_at,
+                "original_status": attendance.status,
+                "exists": True,
+            }
+
+    # 1. 메모리에서 이벤트를 순서대로 적용
+    results = []
+    changed = set()
+    for user_id, work_date, punch_time, direction in events:
+        key = (user_id, work_date)
+        if user_id not in active_user_ids:
+            results.append(("unknown_user", None, "User not found or inactive"))
+            continue
+        row = rows.get(key)
+        if direction == "in":
+            if row is not None:
+                results.append(("already_checked_in", row["status"], "Already checked in for this date"))
+                continue
+            row = rows[key] = {
+                "check_in": punch_time,
+                "check_out": None,
+                "status": "late" if punch_time > time(9, 0) else "present",
+                "notes": None,
+                "created_at": None,
+                "original_status": None,
+                "exists": False,
+            }
+            changed.add(key)
+            results.append(("checked_in", row["status"], None))
+        else:
+            if row is None:
+                results.append(("no_check_in", None, "No check-in record found for this date"))
+                continue
+            if row["check_out"] is not None:
+                results.append(("already_checked_out", row["status"], "Already checked out for this date"))
+                continue
+            row["check_out"] = punch_time
+            if punch_time < time(18, 0) and row["status"] == "present":
+                row["status"] = "early_leave"
+            changed.add(key)
+            results.append(("checked_out", row["status"], None))
+
+    if not changed:
+        await session.commit()  # 잠금 해제
+        return results
+
+    # 2. 바뀐 기록 저장 + 월별 집계 반영 (한 트랜잭션)
+    now = datetime.utcnow()
+    new_values, updated_values = [], []
+    deltas_by_month: dict = {}
+    for user_id, work_date in changed:
+        row = rows[(user_id, work_date)]
+        value = {
+            "user_id": user_id,
+            "work_date": work_date,
+            "check_in": row["check_in"],
+            "check_out": row["check_out"],
+            "status": row["status"],
+            "notes": row["notes"],
+            "created_at": row["created_at"] or now,
+            "updated_at": now,
+        }
+        (updated_values if row["exists"] else new_values).append(value)
+        if row["original_status"] == row["status"]:
+            continue
+        deltas = deltas_by_month.setdefault((user_id, _month_key(work_date)), {})
+        if row["original_status"] is not None:
+            deltas[row["original_status"]] = deltas.get(row["original_status"], 0) - 1
+        deltas[row["status"]] = deltas.get(row["status"], 0) + 1
+
+    if new_values:
+        try:
+            await session.execute(insert(Attendance).values(new_values))
+        except IntegrityError as e:
+            if _is_duplicate_key(e):
+                raise DuplicateRecordError("Already checked in for this date")
+            raise
+    if updated_values:
+        # 잠근 기존 행이므로 계산한 값을 그대로 덮어씀
+        upsert_stmt = mysql_insert(Attendance).values(updated_values)
+        upsert_stmt = upsert_stmt.on_duplicate_key_update(
+            status=upsert_stmt.inserted.status,
+            check_out=upsert_stmt.inserted.check_out,
+            updated_at=upsert_stmt.inserted.updated_at,
+        )
+        await session.execute(upsert_stmt)
+    await _apply_monthly_deltas(session, deltas_by_month)
+    await session.commit()
+    return results
+
 # 14. 퇴근 체크아웃
 async def check_out_attendance(
     session: AsyncSession, user_id: int, work_date: date, check_out_time: time
 ) -> Attendance:
     """
     퇴근 체크아웃을 기록합니다.
-    출근 기록이 없으면 에러를 발생시킵니다.
+    - 사전 조회/잠금 없이 'check_out IS NULL' 조건부 UPDATE로 처리하고 rowcount로 판정합니다.
+    - 18:00 이전 퇴근이면 먼저 status = 'present' 조건을 더한 UPDATE로 조퇴 처리를 시도하고,
+      그 rowcount가 1일 때만 월별 집계를 present -> early_leave로 옮깁니다.
+      (지각 등 다른 상태면 0건이므로 check_out만 저장하는 UPDATE를 이어서 실행)
+    - 실패한 경우에만 기록을 조회해 원인(출근 기록 없음 / 이미 퇴근)을 구분합니다.
     """
-    attendance = await get_attendance_by_user_and_date(session, user_id, work_date)
-    if not attendance:
-        raise ValueError("No check-in record found for this date")
-
-    if attendance.check_out:
-        raise ValueError("Already checked out for this date")
+    now = datetime.utcnow()
+    target = (
+        update(Attendance)
+        .where(
+            Attendance.user_id == user_id,
+            Attendance.work_date == work_date,
+            Attendance.check_out.is_(None)
+        )
+        .execution_options(synchronize_session=False)
+    )
 
-    # 조퇴 판정: 18:00 이전 퇴근은 조퇴
+    # 조퇴 판정: 18:00 이전 퇴근은 조퇴 (정상 출근 상태일 때만)
     standard_time = time(18, 0)
-    if check_out_time < standard_time and attendance.status == "present":
-        attendance.status = "early_leave"
-
-    attendance.check_out = check_out_time
-    attendance.updated_at = datetime.utcnow()
+    became_early_leave = False
+    if check_out_time < standard_time:
+        result = await session.execute(
+            target.where(Attendance.status == "present")
+            .values(check_out=check_out_time, status="early_leave", updated_at=now)
+        )
+        became_early_leave = result.rowcount == 1
+    if not became_early_leave:
+        result = await session.execute(
+            target.values(check_out=check_out_time, updated_at=now)
+        )
+        if result.rowcount == 0:
+            await session.rollback()
+            if await get_attendance_by_user_and_date(session, user_id, work_date) is None:
+                raise ValueError("No check-in record found for this date")
+            raise ValueError("Already checked out for this date")
 
+    if became_early_leave:
+        await _apply_monthly_delta(
+            session, user_id, work_date, {"present": -1, "early_leave": 1}
+        )
     await session.commit()
-    await session.refresh(attendance)
-    return attendance
+
+    # 응답용 조회 (commit 후이므로 잠금 없이 읽음)
+    return (await session.exec(
+        select(Attendance)
+        .where(Attendance.user_id == user_id, Attendance.work_date == work_date)
+        .execution_options(populate_existing=True)
+    )).one()
 
 # 15. 특정 날짜의 근태 기록 조회
 async def get_attendance_by_user_and_date(
@@ -289,39 +828,70 @@ async def get_all_attendances(
     session: AsyncSession,
     work_date: Optional[date] = None,
     start_date: Optional[date] = None,
-    end_date: Optional[date] = None
+    end_date: Optional[date] = None,
+    page: Optional[PageParams] = None
 ) -> list[Attendance]:
     statement = select(Attendance).options(selectinload(Attendance.user))
+    statement = _filter_work_date(statement, work_date, start_date, end_date)
 
-    if work_date:
-        statement = statement.where(Attendance.work_date == work_date)
-    else:
-        if start_date:
-            statement = statement.where(Attendance.work_date >= start_date)
-        if end_date:
-            statement = statement.where(Attendance.work_date <= end_date)
-
-    statement = statement.order_by(Attendance.work_date.desc(), Attendance.user_id)
+    statement = pagination.apply(statement, ATTENDANCE_ADMIN_ORDER, page)
     result = await session.exec(statement)
-    return result.all()
+    return pagination.finish(result.all(), ATTENDANCE_ADMIN_ORDER, page)
 
-# 18. 근태 통계 조회
-async def get_attendance_stats(
+def _filter_work_date(statement, work_date, start_date, end_date):
+    if work_date:
+        return statement.where(Attendance.work_date == work_date)
+    if start_date:
+        statement = statement.where(Attendance.work_date >= start_date)
+    if end_date:
+        statement = statement.where(Attendance.work_date <= end_date)
+    return statement
+
+# 17-1. 전체 사용자의 근태 기록 스트리밍 조회 (내보내기용)
+ATTENDANCE_EXPORT_COLUMNS = (
+    Attendance.id,
+    Attendance.user_id,
+    User.email.label("user_email"),
+    User.name.label("user_name"),
+    Attendance.work_date,
+    Attendance.check_in,
+    Attendance.check_out,
+    Attendance.status,
+    Attendance.notes,
+    Attendance.created_at,
+    Attendance.updated_at,
+)
+
+async def stream_all_attendances(
     session: AsyncSession,
-    user_id: int,
-    start_date: date,
-    end_date: date
-) -> dict:
+    work_date: Optional[date] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    chunk_size: int = 1000
+) -> AsyncIterator[list]:
     """
-    특정 기간의 근태 통계를 반환합니다.
+    서버 사이드 커서로 근태 기록을 chunk_size 행씩 읽어 반환합니다.
+    ORM 객체를 만들지 않고 user를 JOIN한 컬럼 행(Row)만 전달하므로
+    조회 기간과 관계없이 메모리 사용량이 일정합니다.
     """
-    attendances = await get_attendances_by_user(session, user_id, start_date, end_date)
+    statement = select(*ATTENDANCE_EXPORT_COLUMNS).join(User, User.id == Attendance.user_id)
+    statement = _filter_work_date(statement, work_date, start_date, end_date)
+    statement = pagination.apply(statement, ATTENDANCE_ADMIN_ORDER, None)
 
-    total_days = len(attendances)
-    present_days = sum(1 for a in attendances if a.status == "present")
-    late_days = sum(1 for a in attendances if a.status == "late")
-    early_leave_days = sum(1 for a in attendances if a.status == "early_leave")
-    absent_days = sum(1 for a in attendances if a.status == "absent")
+    result = await session.stream(
+        statement.execution_options(stream_results=True, yield_per=chunk_size)
+    )
+    async for rows in result.partitions(chunk_size):
+        yield rows
+
+# 18. 근태 통계 조회
+def _stats_from_counts(counts: dict) -> dict:
+    """상태별 일수({status: count})를 AttendanceStats 형식으로 변환합니다."""
+    total_days = sum(counts.values())
+    present_days = counts.get("present", 0)
+    late_days = counts.get("late", 0)
+    early_leave_days = counts.get("early_leave", 0)
+    absent_days = counts.get("absent", 0)
 
     attendance_rate = (present_days / total_days * 100) if total_days > 0 else 0.0
 
@@ -334,6 +904,292 @@ async def get_attendance_stats(
         "attendance_rate": round(attendance_rate, 2)
     }
 
+async def get_attendance_stats(
+    session: AsyncSession,
+    user_id: int,
+    start_date: date,
+    end_date: date
+) -> dict:
+    """
+    특정 기간의 근태 통계를 반환합니다.
+    온전히 포함된 달은 월별 집계(attendance_monthly)에서, 앞뒤의 일부 기간만
+    attendance 원본에서 상태별 COUNT로 집계합니다.
+    """
+    grouped = await get_attendance_stats_grouped(
+        session, start_date=start_date, end_date=end_date, user_ids=[user_id]
+    )
+    return grouped.get((user_id, None)) or _stats_from_counts({})
+
+# 18-1. 여러 사용자 / 여러 기간(월별) 근태 통계 일괄 조회
+ROLLUP_STATUS_COLUMNS = {
+    "present": AttendanceMonthly.present_days,
+    "late": AttendanceMonthly.late_days,
+    "early_leave": AttendanceMonthly.early_leave_days,
+    "absent": AttendanceMonthly.absent_days,
+}
+
+def _month_key(day: date) -> str:
+    return f"{day.year:04d}-{day.month:02d}"
+
+def _split_full_months(start_date: date, end_date: date):
+    """
+    기간을 (처음 달, 마지막 달) 범위의 온전한 달들과, 달을 다 채우지 못한 앞뒤 구간으로 나눕니다.
+
+    Returns:
+        (("YYYY-MM", "YYYY-MM") 또는 None, [(시작일, 종료일), ...])
+    """
+    first_full = start_date if start_date.day == 1 else (
+        start_date.replace(day=28) + timedelta(days=4)
+    ).replace(day=1)
+    last_full_end = end_date if (end_date + timedelta(days=1)).day == 1 else (
+        end_date.replace(day=1) - timedelta(days=1)
+    )
+    if first_full > last_full_end:
+        return None, [(start_date, end_date)]
+
+    partial = []
+    if start_date < first_full:
+        partial.append((start_date, first_full - timedelta(days=1)))
+    if end_date > last_full_end:
+        partial.append((last_full_end + timedelta(days=1), end_date))
+    return (_month_key(first_full), _month_key(last_full_end)), partial
+
+async def get_attendance_stats_grouped(
+    session: AsyncSession,
+    start_date: date,
+    end_date: date,
+    user_ids: Optional[list[int]] = None,
+    by_month: bool = False
+) -> dict:
+    """
+    사용자별(by_month=True면 사용자별·월별) 근태 통계를 반환합니다.
+    온전한 달은 월별 집계 테이블 1회, 일부만 포함된 달은 원본 GROUP BY 1회로 조회합니다.
+
+    Returns:
+        {(user_id, "YYYY-MM" 또는 None): 통계 dict}
+        기록이 없는 사용자/월은 포함되지 않습니다.
+    """
+    months, partial_ranges = _split_full_months(start_date, end_date)
+    counts: dict = {}
+
+    def add(key, status, count):
+        if count:
+            bucket = counts.setdefault(key, {})
+            bucket[status] = bucket.get(status, 0) + int(count)
+
+    # 1. 온전한 달: 월별 집계 합산
+    if months:
+        group_columns = [AttendanceMonthly.user_id]
+        if by_month:
+            group_columns.append(AttendanceMonthly.month)
+
+        statement = (
+            select(
+                *group_columns,
+                func.sum(AttendanceMonthly.total_days),
+                *[func.sum(column) for column in ROLLUP_STATUS_COLUMNS.values()],
+            )
+            .where(AttendanceMonthly.month >= months[0], AttendanceMonthly.month <= months[1])
+            .group_by(*group_columns)
+        )
+        if user_ids is not None:
+            statement = statement.where(AttendanceMonthly.user_id.in_(user_ids))
+
+        result = await session.exec(statement)
+        for row in result.all():
+            key = (row[0], row[1] if by_month else None)
+            sums = [int(value or 0) for value in row[len(group_columns):]]
+            total, status_sums = sums[0], sums[1:]
+            for status, count in zip(ROLLUP_STATUS_COLUMNS, status_sums):
+                add(key, status, count)
+            # 그 외 상태는 총 일수에만 반영
+            add(key, "other", total - sum(status_sums))
+
+    # 2. 일부만 포함된 달: 원본에서 상태별 COUNT
+    if partial_ranges:
+        group_columns = [Attendance.user_id]
+        if by_month:
+            group_columns += [
+                extract("year", Attendance.work_date).label("year"),
+                extract("month", Attendance.work_date).label("month"),
+            ]
+
+        statement = (
+            select(*group_columns, Attendance.status, func.count())
+            .where(or_(*[
+                Attendance.work_date.between(range_start, range_end)
+                for range_start, range_end in partial_ranges
+            ]))
+            .group_by(*group_columns, Attendance.status)
+        )
+        if user_ids is not None:
+            statement = statement.where(Attendance.user_id.in_(user_ids))
+
+        result = await session.exec(statement)
+        for row in result.all():
+            if by_month:
+                user_id, year, month, status, count = row
+                key = (user_id, f"{int(year):04d}-{int(month):02d}")
+            else:
+                user_id, status, count = row
+                key = (user_id, None)
+            add(key, status, count)
+
+    return {key: _stats_from_counts(value) for key, value in counts.items()}
+
+async def _apply_monthly_delta(
+    session: AsyncSession, user_id: int, work_date: date, deltas: dict
+) -> None:
+    """
+    월별 집계에 상태별 증감({status: +1/-1})을 반영합니다.
+    호출한 쪽의 commit과 같은 트랜잭션에서 실행됩니다.
+    """
+    await _apply_monthly_deltas(session, {(user_id, _month_key(work_date)): deltas})
+
+async def _apply_monthly_deltas(session: AsyncSession, deltas_by_month: dict) -> None:
+    """
+    여러 (user_id, "YYYY-MM")의 상태별 증감을 INSERT ... ON DUPLICATE KEY UPDATE 1회로 반영합니다.
+    """
+    if not deltas_by_month:
+        return
+    rows = []
+    for (user_id, month), deltas in deltas_by_month.items():
+        row = {"user_id": user_id, "month": month, "total_days": sum(deltas.values())}
+        for status, column in ROLLUP_STATUS_COLUMNS.items():
+            row[column.key] = deltas.get(status, 0)
+        rows.append(row)
+
+    counter_keys = ["total_days", *[column.key for column in ROLLUP_STATUS_COLUMNS.values()]]
+    statement = mysql_insert(AttendanceMonthly).values(rows)
+    statement = statement.on_duplicate_key_update({
+        key: getattr(AttendanceMonthly, key) + getattr(statement.inserted, key)
+        for key in counter_keys
+    })
+    await session.execute(statement)
+
+# 18-2. 특정 연도의 월별 근태 통계 (쿼리 1회)
+async def get_monthly_attendance_stats(
+    session: AsyncSession, user_id: int, year: int
+) -> list[dict]:
+    """
+    1~12월 통계를 순서대로 반환합니다. (기록이 없는 달은 0으로 채움)
+    """
+    grouped = await get_attendance_stats_grouped(
+        session,
+        start_date=date(year, 1, 1),
+        end_date=date(year, 12, 31),
+        user_ids=[user_id],
+        by_month=True
+    )
+    monthly = []
+    for month in range(1, 13):
+        key = f"{year:04d}-{month:02d}"
+        stats = grouped.get((user_id, key)) or _stats_from_counts({})
+        monthly.append({"month": key, **stats})
+    return monthly
+
+# 18-4. 전체 재직자 근태 통계 (관리자 대시보드용)
+ATTENDANCE_STATS_SORT_KEYS = (
+    "user_id", "total_days", "present_days", "late_days",
+    "early_leave_days", "absent_days", "attendance_rate",
+)
+
+async def get_org_attendance_stats(
+    session: AsyncSession,
+    start_date: date,
+    end_date: date,
+    user_ids: Optional[list[int]] = None,
+    sort: str = "attendance_rate",
+    limit: Optional[int] = None
+) -> list[dict]:
+    """
+    재직 중인 사용자 전체(또는 user_ids)의 근태 통계를 한 번에 계산합니다.
+    사용자 목록 1회 + 그룹 집계(get_attendance_stats_grouped)로 처리하며,
+    기록이 없는 사용자는 0으로 채웁니다.
+
+    sort: ATTENDANCE_STATS_SORT_KEYS 중 하나, 앞에 "-"를 붙이면 내림차순
+          (기본값 attendance_rate: 출석률이 낮은 사용자부터)
+    """
+    descending = sort.startswith("-")
+    sort_key = sort.lstrip("-")
+    if sort_key not in ATTENDANCE_STATS_SORT_KEYS:
+        raise ValueError(f"Invalid sort key: {sort}")
+
+    statement = select(User.id, User.email, User.name).where(User.is_active == True)
+    if user_ids is not None:
+        statement = statement.where(User.id.in_(user_ids))
+    users = (await session.exec(statement)).all()
+    if not users:
+        return []
+
+    grouped = await get_attendance_stats_grouped(
+        session,
+        start_date=start_date,
+        end_date=end_date,
+        user_ids=user_ids
+    )
+    empty = _stats_from_counts({})
+    rows = [
+        {
+            "user_id": user_id,
+            "email": email,
+            "name": name,
+            **grouped.get((user_id, None), empty),
+        }
+        for user_id, email, name in users
+    ]
+    # 같은 값이면 user_id 오름차순
+    rows.sort(key=lambda row: row["user_id"])
+    rows.sort(key=lambda row: row[sort_key], reverse=descending)
+    return rows[:limit] if limit else rows
+
+# 18-3. 월별 근태 집계 재생성 (백필/보정용)
+async def rebuild_attendance_monthly(
+    session: AsyncSession,
+    start_month: Optional[str] = None,
+    end_month: Optional[str] = None,
+    user_id: Optional[int] = None
+) -> int:
+    """
+    attendance 원본으로 월별 집계를 다시 만듭니다. (DELETE + INSERT ... SELECT, 한 트랜잭션)
+    start_month / end_month는 "YYYY-MM" 형식이며, 생략하면 전체 기간입니다.
+
+    Returns:
+        생성된 집계 행 수
+    """
+    month_expr = func.date_format(Attendance.work_date, "%Y-%m")
+
+    delete_stmt = delete(AttendanceMonthly)
+    select_stmt = select(
+        Attendance.user_id,
+        month_expr.label("month"),
+        func.count(),
+        *[
+            func.sum(case((Attendance.status == status, 1), else_=0))
+            for status in ROLLUP_STATUS_COLUMNS
+        ],
+    )
+    if start_month:
+        delete_stmt = delete_stmt.where(AttendanceMonthly.month >= start_month)
+        select_stmt = select_stmt.where(Attendance.work_date >= date.fromisoformat(f"{start_month}-01"))
+    if end_month:
+        delete_stmt = delete_stmt.where(AttendanceMonthly.month <= end_month)
+        year, month = map(int, end_month.split("-"))
+        select_stmt = select_stmt.where(Attendance.work_date < date(year + month // 12, month % 12 + 1, 1))
+    if user_id is not None:
+        delete_stmt = delete_stmt.where(AttendanceMonthly.user_id == user_id)
+        select_stmt = select_stmt.where(Attendance.user_id == user_id)
+    select_stmt = select_stmt.group_by(Attendance.user_id, month_expr)
+
+    insert_stmt = insert(AttendanceMonthly).from_select(
+        ["user_id", "month", "total_days", *[column.key for column in ROLLUP_STATUS_COLUMNS.values()]],
+        select_stmt,
+    )
+    await session.execute(delete_stmt)
+    result = await session.execute(insert_stmt)
+    await session.commit()
+    return result.rowcount
+
 # 19. 근태 기록 생성 (관리자용)
 async def create_attendance_record(
     session: AsyncSession, user_id: int, attendance_in: AttendanceCreate
@@ -350,6 +1206,37 @@ async def create_attendance_record(
         attendance_in, update={"user_id": user_id}
     )
     session.add(attendance)
+    await _apply_monthly_delta(session, user_id, attendance.work_date, {attendance.status: 1})
     await session.commit()
     await session.refresh(attendance)
-    return attendance
\ No newline at end of file
+    return attendance
+
+# 20. ID로 유저 찾기
+async def get_user_by_id(session: AsyncSession, user_id: int) -> Optional[User]:
+    return await session.get(User, user_id)
+
+# 21. 유저 권한/재직 상태 변경 (관리자용)
+async def update_user_status(
+    session: AsyncSession,
+    user_id: int,
+    role: Optional[str] = None,
+    is_active: Optional[bool] = None
+) -> User:
+    """
+    사용자의 role / is_active를 변경하고 principal 캐시를 무효화합니다.
+    """
+    user = await get_user_by_id(session, user_id)
+    if not user:
+        raise ValueError("User not found")
+
+    if role is not None:
+        user.role = role
+    if is_active is not None:
+        user.is_active = is_active
+
+    await session.commit()
+    await session.refresh(user)
+
+    # 인증 캐시에 남아 있는 이전 권한/상태 제거
+    invalidate_principal(user.email)
+    return user
@@ -1,17 +1,90 @@
+import threading
+import time
 from typing import AsyncGenerator
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from core.config import settings
 
-# 1. 비동기 엔진 생성
-engine = create_async_engine(settings.DATABASE_URL, echo=True)
 
-# 2. 비동기 세션 생성 함수 (Dependency)
+# 0. 커넥션 획득 대기 시간을 측정하는 풀
+class TimedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    커넥션 체크아웃 시 대기한 시간을 누적하는 QueuePool.
+    /health 엔드포인트에서 풀 크기 조정의 근거 데이터로 사용합니다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.checkout_count = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.timeout_count = 0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except Exception:
+            with self._stats_lock:
+                self.timeout_count += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            with self._stats_lock:
+                self.checkout_count += 1
+                self.total_wait_seconds += waited
+                if waited > self.max_wait_seconds:
+                    self.max_wait_seconds = waited
+
+
+# 1. 비동기 엔진 생성 (풀 설정은 Settings에서 조정)
+engine = create_async_engine(
+    settings.DATABASE_URL,
+    echo=settings.DB_ECHO,
+    poolclass=TimedAsyncQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+)
+
+# 2. 세션 팩토리 (모듈 로드 시 한 번만 생성)
+async_session_factory = sessionmaker(
+    engine, class_=AsyncSession, expire_on_commit=False
+)
+
+# 3. 비동기 세션 생성 함수 (Dependency)
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
-    async_session = sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False
-    )
-    async with async_session() as session:
-        yield session
\ No newline at end of file
+    async with async_session_factory() as session:
+        yield session
+
+# 4. 커넥션 풀 현황 조회
+def get_pool_stats() -> dict:
+    """
+    현재 커넥션 풀 상태와 누적 대기 시간 통계를 반환합니다.
+    """
+    pool = engine.sync_engine.pool
+    stats = {
+        "pool_size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        # QueuePool.overflow()는 -pool_size부터 시작하므로 초과분만 표시
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+    }
+    if isinstance(pool, TimedAsyncQueuePool):
+        with pool._stats_lock:
+            checkout_count = pool.checkout_count
+            total_wait = pool.total_wait_seconds
+            stats.update({
+                "checkout_count": checkout_count,
+                "timeout_count": pool.timeout_count,
+                "avg_wait_ms": round(total_wait / checkout_count * 1000, 3) if checkout_count else 0.0,
+                "max_wait_ms": round(pool.max_wait_seconds * 1000, 3),
+            })
+    return stats
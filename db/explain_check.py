@@ -0,0 +1,180 @@
+"""
+crud 쿼리 실행 계획(EXPLAIN) 점검 명령
+
+실제 crud 함수를 하나의 트랜잭션 안에서 호출해 실행되는 SELECT/UPDATE/DELETE를 모두 기록하고,
+각 문장을 같은 파라미터로 EXPLAIN해 인덱스 없이 테이블 전체를 읽는(type=ALL) 경우를 찾습니다.
+- 쓰기 함수도 세이브포인트 안에서 실행되며, 끝나면 전체 트랜잭션을 롤백하므로 데이터는 바뀌지 않습니다.
+- 전체 스캔이 하나라도 있으면 종료 코드 1 (ALLOWED_FULL_SCANS에 등록된 경우는 제외)
+- 행이 거의 없는 테이블에서는 옵티마이저가 인덱스 대신 전체 스캔을 고를 수 있으므로,
+  운영과 비슷한 양의 데이터가 있는 DB에서 실행하세요. (max_seeks_for_key를 낮춰 인덱스를 우선하도록 함)
+
+사용법:
+    python -m db.migrate && python -m db.explain_check
+    python -m db.explain_check --verbose   # 모든 문장의 실행 계획 출력
+"""
+import argparse
+import asyncio
+import re
+import sys
+from datetime import date, time, timedelta
+
+from sqlalchemy import event
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from db import crud
+from db.database import engine
+from db.models import LeaveRequest, User
+from db.pagination import PageParams
+from schemas.leave import LeaveRequestCreate
+
+# 의도적으로 전체를 읽는 (crud 함수, 테이블)
+ALLOWED_FULL_SCANS = {
+    # 재직자 전체 통계는 user 테이블 전체를 대상으로 함
+    ("get_org_attendance_stats", "user"),
+}
+
+_CHECKED_STATEMENT = re.compile(r"\s*(SELECT|UPDATE|DELETE)\b", re.IGNORECASE)
+
+
+async def _first_row(stream):
+    async for rows in stream:
+        return rows
+
+
+def _cases(sample: dict) -> list:
+    """(이름, session을 받아 crud 함수를 호출하는 함수) 목록"""
+    user_id, email, request_id = sample["user_id"], sample["email"], sample["request_id"]
+    today = date.today()
+    month_start = today.replace(day=1)
+    # 온전한 달과 일부만 포함된 달이 모두 들어가는 기간 (집계 테이블 + 원본 조회 경로)
+    range_start = (month_start - timedelta(days=40)).replace(day=15)
+    far_future = date(today.year + 50, 1, 4)
+
+    def page():
+        return PageParams(limit=20)
+
+    return [
+        ("get_user_by_email", lambda s: crud.get_user_by_email(s, email)),
+        ("get_user_by_id", lambda s: crud.get_user_by_id(s, user_id)),
+        ("get_all_users", lambda s: crud.get_all_users(s, page())),
+        ("get_leave_balance_by_user", lambda s: crud.get_leave_balance_by_user(s, user_id)),
+        ("get_leave_requests_by_user", lambda s: crud.get_leave_requests_by_user(s, user_id, page())),
+        ("create_leave_request", lambda s: crud.create_leave_request(
+            s, user_id, LeaveRequestCreate(start_date=far_future, end_date=far_future, days_used=1)
+        )),
+        ("get_leave_calendar", lambda s: crud.get_leave_calendar(s, month_start, month_start + timedelta(days=30))),
+        ("get_leave_request_by_id", lambda s: crud.get_leave_request_by_id(s, request_id)),
+        ("get_all_leave_requests", lambda s: crud.get_all_leave_requests(s, None, page())),
+        ("get_all_leave_requests(status)", lambda s: crud.get_all_leave_requests(s, "pending", page())),
+        ("decide_leave_requests", lambda s: crud.decide_leave_requests(s, [request_id], approve=True)),
+        ("get_salary_statements_by_user", lambda s: crud.get_salary_statements_by_user(s, user_id, page())),
+        ("get_salary_statement_by_month", lambda s: crud.get_salary_statement_by_month(
+            s, user_id, month_start.strftime("%Y-%m")
+        )),
+        ("get_salary_statements_by_months", lambda s: crud.get_salary_statements_by_months(
+            s, user_id, [month_start.strftime("%Y-%m"), range_start.strftime("%Y-%m")]
+        )),
+        ("get_attendance_by_user_and_date", lambda s: crud.get_attendance_by_user_and_date(s, user_id, today)),
+        ("get_attendances_by_user", lambda s: crud.get_attendances_by_user(s, user_id, range_start, today)),
+        ("get_all_attendances(work_date)", lambda s: crud.get_all_attendances(s, work_date=today, page=page())),
+        ("get_all_attendances(range)", lambda s: crud.get_all_attendances(
+            s, start_date=range_start, end_date=today, page=page()
+        )),
+        ("stream_all_attendances", lambda s: _first_row(
+            crud.stream_all_attendances(s, start_date=range_start, end_date=today)
+        )),
+        ("check_out_attendance", lambda s: crud.check_out_attendance(s, user_id, today, time(18, 0))),
+        ("get_attendance_stats", lambda s: crud.get_attendance_stats(s, user_id, range_start, today)),
+        ("get_monthly_attendance_stats", lambda s: crud.get_monthly_attendance_stats(s, user_id, today.year)),
+        ("get_org_attendance_stats", lambda s: crud.get_org_attendance_stats(s, range_start, today)),
+        ("get_org_attendance_stats(user_ids)", lambda s: crud.get_org_attendance_stats(
+            s, range_start, today, user_ids=[user_id]
+        )),
+    ]
+
+
+async def main(verbose: bool) -> int:
+    if engine.dialect.name != "mysql":
+        raise SystemExit(f"MySQL 전용 점검입니다. (현재 DB: {engine.dialect.name})")
+
+    captured: list[tuple[str, str, object]] = []
+    current = [None]
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if current[0] and _CHECKED_STATEMENT.match(statement):
+            captured.append((current[0], statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _capture)
+    failures = 0
+    seen = set()
+    try:
+        async with engine.connect() as conn:
+            await conn.begin()
+            # 작은 테이블에서도 인덱스를 우선 고려하도록 키 탐색 비용을 낮게 가정
+            await conn.exec_driver_sql("SET SESSION max_seeks_for_key = 1")
+            session = AsyncSession(bind=conn, join_transaction_mode="create_savepoint", expire_on_commit=False)
+
+            user = (await session.exec(select(User).order_by(User.id).limit(1))).first()
+            if user is None:
+                raise SystemExit("사용자가 없습니다. 데이터가 있는 DB에서 실행하세요.")
+            request_id = (await session.exec(select(LeaveRequest.id).limit(1))).first() or 0
+            sample = {"user_id": user.id, "email": user.email, "request_id": request_id}
+
+            # 1. crud 함수 실행 (실행된 문장 기록)
+            for name, call in _cases(sample):
+                current[0] = name
+                try:
+                    await call(session)
+                except ValueError:
+                    pass  # 잔여 연차 부족, 대기 상태 아님 등 — 조회 문장은 이미 실행됨
+                finally:
+                    current[0] = None
+
+            # 2. 기록한 문장마다 EXPLAIN
+            for name, statement, parameters in captured:
+                if (name, statement) in seen:
+                    continue
+                seen.add((name, statement))
+                if parameters:
+                    result = await conn.exec_driver_sql("EXPLAIN " + statement, parameters)
+                else:
+                    result = await conn.exec_driver_sql(
+                        "EXPLAIN " + statement, execution_options={"no_parameters": True}
+                    )
+                for row in result.mappings().all():
+                    table = row["table"]
+                    # 파생 테이블(<derived2> 등)과 테이블이 없는 계획(Impossible WHERE 등)은 제외
+                    if table is None or table.startswith("<"):
+                        continue
+                    full_scan = row["type"] == "ALL"
+                    allowed = (name.split("(")[0], table) in ALLOWED_FULL_SCANS
+                    if full_scan and not allowed:
+                        failures += 1
+                        label = "FULL SCAN"
+                    elif full_scan:
+                        label = "allowed"
+                    else:
+                        label = "ok"
+                    if verbose or label != "ok":
+                        print(
+                            f"[{label}] {name}: table={table} type={row['type']} "
+                            f"key={row['key']} possible_keys={row['possible_keys']} rows={row['rows']}"
+                        )
+                        if label == "FULL SCAN":
+                            print(f"    {' '.join(statement.split())}")
+
+            await conn.rollback()
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _capture)
+        await engine.dispose()
+
+    print(f"{len(seen)}개 문장 점검, 전체 스캔 {failures}건")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="crud 쿼리가 인덱스를 사용하는지 EXPLAIN으로 점검합니다.")
+    parser.add_argument("--verbose", action="store_true", help="모든 문장의 실행 계획 출력")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.verbose)))
@@ -0,0 +1,146 @@
+"""
+스키마 마이그레이션 실행 명령
+
+mysql-settings/migrations/의 `NNN_이름.sql` 파일을 번호 순서대로 적용하고,
+적용한 버전을 schema_migration 테이블에 기록합니다. (이미 적용된 버전은 건너뜀)
+- 새 DB는 init.sql이 최신 스키마와 함께 모든 버전을 적용된 것으로 기록합니다.
+- schema_migration이 없던 기존 DB는 --baseline으로 이미 수동 적용한 버전까지 기록만 합니다.
+- MySQL의 DDL은 문장마다 자동 commit되므로, 파일 도중 실패하면 버전이 기록되지 않습니다.
+  원인을 고친 뒤(이미 반영된 문장은 직접 되돌리거나 정리) 다시 실행하세요.
+
+사용법:
+    python -m db.migrate                  # 미적용 마이그레이션 모두 적용
+    python -m db.migrate --status         # 버전별 적용 여부만 출력
+    python -m db.migrate --baseline 008   # 008까지는 적용된 것으로 기록만 하고 이후 버전 적용
+"""
+import argparse
+import asyncio
+import re
+import time
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import text
+
+from db.database import engine
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent.parent / "mysql-settings" / "migrations"
+_FILE_PATTERN = re.compile(r"(\d{3})_\w+\.sql")
+
+CREATE_MIGRATION_TABLE = """
+CREATE TABLE IF NOT EXISTS schema_migration (
+    version VARCHAR(10) PRIMARY KEY COMMENT '마이그레이션 버전 (파일명 앞 번호)',
+    name VARCHAR(255) NOT NULL COMMENT '마이그레이션 파일명',
+    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP COMMENT '적용 시점'
+) COMMENT '스키마 마이그레이션 적용 이력'
+"""
+
+
+def load_migrations(directory: Path = MIGRATIONS_DIR) -> list[tuple[str, Path]]:
+    """(버전, 파일 경로) 목록을 버전 순으로 반환합니다. 같은 버전이 둘 이상이면 ValueError"""
+    migrations: dict[str, Path] = {}
+    for path in sorted(directory.glob("*.sql")):
+        match = _FILE_PATTERN.fullmatch(path.name)
+        if not match:
+            raise ValueError(f"마이그레이션 파일명은 NNN_이름.sql 형식이어야 합니다: {path.name}")
+        version = match.group(1)
+        if version in migrations:
+            raise ValueError(f"중복된 마이그레이션 버전 {version}: {migrations[version].name}, {path.name}")
+        migrations[version] = path
+    return sorted(migrations.items())
+
+
+def split_statements(sql: str) -> list[str]:
+    """
+    SQL 파일을 문장 단위로 나눕니다.
+    - 따옴표 밖의 `;`에서 나누고 `--` 주석은 제거
+    - `USE db;`는 건너뜀 (DATABASE_URL의 DB에 적용)
+    """
+    statements, current = [], []
+    quote = None
+    i = 0
+    while i < len(sql):
+        char = sql[i]
+        if quote:
+            current.append(char)
+            if char == "\\" and i + 1 < len(sql):
+                current.append(sql[i + 1])
+                i += 1
+            elif char == quote:
+                quote = None
+        elif char in ("'", '"', "`"):
+            quote = char
+            current.append(char)
+        elif sql.startswith("--", i):
+            newline = sql.find("\n", i)
+            i = len(sql) if newline == -1 else newline
+            continue
+        elif char == ";":
+            statements.append("".join(current).strip())
+            current = []
+        else:
+            current.append(char)
+        i += 1
+    statements.append("".join(current).strip())
+    return [
+        statement for statement in statements
+        if statement and not re.match(r"USE\s", statement, re.IGNORECASE)
+    ]
+
+
+async def main(status_only: bool, baseline: Optional[str]) -> None:
+    if engine.dialect.name != "mysql":
+        raise SystemExit(f"MySQL 전용 마이그레이션입니다. (현재 DB: {engine.dialect.name})")
+
+    migrations = load_migrations()
+    try:
+        async with engine.connect() as conn:
+            await conn.exec_driver_sql(CREATE_MIGRATION_TABLE)
+            await conn.commit()
+            applied = set((await conn.execute(text("SELECT version FROM schema_migration"))).scalars())
+
+            pending = [(version, path) for version, path in migrations if version not in applied]
+            if status_only:
+                for version, path in migrations:
+                    print(f"{version}  {'applied' if version in applied else 'pending'}  {path.name}")
+                return
+            if not pending:
+                print("적용할 마이그레이션이 없습니다.")
+                return
+
+            for version, path in pending:
+                started = time.perf_counter()
+                if baseline is not None and int(version) <= int(baseline):
+                    action = "기록만 함 (baseline)"
+                else:
+                    for statement in split_statements(path.read_text(encoding="utf-8")):
+                        # 파일 안의 DATE_FORMAT('%Y-%m') 등이 드라이버의 파라미터 치환에 걸리지 않도록 함
+                        result = await conn.exec_driver_sql(
+                            statement, execution_options={"no_parameters": True}
+                        )
+                        if result.returns_rows:
+                            for row in result.all():
+                                print(f"  {row[0]}")
+                    action = "적용"
+                await conn.execute(
+                    text("INSERT INTO schema_migration (version, name) VALUES (:version, :name)"),
+                    {"version": version, "name": path.name},
+                )
+                await conn.commit()
+                print(f"{version} {path.name}: {action} ({time.perf_counter() - started:.2f}s)")
+    finally:
+        await engine.dispose()
+
+
+def _version(value: str) -> str:
+    if not re.fullmatch(r"\d{1,3}", value):
+        raise argparse.ArgumentTypeError("숫자 버전이어야 합니다. (예: 008)")
+    return value.zfill(3)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="mysql-settings/migrations의 스키마 마이그레이션을 순서대로 적용합니다.")
+    parser.add_argument("--status", action="store_true", help="버전별 적용 여부만 출력")
+    parser.add_argument("--baseline", type=_version, help="이 버전까지는 실행하지 않고 적용된 것으로 기록")
+    args = parser.parse_args()
+    asyncio.run(main(args.status, args.baseline))
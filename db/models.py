@@ -1,5 +1,6 @@
 from typing import Optional, List
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index, UniqueConstraint
 from datetime import date, datetime, time
 
 # User 테이블에 매핑되는 클래스
@@ -23,10 +24,14 @@ class User(SQLModel, table=True):
 class LeaveBalance(SQLModel, table=True):
     # 테이블 이름을 init.sql과 맞춤
     __tablename__ = "leave_balance" 
+    __table_args__ = (
+        UniqueConstraint("user_id", name="unique_user_balance"),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     total_granted: float = Field(default=0.0)
     total_used: float = Field(default=0.0)
+    total_reserved: float = Field(default=0.0)  # 대기(pending) 중인 신청 일수
     
     user_id: int = Field(foreign_key="user.id")
     user: User = Relationship(back_populates="leave_balances")
@@ -34,6 +39,14 @@ class LeaveBalance(SQLModel, table=True):
 # LeaveRequest 테이블에 매핑
 class LeaveRequest(SQLModel, table=True):
     __tablename__ = "leave_request"
+    __table_args__ = (
+        # 기간 겹침 조회 (status IN (...) AND start_date <= :end AND end_date >= :start)
+        Index("idx_status_dates", "status", "start_date", "end_date"),
+        # 본인 신청 목록 / 기간 겹침 확인
+        Index("idx_user_start", "user_id", "start_date"),
+        # 전체 신청 목록 (최근 시작일 순)
+        Index("idx_start_date", "start_date"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     start_date: date
@@ -48,6 +61,9 @@ class LeaveRequest(SQLModel, table=True):
 # SalaryStatement 테이블에 매핑
 class SalaryStatement(SQLModel, table=True):
     __tablename__ = "salary_statement"
+    __table_args__ = (
+        UniqueConstraint("user_id", "pay_month", name="unique_user_pay_month"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     pay_month: str
@@ -63,9 +79,14 @@ class SalaryStatement(SQLModel, table=True):
 # Attendance 테이블에 매핑
 class Attendance(SQLModel, table=True):
     __tablename__ = "attendance"
+    __table_args__ = (
+        UniqueConstraint("user_id", "work_date", name="unique_user_date"),
+        # 날짜/기간별 전체 근태 조회 (ORDER BY work_date DESC, user_id)
+        Index("idx_work_date_user", "work_date", "user_id"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    work_date: date = Field(index=True)
+    work_date: date
     check_in: Optional[time] = None
     check_out: Optional[time] = None
     status: str = Field(default="present")  # present, late, early_leave, absent
@@ -74,4 +95,50 @@ class Attendance(SQLModel, table=True):
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
     user_id: int = Field(foreign_key="user.id", index=True)
-    user: User = Relationship(back_populates="attendances")
\ No newline at end of file
+    user: User = Relationship(back_populates="attendances")
+
+# AttendanceMonthly 테이블에 매핑 (사용자별·월별 근태 집계, attendance 변경 시 함께 갱신)
+class AttendanceMonthly(SQLModel, table=True):
+    __tablename__ = "attendance_monthly"
+    __table_args__ = (
+        UniqueConstraint("user_id", "month", name="unique_user_month"),
+        # 전체 재직자 월 범위 통계
+        Index("idx_month_user", "month", "user_id"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    user_id: int = Field(foreign_key="user.id")
+    month: str  # "YYYY-MM"
+    total_days: int = Field(default=0)
+    present_days: int = Field(default=0)
+    late_days: int = Field(default=0)
+    early_leave_days: int = Field(default=0)
+    absent_days: int = Field(default=0)
+
+
+# JobRun 테이블에 매핑 (스케줄러 작업 실행 이력)
+class JobRun(SQLModel, table=True):
+    __tablename__ = "job_run"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    job_name: str = Field(index=True)
+    started_at: datetime
+    finished_at: datetime
+    duration_ms: float
+    rows_affected: int = Field(default=0)
+    status: str  # success, failed
+    detail: Optional[str] = None
+
+
+# LeaveAccrual 테이블에 매핑 (월별 연차 자동 부여 내역, 같은 달 중복 부여 방지)
+class LeaveAccrual(SQLModel, table=True):
+    __tablename__ = "leave_accrual"
+    __table_args__ = (
+        UniqueConstraint("user_id", "month", name="unique_user_accrual_month"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    user_id: int = Field(foreign_key="user.id")
+    month: str  # "YYYY-MM"
+    days: float
+    created_at: datetime = Field(default_factory=datetime.utcnow)
@@ -0,0 +1,131 @@
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Optional
+
+from fastapi import HTTPException, Query, Response, status
+from sqlalchemy import and_, or_
+
+from core.config import settings
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class PageParams:
+    """
+    커서(keyset) 페이지네이션 요청 정보.
+    crud 함수가 조회 후 next_cursor를 채워 줍니다. (다음 페이지가 없으면 None)
+    """
+    def __init__(self, limit: int, cursor: Optional[str] = None):
+        self.limit = limit
+        self.cursor = cursor
+        self.next_cursor: Optional[str] = None
+
+
+def page_params(
+    limit: int = Query(
+        settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX, description="페이지 크기"
+    ),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 헤더 값"),
+) -> PageParams:
+    """목록 API 공통 페이지네이션 Dependency"""
+    return PageParams(limit=limit, cursor=cursor)
+
+
+def set_next_cursor(response: Response, page: PageParams) -> None:
+    """다음 페이지가 있으면 X-Next-Cursor 응답 헤더를 설정합니다."""
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+
+
+def _json_default(value: Any):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"Unsupported cursor value: {value!r}")
+
+
+def encode_cursor(values: list) -> str:
+    raw = json.dumps(values, default=_json_default, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _python_type(column) -> type:
+    """컬럼의 파이썬 타입. AutoString처럼 python_type이 없는 문자열 타입은 str로 취급"""
+    try:
+        return column.type.python_type
+    except NotImplementedError:
+        return str
+
+
+def decode_cursor(cursor: str, order: list) -> list:
+    """
+    커서를 정렬 컬럼 타입에 맞는 값 목록으로 복원합니다.
+    형식이 잘못된 커서는 400을 반환합니다.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(order):
+            raise ValueError("cursor length mismatch")
+        decoded = []
+        for (column, _), value in zip(order, values):
+            python_type = _python_type(column)
+            if python_type is date:
+                value = date.fromisoformat(value)
+            elif python_type is datetime:
+                value = datetime.fromisoformat(value)
+            elif python_type is str:
+                if not isinstance(value, str):
+                    raise TypeError("cursor value must be a string")
+            elif not isinstance(value, python_type):
+                value = python_type(value)
+            decoded.append(value)
+        return decoded
+    except (ValueError, TypeError, json.JSONDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+def _after(order: list, values: list):
+    """
+    정렬 순서상 커서 값 다음에 오는 행 조건.
+    (a desc, b asc) 기준이면: a < va OR (a = va AND b > vb)
+    """
+    clauses = []
+    for i, (column, descending) in enumerate(order):
+        equal_prefix = [prev_column == prev_value for (prev_column, _), prev_value in zip(order[:i], values[:i])]
+        compare = column < values[i] if descending else column > values[i]
+        clauses.append(and_(*equal_prefix, compare))
+    return or_(*clauses)
+
+
+def apply(statement, order: list, page: Optional[PageParams]):
+    """
+    정렬을 적용하고, page가 주어지면 커서 이후 limit+1건만 조회하도록 제한합니다.
+    order: [(컬럼, 내림차순 여부), ...] — 마지막 컬럼까지 합쳐서 유일해야 함
+    """
+    statement = statement.order_by(
+        *[column.desc() if descending else column.asc() for column, descending in order]
+    )
+    if page is None:
+        return statement
+    if page.cursor:
+        statement = statement.where(_after(order, decode_cursor(page.cursor, order)))
+    # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+    return statement.limit(page.limit + 1)
+
+
+def finish(rows: list, order: list, page: Optional[PageParams]) -> list:
+    """limit+1번째 행이 있으면 잘라내고 page.next_cursor를 채웁니다."""
+    if page is None:
+        return rows
+    rows = list(rows)
+    if len(rows) > page.limit:
+        rows = rows[:page.limit]
+        last = rows[-1]
+        page.next_cursor = encode_cursor([getattr(last, column.key) for column, _ in order])
+    else:
+        page.next_cursor = None
+    return rows
@@ -0,0 +1,42 @@
+"""
+월별 근태 집계(attendance_monthly) 재생성 명령
+
+사용법:
+    python -m db.rebuild_attendance_monthly                      # 전체 기간
+    python -m db.rebuild_attendance_monthly --from 2025-01 --to 2025-06
+    python -m db.rebuild_attendance_monthly --user-id 3
+"""
+import argparse
+import asyncio
+import re
+import time
+
+from db import crud
+from db.database import async_session_factory, engine
+
+
+def _month(value: str) -> str:
+    if not re.fullmatch(r"\d{4}-(0[1-9]|1[0-2])", value):
+        raise argparse.ArgumentTypeError("YYYY-MM 형식이어야 합니다.")
+    return value
+
+
+async def main(start_month, end_month, user_id) -> None:
+    started = time.perf_counter()
+    try:
+        async with async_session_factory() as session:
+            rows = await crud.rebuild_attendance_monthly(
+                session, start_month=start_month, end_month=end_month, user_id=user_id
+            )
+    finally:
+        await engine.dispose()
+    print(f"attendance_monthly 재생성 완료: {rows}행 ({time.perf_counter() - started:.2f}s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="attendance 원본으로 월별 근태 집계를 다시 만듭니다.")
+    parser.add_argument("--from", dest="start_month", type=_month, help="시작 월 (YYYY-MM)")
+    parser.add_argument("--to", dest="end_month", type=_month, help="종료 월 (YYYY-MM)")
+    parser.add_argument("--user-id", type=int, help="특정 사용자만 재생성")
+    args = parser.parse_args()
+    asyncio.run(main(args.start_month, args.end_month, args.user_id))
@@ -1,9 +1,17 @@
-from fastapi import FastAPI
+import asyncio
+import time
+
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 # 라우터 임포트
-from api import auth, users, leave, salary, attendance
+from api import auth, users, leave, salary, attendance, health, metrics as metrics_api
+from core.config import settings
+from db.database import engine
 from scheduler.jobs import scheduler
+from scheduler.leader import run_with_leader_lock
+from utils import checkin_batcher, metrics, payslip_jobs
 
 app = FastAPI(
     title="ERP API",
@@ -21,25 +29,84 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # 목록 API 다음 페이지 커서
 )
 
+# 급여명세서 업로드 크기 제한
+# Content-Length가 한도를 넘으면 본문을 읽기(스풀링) 전에 바로 거절
+@app.middleware("http")
+async def limit_payslip_upload_size(request: Request, call_next):
+    if request.method == "POST" and request.url.path.startswith("/salary/upload-pdf"):
+        limit = (
+            settings.PAYSLIP_BULK_MAX_UPLOAD_BYTES
+            if request.url.path.endswith("/bulk")
+            else settings.PAYSLIP_MAX_UPLOAD_BYTES
+        )
+        content_length = request.headers.get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > limit:
+            return JSONResponse(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                content={"detail": "업로드 파일이 허용된 크기를 초과했습니다."},
+            )
+    return await call_next(request)
+
+# 요청 지표 수집 (라우트별 처리 시간/상태 코드, 요청당 SQL 수/DB 시간 → GET /metrics)
+# 가장 바깥 미들웨어로 등록해 다른 미들웨어가 거절한 요청도 집계
+# (스트리밍 응답은 본문 전송 전 응답 헤더까지의 시간)
+if settings.METRICS_ENABLED:
+    metrics.instrument_engine(engine.sync_engine)
+
+    @app.middleware("http")
+    async def collect_request_metrics(request: Request, call_next):
+        db_stats = metrics.start_request()
+        started = time.perf_counter()
+        status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+            return response
+        finally:
+            # 경로 파라미터가 채워지기 전의 라우트 경로로 묶음 (예: /leave/admin/approve/{request_id})
+            route = request.scope.get("route")
+            metrics.observe_request(
+                request.method,
+                route.path if route is not None else metrics.UNMATCHED_ROUTE,
+                status_code,
+                time.perf_counter() - started,
+                db_stats,
+            )
+
 # --- 라우터 포함 ---
 app.include_router(auth.router)
 app.include_router(users.router)
 app.include_router(leave.router)
 app.include_router(salary.router)
 app.include_router(attendance.router)
+app.include_router(health.router)
+app.include_router(metrics_api.router)
 
 # --- 스케줄러 시작/종료 이벤트 ---
+# 워커가 여러 개여도 리더 잠금을 잡은 하나에서만 작업이 실행됨
+# (SCHEDULER_ENABLED=false로 끄고 python -m scheduler로 분리 실행 가능)
+_scheduler_task = None
+
 @app.on_event("startup")
 async def startup_event():
-    scheduler.start()
-    print("Scheduler started...")
+    global _scheduler_task
+    if settings.SCHEDULER_ENABLED:
+        _scheduler_task = asyncio.create_task(run_with_leader_lock(scheduler))
+        print("Scheduler started...")
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    scheduler.shutdown()
-    print("Scheduler shut down...")
+    if _scheduler_task is not None:
+        _scheduler_task.cancel()
+        await asyncio.gather(_scheduler_task, return_exceptions=True)
+        if scheduler.running:
+            scheduler.shutdown()
+        print("Scheduler shut down...")
+    await checkin_batcher.drain()
+    payslip_jobs.shutdown()
 
 # --- 기본 루트 ---
 @app.get("/")
@@ -17,7 +17,9 @@ CREATE TABLE leave_balance (
     user_id INT NOT NULL COMMENT '회원 ID',
     total_granted FLOAT DEFAULT 0.0 COMMENT '총 부여된 연차',
     total_used FLOAT DEFAULT 0.0 COMMENT '총 사용한 연차',
-    FOREIGN KEY (user_id) REFERENCES user(id)
+    total_reserved FLOAT DEFAULT 0.0 COMMENT '승인 대기 중인 신청 연차',
+    FOREIGN KEY (user_id) REFERENCES user(id),
+    UNIQUE KEY unique_user_balance (user_id)
 ) COMMENT '연차 현황';
 
 -- 3. 연차 신청 내역 (LeaveRequest) 테이블
@@ -29,7 +31,10 @@ CREATE TABLE leave_request (
     days_used FLOAT NOT NULL COMMENT '신청 일수 (0.5, 1.0 등)',
     reason TEXT COMMENT '신청 사유',
     status VARCHAR(20) DEFAULT 'pending' COMMENT '상태 (pending, approved, rejected)',
-    FOREIGN KEY (user_id) REFERENCES user(id)
+    FOREIGN KEY (user_id) REFERENCES user(id),
+    INDEX idx_status_dates (status, start_date, end_date),
+    INDEX idx_user_start (user_id, start_date),
+    INDEX idx_start_date (start_date)
 ) COMMENT '연차 신청 내역';
 
 -- 4. 급여 명세서 (SalaryStatement) 테이블
@@ -42,7 +47,8 @@ CREATE TABLE salary_statement (
     deductions INT DEFAULT 0 COMMENT '공제액 (4대보험, 소득세 등)',
     net_pay INT NOT NULL COMMENT '실수령액',
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP COMMENT '사용자가 입력한 시점',
-    FOREIGN KEY (user_id) REFERENCES user(id)
+    FOREIGN KEY (user_id) REFERENCES user(id),
+    UNIQUE KEY unique_user_pay_month (user_id, pay_month)
 ) COMMENT '급여 명세서';
 
 -- 5. 근태 (Attendance) 테이블
@@ -58,5 +64,65 @@ CREATE TABLE attendance (
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정 시점',
     FOREIGN KEY (user_id) REFERENCES user(id),
     INDEX idx_user_date (user_id, work_date),
+    INDEX idx_work_date_user (work_date, user_id),
     UNIQUE KEY unique_user_date (user_id, work_date)
-) COMMENT '근태 기록';
\ No newline at end of file
+) COMMENT '근태 기록';
+
+-- 6. 월별 근태 집계 (AttendanceMonthly) 테이블
+CREATE TABLE attendance_monthly (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    user_id INT NOT NULL,
+    month VARCHAR(7) NOT NULL COMMENT '집계 연월 (예: 2025-10)',
+    total_days INT NOT NULL DEFAULT 0 COMMENT '전체 기록 일수',
+    present_days INT NOT NULL DEFAULT 0 COMMENT '정상 출근 일수',
+    late_days INT NOT NULL DEFAULT 0 COMMENT '지각 일수',
+    early_leave_days INT NOT NULL DEFAULT 0 COMMENT '조퇴 일수',
+    absent_days INT NOT NULL DEFAULT 0 COMMENT '결근 일수',
+    FOREIGN KEY (user_id) REFERENCES user(id),
+    UNIQUE KEY unique_user_month (user_id, month),
+    INDEX idx_month_user (month, user_id)
+) COMMENT '월별 근태 집계';
+
+-- 7. 스케줄러 작업 실행 이력 (JobRun) 테이블
+CREATE TABLE job_run (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    job_name VARCHAR(100) NOT NULL COMMENT '작업 이름',
+    started_at DATETIME(6) NOT NULL COMMENT '시작 시각 (UTC)',
+    finished_at DATETIME(6) NOT NULL COMMENT '종료 시각 (UTC)',
+    duration_ms DOUBLE NOT NULL COMMENT '실행 시간(ms)',
+    rows_affected INT NOT NULL DEFAULT 0 COMMENT '변경된 행 수',
+    status VARCHAR(20) NOT NULL COMMENT '결과 (success, failed)',
+    detail TEXT COMMENT '오류 내용 등',
+    INDEX idx_job_name (job_name, started_at)
+) COMMENT '스케줄러 작업 실행 이력';
+
+-- 8. 월별 연차 자동 부여 내역 (LeaveAccrual) 테이블
+CREATE TABLE leave_accrual (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    user_id INT NOT NULL,
+    month VARCHAR(7) NOT NULL COMMENT '부여 연월 (예: 2025-10)',
+    days FLOAT NOT NULL COMMENT '부여 일수',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP COMMENT '부여 시점',
+    FOREIGN KEY (user_id) REFERENCES user(id),
+    UNIQUE KEY unique_user_accrual_month (user_id, month)
+) COMMENT '월별 연차 자동 부여 내역';
+
+-- 9. 스키마 마이그레이션 적용 이력 (python -m db.migrate)
+-- 이 파일은 최신 스키마이므로 mysql-settings/migrations/의 모든 버전을 적용된 것으로 기록합니다.
+-- (새 마이그레이션을 추가하면 여기에도 같은 변경과 버전을 함께 추가)
+CREATE TABLE schema_migration (
+    version VARCHAR(10) PRIMARY KEY COMMENT '마이그레이션 버전 (파일명 앞 번호)',
+    name VARCHAR(255) NOT NULL COMMENT '마이그레이션 파일명',
+    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP COMMENT '적용 시점'
+) COMMENT '스키마 마이그레이션 적용 이력';
+
+INSERT INTO schema_migration (version, name) VALUES
+    ('001', '001_add_role.sql'),
+    ('002', '002_add_attendance.sql'),
+    ('003', '003_add_salary_unique.sql'),
+    ('004', '004_add_attendance_monthly.sql'),
+    ('005', '005_add_job_run.sql'),
+    ('006', '006_add_leave_accrual.sql'),
+    ('007', '007_add_leave_reserved.sql'),
+    ('008', '008_add_leave_calendar_index.sql'),
+    ('009', '009_add_hot_path_indexes.sql');
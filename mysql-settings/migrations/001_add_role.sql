@@ -1,5 +1,5 @@
 -- User 테이블에 role 컬럼 추가
--- 실행 방법: mysql -u root -p erp_db < migration_add_role.sql
+-- 실행 방법: python -m db.migrate (직접 실행 시: mysql -u root -p erp_db < 001_add_role.sql)
 
 USE erp_db;
 
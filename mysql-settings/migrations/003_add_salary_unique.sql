@@ -0,0 +1,17 @@
+-- salary_statement에 (user_id, pay_month) 유니크 인덱스 추가
+-- 실행 방법: python -m db.migrate (직접 실행 시: mysql -u root -p erp_db < 003_add_salary_unique.sql)
+
+USE erp_db;
+
+-- 1. 기존 중복 데이터 정리 (같은 사용자/지급월 중 가장 최근에 입력된 레코드만 유지)
+DELETE s1 FROM salary_statement s1
+JOIN salary_statement s2
+  ON s1.user_id = s2.user_id
+ AND s1.pay_month = s2.pay_month
+ AND s1.id < s2.id;
+
+-- 2. 유니크 인덱스 추가 (중복 확인과 사용자별 조회 모두 이 인덱스를 사용)
+ALTER TABLE salary_statement
+ADD UNIQUE KEY unique_user_pay_month (user_id, pay_month);
+
+SELECT '마이그레이션 완료: salary_statement 유니크 인덱스가 추가되었습니다.' AS message;
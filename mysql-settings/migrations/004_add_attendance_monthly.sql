@@ -0,0 +1,36 @@
+-- 월별 근태 집계(attendance_monthly) 테이블 추가 및 기존 기록 백필
+-- 실행 방법: python -m db.migrate (직접 실행 시: mysql -u root -p erp_db < 004_add_attendance_monthly.sql)
+-- (이후 집계가 어긋나면 python -m db.rebuild_attendance_monthly 로 다시 만들 수 있습니다)
+
+USE erp_db;
+
+-- 1. 테이블 생성
+CREATE TABLE IF NOT EXISTS attendance_monthly (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    user_id INT NOT NULL,
+    month VARCHAR(7) NOT NULL COMMENT '집계 연월 (예: 2025-10)',
+    total_days INT NOT NULL DEFAULT 0 COMMENT '전체 기록 일수',
+    present_days INT NOT NULL DEFAULT 0 COMMENT '정상 출근 일수',
+    late_days INT NOT NULL DEFAULT 0 COMMENT '지각 일수',
+    early_leave_days INT NOT NULL DEFAULT 0 COMMENT '조퇴 일수',
+    absent_days INT NOT NULL DEFAULT 0 COMMENT '결근 일수',
+    FOREIGN KEY (user_id) REFERENCES user(id),
+    UNIQUE KEY unique_user_month (user_id, month)
+) COMMENT '월별 근태 집계';
+
+-- 2. 기존 근태 기록으로 백필
+DELETE FROM attendance_monthly;
+INSERT INTO attendance_monthly
+    (user_id, month, total_days, present_days, late_days, early_leave_days, absent_days)
+SELECT
+    user_id,
+    DATE_FORMAT(work_date, '%Y-%m'),
+    COUNT(*),
+    SUM(status = 'present'),
+    SUM(status = 'late'),
+    SUM(status = 'early_leave'),
+    SUM(status = 'absent')
+FROM attendance
+GROUP BY user_id, DATE_FORMAT(work_date, '%Y-%m');
+
+SELECT '마이그레이션 완료: attendance_monthly 테이블이 추가되었습니다.' AS message;
@@ -0,0 +1,18 @@
+-- 스케줄러 작업 실행 이력(job_run) 테이블 추가
+-- 실행 방법: python -m db.migrate (직접 실행 시: mysql -u root -p erp_db < 005_add_job_run.sql)
+
+USE erp_db;
+
+CREATE TABLE IF NOT EXISTS job_run (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    job_name VARCHAR(100) NOT NULL COMMENT '작업 이름',
+    started_at DATETIME(6) NOT NULL COMMENT '시작 시각 (UTC)',
+    finished_at DATETIME(6) NOT NULL COMMENT '종료 시각 (UTC)',
+    duration_ms DOUBLE NOT NULL COMMENT '실행 시간(ms)',
+    rows_affected INT NOT NULL DEFAULT 0 COMMENT '변경된 행 수',
+    status VARCHAR(20) NOT NULL COMMENT '결과 (success, failed)',
+    detail TEXT COMMENT '오류 내용 등',
+    INDEX idx_job_name (job_name, started_at)
+) COMMENT '스케줄러 작업 실행 이력';
+
+SELECT '마이그레이션 완료: job_run 테이블이 추가되었습니다.' AS message;
@@ -0,0 +1,17 @@
+-- 월별 연차 자동 부여 내역(leave_accrual) 테이블 추가
+-- 실행 방법: python -m db.migrate (직접 실행 시: mysql -u root -p erp_db < 006_add_leave_accrual.sql)
+-- 이 테이블이 생긴 이후로는 같은 달에 연차 부여 작업이 여러 번 실행되어도 한 번만 부여됩니다.
+
+USE erp_db;
+
+CREATE TABLE IF NOT EXISTS leave_accrual (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    user_id INT NOT NULL,
+    month VARCHAR(7) NOT NULL COMMENT '부여 연월 (예: 2025-10)',
+    days FLOAT NOT NULL COMMENT '부여 일수',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP COMMENT '부여 시점',
+    FOREIGN KEY (user_id) REFERENCES user(id),
+    UNIQUE KEY unique_user_accrual_month (user_id, month)
+) COMMENT '월별 연차 자동 부여 내역';
+
+SELECT '마이그레이션 완료: leave_accrual 테이블이 추가되었습니다.' AS message;
@@ -0,0 +1,20 @@
+-- leave_balance에 승인 대기 일수(total_reserved) 컬럼 추가
+-- 실행 방법: python -m db.migrate (직접 실행 시: mysql -u root -p erp_db < 007_add_leave_reserved.sql)
+
+USE erp_db;
+
+-- 1. 컬럼 추가
+ALTER TABLE leave_balance
+ADD COLUMN total_reserved FLOAT DEFAULT 0.0 COMMENT '승인 대기 중인 신청 연차' AFTER total_used;
+
+-- 2. 현재 pending 상태인 신청 일수로 백필
+UPDATE leave_balance lb
+JOIN (
+    SELECT user_id, SUM(days_used) AS days
+    FROM leave_request
+    WHERE status = 'pending'
+    GROUP BY user_id
+) pending ON pending.user_id = lb.user_id
+SET lb.total_reserved = pending.days;
+
+SELECT '마이그레이션 완료: leave_balance.total_reserved 컬럼이 추가되었습니다.' AS message;
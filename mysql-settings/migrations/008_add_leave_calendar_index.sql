@@ -0,0 +1,9 @@
+-- leave_request에 (status, start_date, end_date) 인덱스 추가 (팀 연차 캘린더, 신청 기간 겹침 확인용)
+-- 실행 방법: python -m db.migrate (직접 실행 시: mysql -u root -p erp_db < 008_add_leave_calendar_index.sql)
+
+USE erp_db;
+
+ALTER TABLE leave_request
+ADD INDEX idx_status_dates (status, start_date, end_date);
+
+SELECT '마이그레이션 완료: leave_request 기간 인덱스가 추가되었습니다.' AS message;
@@ -0,0 +1,30 @@
+-- crud 조회 경로에 필요한 인덱스 추가 (python -m db.explain_check 로 실행 계획 확인)
+-- 실행 방법: python -m db.migrate (직접 실행 시: mysql -u root -p erp_db < 009_add_hot_path_indexes.sql)
+
+USE erp_db;
+
+-- 1. leave_balance: 사용자당 1행 보장 (중복이 있으면 가장 먼저 만들어진 행만 유지)
+DELETE b1 FROM leave_balance b1
+JOIN leave_balance b2
+  ON b1.user_id = b2.user_id
+ AND b1.id > b2.id;
+
+ALTER TABLE leave_balance
+ADD UNIQUE KEY unique_user_balance (user_id);
+
+-- 2. leave_request
+--    - 본인 신청 목록(user_id = ? ORDER BY start_date DESC), 기간 겹침 확인
+--    - 전체 신청 목록(ORDER BY start_date DESC, status 필터는 idx_status_dates 사용)
+ALTER TABLE leave_request
+ADD INDEX idx_user_start (user_id, start_date),
+ADD INDEX idx_start_date (start_date);
+
+-- 3. attendance: 날짜/기간별 전체 근태 조회(ORDER BY work_date DESC, user_id), 기간 통계
+ALTER TABLE attendance
+ADD INDEX idx_work_date_user (work_date, user_id);
+
+-- 4. attendance_monthly: 전체 재직자 월 범위 통계
+ALTER TABLE attendance_monthly
+ADD INDEX idx_month_user (month, user_id);
+
+SELECT '마이그레이션 완료: 조회용 인덱스가 추가되었습니다.' AS message;
@@ -0,0 +1,41 @@
+"""
+스케줄러 단독 실행
+
+uvicorn 워커와 분리된 프로세스에서 스케줄러 작업만 실행합니다.
+여러 개를 띄워도 리더 잠금을 잡은 하나만 작업을 실행하고, 나머지는 대기하다가
+리더가 종료되면 이어받습니다.
+
+사용법:
+    SCHEDULER_ENABLED=false uvicorn main:app --workers 4   # API 서버에서는 끄고
+    python -m scheduler                                     # 별도 프로세스로 실행
+"""
+import asyncio
+import logging
+import signal
+
+from db.database import engine
+from scheduler.jobs import scheduler
+from scheduler.leader import run_with_leader_lock
+
+
+async def main() -> None:
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    leader_task = asyncio.create_task(run_with_leader_lock(scheduler))
+    print("Scheduler process started...")
+    await stop.wait()
+
+    leader_task.cancel()
+    await asyncio.gather(leader_task, return_exceptions=True)
+    if scheduler.running:
+        scheduler.shutdown()
+    await engine.dispose()
+    print("Scheduler process shut down...")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    asyncio.run(main())
@@ -1,55 +1,233 @@
 import logging
+import time
+from typing import Optional
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from sqlalchemy import exists, func, insert
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import select, update
 from sqlmodel.ext.asyncio.session import AsyncSession
+from core.config import settings
 from db.database import engine # 메인 엔진을 공유
-from db.models import User, LeaveBalance
-from datetime import date
+from db.models import (
+    User, LeaveBalance, LeaveRequest, LeaveAccrual, Attendance, AttendanceMonthly, JobRun
+)
+from datetime import date, datetime
 
 logger = logging.getLogger(__name__)
 
-async def add_monthly_leave_job():
+# 월별 자동 부여 연차 일수
+MONTHLY_LEAVE_DAYS = 1.0
+
+async def add_monthly_leave_job(accrual_date: Optional[date] = None) -> int:
     """
     매월 1일, 1년 미만 재직자에게 연차 1일 부여 (예시 로직)
+    - user.id 구간(JOB_CHUNK_SIZE)마다 한 트랜잭션에서
+      1) 이번 달 부여 내역이 없는 대상자 ID 조회
+      2) 그 사용자들의 (user_id, 월) 부여 내역을 leave_accrual에 multi-row INSERT
+      3) 같은 사용자들의 leave_balance에 UPDATE ... WHERE user_id IN (...)으로 반영
+    - 이미 그 달의 부여 내역이 있는 사용자는 건너뛰므로, 재시작이나 여러 워커에서
+      다시 실행되어도 중복 부여되지 않음 (동시 실행과 겹치면 구간을 다시 조회해 재시도)
+
+    Returns:
+        연차를 부여한 사용자 수
     """
     logger.info("Starting monthly leave job...")
-    
-    # 스케줄러는 별도 세션 필요
-    async with AsyncSession(engine) as session:
+    today = accrual_date or date.today()
+    month = f"{today.year:04d}-{today.month:02d}"
+    # 1년 미만 재직 기준일 (2월 29일은 2월 28일로)
+    try:
+        one_year_ago = today.replace(year=today.year - 1)
+    except ValueError:
+        one_year_ago = today.replace(year=today.year - 1, day=28)
+    started_at, started = datetime.utcnow(), time.perf_counter()
+
+    granted = 0
+    try:
+        async with AsyncSession(engine) as session:
+            min_id, max_id = (await session.exec(select(func.min(User.id), func.max(User.id)))).one()
+
+            for low in range(min_id or 0, (max_id or -1) + 1, settings.JOB_CHUNK_SIZE):
+                high = low + settings.JOB_CHUNK_SIZE - 1
+
+                async def grant_chunk() -> int:
+                    # 1. 1년 미만 재직자(is_active=True) 중 이번 달 부여 내역이 없는 사용자
+                    targets = select(User.id).where(
+                        User.id.between(low, high),
+                        User.is_active == True,
+                        User.hire_date > one_year_ago,
+                        exists().where(LeaveBalance.user_id == User.id),
+                        ~exists().where(
+                            LeaveAccrual.user_id == User.id,
+                            LeaveAccrual.month == month,
+                        ),
+                    )
+                    user_ids = list((await session.exec(targets)).all())
+                    if not user_ids:
+                        return 0
+
+                    # 2. 부여 내역 기록 (다른 인스턴스가 먼저 기록했다면 유니크 키 충돌)
+                    now = datetime.utcnow()
+                    await session.execute(insert(LeaveAccrual).values([
+                        {"user_id": user_id, "month": month, "days": MONTHLY_LEAVE_DAYS, "created_at": now}
+                        for user_id in user_ids
+                    ]))
+
+                    # 3. 방금 기록한 사용자들의 연차 증가
+                    await session.execute(
+                        update(LeaveBalance)
+                        .where(LeaveBalance.user_id.in_(user_ids))
+                        .values(total_granted=LeaveBalance.total_granted + MONTHLY_LEAVE_DAYS)
+                    )
+                    return len(user_ids)
+
+                granted += await _run_chunk(session, grant_chunk)
+
+        if granted == 0:
+            logger.info("No users to update for monthly leave.")
+        else:
+            logger.info(f"Successfully added leave for {granted} users.")
+        await _record_job_run("monthly_leave", started_at, started, granted, "success", month)
+        return granted
+
+    except Exception as e:
+        logger.error(f"Error in monthly leave job: {e}")
+        await _record_job_run("monthly_leave", started_at, started, granted, "failed", str(e))
+        raise
+
+
+# 구간 처리 중 동시 실행과 유니크 키가 겹쳤을 때 구간을 다시 조회해 시도하는 최대 횟수
+JOB_CHUNK_ATTEMPTS = 3
+
+async def _run_chunk(session: AsyncSession, chunk_fn) -> int:
+    """
+    구간 하나를 한 트랜잭션으로 처리하고 commit합니다.
+    유니크 키 충돌(IntegrityError)이면 롤백 후 다시 시도하고, 계속 실패하면 예외를 올립니다.
+    """
+    for attempt in range(JOB_CHUNK_ATTEMPTS):
         try:
-            today = date.today()
-            
-            # 1. 1년 미만 재직자(is_active=True) 찾기
-            one_year_ago = today.replace(year=today.year - 1)
-            
-            stmt = select(User).where(
-                User.is_active == True,
-                User.hire_date > one_year_ago 
-            )
-            users_to_update = await session.exec(stmt)
-            user_ids = [user.id for user in users_to_update]
-
-            if not user_ids:
-                logger.info("No users to update for monthly leave.")
-                return
-
-            # 2. 해당 유저들의 연차 1일 증가
-            update_stmt = update(LeaveBalance)\
-                .where(LeaveBalance.user_id.in_(user_ids))\
-                .values(total_granted=LeaveBalance.total_granted + 1.0)
-                
-            await session.exec(update_stmt)
+            rows = await chunk_fn()
             await session.commit()
-            
-            logger.info(f"Successfully added leave for {len(user_ids)} users.")
-            
-        except Exception as e:
+            return rows
+        except IntegrityError:
             await session.rollback()
-            logger.error(f"Error in monthly leave job: {e}")
-        
+            if attempt == JOB_CHUNK_ATTEMPTS - 1:
+                raise
+            logger.warning("Chunk conflicted with a concurrent run; retrying.")
+
+
+async def _record_job_run(
+    job_name: str, started_at: datetime, started: float, rows_affected: int,
+    status: str, detail: Optional[str] = None
+) -> None:
+    """작업 실행 결과(처리 행 수, 소요 시간)를 job_run 테이블에 남깁니다."""
+    try:
+        async with AsyncSession(engine) as session:
+            session.add(JobRun(
+                job_name=job_name,
+                started_at=started_at,
+                finished_at=datetime.utcnow(),
+                duration_ms=round((time.perf_counter() - started) * 1000, 3),
+                rows_affected=rows_affected,
+                status=status,
+                detail=detail,
+            ))
+            await session.commit()
+    except Exception as e:
+        logger.error(f"Failed to record job run ({job_name}): {e}")
+
+
+# 자동 결근 처리 시 비고
+AUTO_ABSENT_NOTE = "자동 결근 처리"
+
+async def mark_absent_job(target_date: Optional[date] = None) -> int:
+    """
+    근무일 종료 후, 재직자 중 해당 날짜에 근태 기록이 없는 사용자를 결근(absent)으로 기록합니다.
+    - 입사일 이전이거나 승인된 연차 기간인 사용자는 제외
+    - user.id 구간(JOB_CHUNK_SIZE)마다 한 트랜잭션에서 대상자 ID 조회(NOT EXISTS) →
+      결근 multi-row INSERT → 같은 사용자 목록으로 월별 집계 upsert
+    - 이미 기록이 있는 사용자는 건너뛰므로 다시 실행해도 중복 기록되지 않음
+      (조회 후 체크인 등과 겹치면 구간을 다시 조회해 재시도)
+
+    Returns:
+        새로 기록한 결근 행 수
+    """
+    target_date = target_date or date.today()
+    month = f"{target_date.year:04d}-{target_date.month:02d}"
+    started_at, started = datetime.utcnow(), time.perf_counter()
+    logger.info(f"Starting absence job for {target_date}...")
+
+    inserted = 0
+    try:
+        async with AsyncSession(engine) as session:
+            min_id, max_id = (await session.exec(select(func.min(User.id), func.max(User.id)))).one()
+
+            for low in range(min_id or 0, (max_id or -1) + 1, settings.JOB_CHUNK_SIZE):
+                high = low + settings.JOB_CHUNK_SIZE - 1
+
+                async def absent_chunk() -> int:
+                    # 1. 기록 없는 재직자 조회
+                    absentees = select(User.id).where(
+                        User.id.between(low, high),
+                        User.is_active == True,
+                        User.hire_date <= target_date,
+                        ~exists().where(
+                            Attendance.user_id == User.id,
+                            Attendance.work_date == target_date,
+                        ),
+                        ~exists().where(
+                            LeaveRequest.user_id == User.id,
+                            LeaveRequest.status == "approved",
+                            LeaveRequest.start_date <= target_date,
+                            LeaveRequest.end_date >= target_date,
+                        ),
+                    )
+                    user_ids = list((await session.exec(absentees)).all())
+                    if not user_ids:
+                        return 0
+
+                    # 2. 결근 기록 (그 사이 체크인된 사용자가 있으면 unique_user_date 충돌)
+                    now = datetime.utcnow()
+                    await session.execute(insert(Attendance).values([
+                        {
+                            "user_id": user_id,
+                            "work_date": target_date,
+                            "status": "absent",
+                            "notes": AUTO_ABSENT_NOTE,
+                            "created_at": now,
+                            "updated_at": now,
+                        }
+                        for user_id in user_ids
+                    ]))
+
+                    # 3. 같은 트랜잭션에서 방금 기록한 사용자들의 월별 근태 집계에 반영
+                    rollup_stmt = mysql_insert(AttendanceMonthly).values([
+                        {"user_id": user_id, "month": month, "total_days": 1, "absent_days": 1}
+                        for user_id in user_ids
+                    ]).on_duplicate_key_update(
+                        total_days=AttendanceMonthly.total_days + 1,
+                        absent_days=AttendanceMonthly.absent_days + 1,
+                    )
+                    await session.execute(rollup_stmt)
+                    return len(user_ids)
+
+                inserted += await _run_chunk(session, absent_chunk)
+
+        logger.info(f"Marked {inserted} users absent for {target_date}.")
+        await _record_job_run("mark_absent", started_at, started, inserted, "success", str(target_date))
+        return inserted
+
+    except Exception as e:
+        logger.error(f"Error in absence job: {e}")
+        await _record_job_run("mark_absent", started_at, started, inserted, "failed", str(e))
+        raise
+
 
 # 스케줄러 객체 생성
 scheduler = AsyncIOScheduler()
 
 # 매월 1일 0시 1분에 실행되도록 등록
-scheduler.add_job(add_monthly_leave_job, 'cron', month='*', day=1, hour=0, minute=1)
\ No newline at end of file
+scheduler.add_job(add_monthly_leave_job, 'cron', month='*', day=1, hour=0, minute=1)
+
+# 평일(월~금) 23시 30분에 당일 결근 처리
+scheduler.add_job(mark_absent_job, 'cron', day_of_week='mon-fri', hour=23, minute=30)
@@ -0,0 +1,125 @@
+import asyncio
+import logging
+from typing import Optional
+
+from apscheduler.schedulers.base import STATE_STOPPED
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from core.config import settings
+from db.database import engine
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderLock:
+    """
+    MySQL GET_LOCK 기반 리더 잠금.
+    잠금은 잡은 커넥션에 묶여 있으므로, 리더인 동안 전용 커넥션을 풀에서 빌려 계속 유지합니다.
+    프로세스가 죽거나 커넥션이 끊기면 MySQL이 잠금을 자동으로 풀어 다른 인스턴스가 이어받습니다.
+    (MySQL이 아닌 DB에서는 단일 인스턴스 개발 환경으로 보고 항상 리더로 취급)
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._conn: Optional[AsyncConnection] = None
+
+    @property
+    def _supported(self) -> bool:
+        return engine.dialect.name == "mysql"
+
+    async def acquire(self) -> bool:
+        """잠금을 바로 잡아 보고(대기 없음) 성공 여부를 반환합니다."""
+        if not self._supported:
+            return True
+        conn = None
+        try:
+            # DB에 연결할 수 없는 경우(컨테이너 기동 중, 장애 조치 등)도 실패로 보고 다음 주기에 재시도
+            conn = await engine.connect()
+            result = await conn.execute(text("SELECT GET_LOCK(:name, 0)"), {"name": self.name})
+            if result.scalar() == 1:
+                self._conn = conn
+                return True
+        except Exception as e:
+            logger.warning(f"Failed to acquire scheduler lock: {e}")
+        if conn is not None:
+            try:
+                await conn.close()
+            except Exception:
+                pass
+        return False
+
+    async def is_held(self) -> bool:
+        """
+        잠금을 아직 이 커넥션이 가지고 있는지 확인합니다.
+        (주기적으로 호출되어 커넥션이 wait_timeout으로 끊기지 않게 하는 역할도 함)
+        """
+        if not self._supported:
+            return True
+        if self._conn is None:
+            return False
+        try:
+            result = await self._conn.execute(
+                text("SELECT IS_USED_LOCK(:name) = CONNECTION_ID()"), {"name": self.name}
+            )
+            return result.scalar() == 1
+        except Exception as e:
+            logger.warning(f"Lost scheduler lock connection: {e}")
+            await self._discard()
+            return False
+
+    async def release(self) -> None:
+        if self._conn is None:
+            return
+        try:
+            await self._conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": self.name})
+        except Exception as e:
+            logger.warning(f"Failed to release scheduler lock: {e}")
+        await self._discard()
+
+    async def _discard(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            try:
+                await conn.close()
+            except Exception:
+                pass
+
+
+async def run_with_leader_lock(scheduler) -> None:
+    """
+    리더 잠금을 잡은 인스턴스에서만 스케줄러 작업이 실행되도록 합니다.
+    - 스케줄러는 일시정지 상태로 시작하고, 잠금을 잡으면 재개 / 잃으면 다시 일시정지
+    - SCHEDULER_LOCK_CHECK_SECONDS마다 잠금 획득을 시도하거나 보유 여부를 확인
+    - 예상하지 못한 오류는 로그를 남기고 다음 주기에 다시 시도 (Task가 조용히 끝나지 않도록)
+    - 취소되면(종료 시) 잠금을 반납
+    """
+    lock = LeaderLock(settings.SCHEDULER_LOCK_NAME)
+    if scheduler.state == STATE_STOPPED:
+        scheduler.start(paused=True)
+
+    leader = False
+    try:
+        while True:
+            try:
+                if not leader:
+                    leader = await lock.acquire()
+                    if leader:
+                        scheduler.resume()
+                        logger.info("Acquired scheduler leader lock; jobs resumed.")
+                elif not await lock.is_held():
+                    leader = False
+                    scheduler.pause()
+                    logger.warning("Scheduler leader lock lost; jobs paused.")
+            except Exception:
+                logger.exception("Scheduler leader loop failed; retrying.")
+                if leader:
+                    # 잠금 상태를 알 수 없으므로 작업을 멈추고 잠금을 다시 잡음
+                    leader = False
+                    scheduler.pause()
+                    await lock.release()
+            await asyncio.sleep(settings.SCHEDULER_LOCK_CHECK_SECONDS)
+    finally:
+        if leader:
+            scheduler.pause()
+        await lock.release()
@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from datetime import date, time, datetime
-from typing import Optional
+from typing import List, Literal, Optional
 
 from schemas.user import UserRead
 
@@ -55,3 +55,39 @@ class AttendanceStats(BaseModel):
     early_leave_days: int
     absent_days: int
     attendance_rate: float  # 출석률 (%)
+
+
+# 월별 근태 통계 응답
+class AttendanceMonthlyStats(AttendanceStats):
+    month: str  # "YYYY-MM"
+
+
+# 사용자별 근태 통계 응답 (관리자 대시보드용)
+class AttendanceUserStats(AttendanceStats):
+    user_id: int
+    email: str
+    name: str
+
+
+# 출입 단말기 이벤트 (NDJSON 한 줄)
+class PunchEvent(BaseModel):
+    user_id: int
+    timestamp: datetime
+    direction: Literal["in", "out"]
+
+
+# 출입 이벤트 처리 결과
+class PunchResult(BaseModel):
+    line: int  # 요청 본문의 줄 번호 (1부터)
+    user_id: Optional[int] = None
+    result: str  # checked_in, checked_out, already_checked_in, already_checked_out, no_check_in, unknown_user, invalid, error
+    status: Optional[str] = None  # 반영 후 근태 상태
+    detail: Optional[str] = None
+
+
+# 출입 기록 일괄 반영 응답
+class PunchIngestResponse(BaseModel):
+    received: int
+    applied: int
+    rejected: int
+    results: List[PunchResult]
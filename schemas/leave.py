@@ -1,6 +1,7 @@
 from sqlmodel import SQLModel
 from datetime import date
-from typing import Optional
+from typing import List, Literal, Optional
+from pydantic import Field
 
 # 1. 연차 신청 시 받을 데이터
 class LeaveRequestCreate(SQLModel):
@@ -22,4 +23,31 @@ class LeaveRequestRead(SQLModel):
 class LeaveBalanceRead(SQLModel):
     total_granted: float
     total_used: float
-    remaining_days: float # 계산된 남은 연차
\ No newline at end of file
+    total_reserved: float # 승인 대기 중인 신청 일수
+    remaining_days: float # 계산된 남은 연차 (부여 - 사용 - 대기)
+
+# 4. 연차 일괄 승인/거부 요청
+class LeaveBulkDecision(SQLModel):
+    request_ids: List[int] = Field(min_length=1, max_length=1000)
+    action: Literal["approve", "reject"]
+
+# 5. 연차 일괄 승인/거부 결과 (신청 건별)
+class LeaveDecisionResult(SQLModel):
+    request_id: int
+    outcome: str  # approved, rejected, not_found, not_pending
+    status: Optional[str] = None  # 처리 후 신청 상태
+
+# 6. 팀 연차 캘린더 (날짜별 부재 인원)
+class LeaveCalendarEntry(SQLModel):
+    request_id: int
+    user_id: int
+    user_name: str
+    user_email: str
+    start_date: date
+    end_date: date
+    days_used: float
+    status: str  # approved, pending
+
+class LeaveCalendarDay(SQLModel):
+    date: date
+    entries: List[LeaveCalendarEntry]
@@ -1,6 +1,6 @@
 from sqlmodel import SQLModel
 from datetime import datetime
-from typing import Optional
+from typing import Optional, List
 
 # 1. 급여 명세서 입력 시 받을 데이터
 class SalaryStatementCreate(SQLModel):
@@ -24,4 +24,30 @@ class SalaryStatementRead(SQLModel):
 # 3. PDF 업로드 응답 데이터
 class PayslipUploadResponse(SQLModel):
     message: str
-    salary_statement: SalaryStatementRead
\ No newline at end of file
+    salary_statement: SalaryStatementRead
+
+# 4. PDF 비동기 추출 작업 상태 응답 데이터
+class PayslipJobRead(SQLModel):
+    job_id: str
+    status: str # queued, processing, completed, failed
+    filename: str
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+    salary_statement: Optional[SalaryStatementRead] = None
+
+# 5. PDF 일괄 업로드 파일별 결과
+class PayslipBulkItemResult(SQLModel):
+    filename: str
+    status: str # created, duplicate, error
+    pay_month: Optional[str] = None
+    salary_statement_id: Optional[int] = None
+    error: Optional[str] = None
+
+# 6. PDF 일괄 업로드 응답 데이터
+class PayslipBulkUploadResponse(SQLModel):
+    total: int
+    created: int
+    duplicates: int
+    errors: int
+    results: List[PayslipBulkItemResult]
@@ -1,5 +1,6 @@
 from sqlmodel import SQLModel
 from datetime import date
+from typing import Optional
 from db.models import User  # User 모델 참조
 
 # 회원가입 시 받을 데이터 (비밀번호 포함)
@@ -16,4 +17,16 @@ class UserRead(SQLModel):
     name: str
     hire_date: date
     is_active: bool
-    role: str
\ No newline at end of file
+    role: str
+
+# 인증 Dependency가 반환하는 최소 사용자 정보 (principal 캐시에 저장)
+class UserPrincipal(SQLModel):
+    id: int
+    email: str
+    role: str
+    is_active: bool
+
+# 관리자용 사용자 권한/상태 변경 요청
+class UserStatusUpdate(SQLModel):
+    role: Optional[str] = None
+    is_active: Optional[bool] = None
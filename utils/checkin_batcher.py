@@ -0,0 +1,108 @@
+import asyncio
+import logging
+from datetime import date, time
+from typing import Optional
+
+from core.config import settings
+from db import crud
+from db.database import async_session_factory
+from db.models import Attendance
+
+logger = logging.getLogger(__name__)
+
+# 출근 체크인 묶음 쓰기(group commit)
+# 요청마다 트랜잭션을 열고 commit하는 대신, CHECKIN_BATCH_WINDOW_MS 동안(또는
+# CHECKIN_BATCH_MAX_ROWS개가 모일 때까지) 들어온 체크인을 INSERT 1회 + commit 1회로 저장하고
+# 각 요청에는 자신의 결과(Attendance 또는 중복 오류)를 돌려줍니다.
+# 워커 프로세스 내 메모리에서만 모으므로 프로세스마다 별도의 묶음이 만들어집니다.
+
+_pending: list[tuple[tuple, asyncio.Future]] = []
+_timer: Optional[asyncio.TimerHandle] = None
+# 실행 중인 저장 Task 참조 유지 (GC 방지, 종료 시 대기)
+_tasks: set = set()
+_stats = {"batches": 0, "rows": 0, "fallbacks": 0}
+
+
+async def submit(
+    user_id: int, work_date: date, check_in_time: time, notes: Optional[str] = None
+) -> Attendance:
+    """
+    체크인을 현재 묶음에 추가하고, 묶음이 저장되면 결과를 반환합니다.
+
+    Raises:
+        DuplicateRecordError: 이미 해당 날짜에 기록이 있을 경우
+    """
+    global _timer
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    _pending.append(((user_id, work_date, check_in_time, notes), future))
+
+    if len(_pending) >= settings.CHECKIN_BATCH_MAX_ROWS:
+        _flush()
+    elif _timer is None:
+        _timer = loop.call_later(settings.CHECKIN_BATCH_WINDOW_MS / 1000, _flush)
+    return await future
+
+
+def _flush() -> None:
+    """모인 체크인을 떼어 내 저장 Task로 넘깁니다."""
+    global _pending, _timer
+    if _timer is not None:
+        _timer.cancel()
+        _timer = None
+    batch, _pending = _pending, []
+    if not batch:
+        return
+    task = asyncio.create_task(_write(batch))
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+
+
+async def _write(batch: list[tuple[tuple, asyncio.Future]]) -> None:
+    check_ins = [check_in for check_in, _ in batch]
+    try:
+        async with async_session_factory() as session:
+            results = await crud.bulk_check_in_attendance(session, check_ins)
+        _stats["batches"] += 1
+        _stats["rows"] += len(check_ins)
+    except crud.DuplicateRecordError:
+        # 사전 확인 이후 다른 경로의 체크인과 겹친 경우: 한 건씩 다시 저장
+        _stats["fallbacks"] += 1
+        results = []
+        for user_id, work_date, check_in_time, notes in check_ins:
+            try:
+                async with async_session_factory() as session:
+                    results.append(await crud.check_in_attendance(
+                        session, user_id, work_date, check_in_time, notes
+                    ))
+            except Exception as e:
+                results.append(e)
+    except Exception as e:
+        logger.error(f"체크인 묶음 저장 실패 ({len(batch)}건): {str(e)}")
+        results = [e] * len(batch)
+
+    for (_, future), result in zip(batch, results):
+        # 요청이 먼저 취소된 경우(클라이언트 연결 종료 등) 결과를 버림
+        if future.done():
+            continue
+        if isinstance(result, BaseException):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
+
+
+async def drain() -> None:
+    """애플리케이션 종료 시 대기 중인 체크인을 모두 저장합니다."""
+    _flush()
+    if _tasks:
+        await asyncio.gather(*_tasks, return_exceptions=True)
+
+
+def stats() -> dict:
+    """누적 묶음 수/행 수와 현재 대기 중인 체크인 수"""
+    batches = _stats["batches"]
+    return {
+        **_stats,
+        "pending": len(_pending),
+        "avg_batch_size": round(_stats["rows"] / batches, 2) if batches else 0.0,
+    }
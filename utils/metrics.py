@@ -0,0 +1,186 @@
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# 요청/쿼리 지표 수집 (Prometheus 텍스트 형식으로 /metrics에서 노출)
+# - 라우트별 요청 수(상태 코드별)와 처리 시간 히스토그램
+# - 요청 1건이 실행한 SQL 수와 DB 시간 히스토그램 (N+1 쿼리 탐지용)
+# - 전체 SQL 실행 수/시간 (스케줄러 등 요청 밖에서 실행된 쿼리 포함)
+# 워커 프로세스 메모리에만 쌓이므로 워커마다 따로 수집됩니다. (Prometheus에서 합산)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200)
+DB_TIME_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+# 라우트에 매칭되지 않은 요청(404 등)은 경로 대신 이 값으로 묶음 (라벨 수 폭증 방지)
+UNMATCHED_ROUTE = "unmatched"
+
+
+class Histogram:
+    """라벨 조합별 누적 버킷 카운트/합계/건수"""
+
+    def __init__(self, name: str, help_text: str, label_names: tuple, buckets: tuple):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = buckets
+        self._series: dict[tuple, list] = {}  # 라벨 값 -> [버킷별 건수..., 합계, 건수]
+
+    def observe(self, labels: tuple, value: float) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0] * len(self.buckets) + [0.0, 0]
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                series[index] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for labels, series in sorted(self._series.items()):
+            base = _labels(self.label_names, labels)
+            for bound, count in zip(self.buckets, series):
+                lines.append(f'{self.name}_bucket{{{base},le="{_number(bound)}"}} {count}')
+            lines.append(f'{self.name}_bucket{{{base},le="+Inf"}} {series[-1]}')
+            lines.append(f"{self.name}_sum{{{base}}} {_number(series[-2])}")
+            lines.append(f"{self.name}_count{{{base}}} {series[-1]}")
+        return lines
+
+
+class Counter:
+    """라벨 조합별 누적 값"""
+
+    def __init__(self, name: str, help_text: str, label_names: tuple = ()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, labels: tuple = (), amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        for labels, value in sorted(self._values.items()):
+            base = _labels(self.label_names, labels)
+            lines.append(f"{self.name}{{{base}}} {_number(value)}" if base else f"{self.name} {_number(value)}")
+        return lines
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: tuple, values: tuple) -> str:
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+http_requests_total = Counter(
+    "http_requests_total", "HTTP requests by route and status code", ("method", "route", "status")
+)
+http_request_duration = Histogram(
+    "http_request_duration_seconds", "HTTP request latency in seconds",
+    ("method", "route"), LATENCY_BUCKETS,
+)
+http_request_db_queries = Histogram(
+    "http_request_db_queries", "SQL statements executed per HTTP request",
+    ("method", "route"), QUERY_COUNT_BUCKETS,
+)
+http_request_db_duration = Histogram(
+    "http_request_db_duration_seconds", "Time spent executing SQL per HTTP request",
+    ("method", "route"), DB_TIME_BUCKETS,
+)
+db_queries_total = Counter("db_queries_total", "SQL statements executed (all callers)")
+db_query_duration_total = Counter(
+    "db_query_duration_seconds_total", "Time spent executing SQL in seconds (all callers)"
+)
+
+
+# 1. 요청별 SQL 수/시간 (요청 시작 시 새 객체를 넣고, 쿼리 이벤트가 같은 객체에 누적)
+class RequestDBStats:
+    __slots__ = ("queries", "seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.seconds = 0.0
+
+
+_request_db: ContextVar[Optional[RequestDBStats]] = ContextVar("request_db_stats", default=None)
+
+
+def start_request() -> RequestDBStats:
+    stats = RequestDBStats()
+    _request_db.set(stats)
+    return stats
+
+
+def observe_request(method: str, route: str, status_code: int, seconds: float, db: RequestDBStats) -> None:
+    http_requests_total.inc((method, route, str(status_code)))
+    http_request_duration.observe((method, route), seconds)
+    http_request_db_queries.observe((method, route), db.queries)
+    http_request_db_duration.observe((method, route), db.seconds)
+
+
+# 2. SQLAlchemy 이벤트로 쿼리 시간 측정
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get("query_started")
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    db_queries_total.inc()
+    db_query_duration_total.inc(amount=elapsed)
+    stats = _request_db.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.seconds += elapsed
+
+
+def _handle_error(exception_context):
+    # 실패한 쿼리는 after_cursor_execute가 호출되지 않으므로 시작 시각만 정리
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_started"):
+        conn.info["query_started"].pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """엔진(비동기 엔진은 engine.sync_engine)에 쿼리 측정 이벤트를 등록합니다."""
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+# 3. Prometheus 텍스트 형식 출력
+def render(extra_gauges: Optional[dict] = None) -> str:
+    """
+    수집한 지표를 Prometheus 텍스트 형식(0.0.4)으로 반환합니다.
+    extra_gauges: {이름: (설명, 값)} — 커넥션 풀 현황처럼 조회 시점의 값
+    """
+    lines = []
+    for metric in (
+        http_requests_total,
+        http_request_duration,
+        http_request_db_queries,
+        http_request_db_duration,
+        db_queries_total,
+        db_query_duration_total,
+    ):
+        lines.extend(metric.render())
+    for name, (help_text, value) in (extra_gauges or {}).items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} gauge")
+        lines.append(f"{name} {_number(value)}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,260 @@
+import asyncio
+import io
+import logging
+import uuid
+import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Optional, Union
+
+from core.cache import TTLCache
+from core.config import settings
+from db import crud
+from db.database import async_session_factory
+from db.models import SalaryStatement
+from schemas.salary import SalaryStatementCreate
+from utils.pdf_extractor import extract_and_validate_bytes, content_digest, payslip_cache
+
+logger = logging.getLogger(__name__)
+
+
+class QueueFullError(Exception):
+    """대기열이 가득 차서 작업을 받을 수 없을 때 발생"""
+
+
+class PayslipJob:
+    """급여명세서 PDF 추출 작업 상태"""
+    def __init__(self, user_id: int, filename: str):
+        self.job_id: str = uuid.uuid4().hex
+        self.user_id = user_id
+        self.filename = filename
+        self.status: str = "queued"  # queued, processing, completed, failed
+        self.created_at: datetime = datetime.utcnow()
+        self.finished_at: Optional[datetime] = None
+        self.error: Optional[str] = None
+        self.salary_statement: Optional[SalaryStatement] = None
+
+
+# PDF 파싱은 순수 CPU 작업이므로 별도 프로세스에서 실행 (요청 처리 루프와 분리)
+_executor: Optional[ProcessPoolExecutor] = None
+# 작업 상태 보관소 (워커 프로세스 내 메모리, 오래된 작업은 자동 만료)
+_jobs = TTLCache(
+    maxsize=max(settings.PAYSLIP_QUEUE_SIZE * 20, 1000),
+    ttl_seconds=settings.PAYSLIP_JOB_RETENTION_SECONDS,
+)
+_pending = 0
+# 실행 중인 Task 참조 유지 (GC 방지)
+_tasks: set = set()
+
+
+def get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=settings.PAYSLIP_WORKERS)
+    return _executor
+
+
+def shutdown() -> None:
+    """애플리케이션 종료 시 프로세스 풀 정리"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def queue_depth() -> int:
+    return _pending
+
+
+async def save_payslip(session, user_id: int, payslip_data) -> SalaryStatement:
+    """
+    추출된 급여명세서 데이터를 저장합니다.
+
+    Raises:
+        DuplicateRecordError: 같은 급여년월의 명세서가 이미 있을 경우
+    """
+    salary_create = SalaryStatementCreate(
+        pay_month=payslip_data.pay_month,
+        base_pay=payslip_data.base_pay,
+        bonus=0,  # PDF에서 보너스 정보가 없으므로 0으로 설정
+        deductions=payslip_data.deductions,
+        net_pay=payslip_data.net_pay
+    )
+    return await crud.create_salary_statement(
+        session=session, user_id=user_id, statement_in=salary_create
+    )
+
+
+async def _run_job(job: PayslipJob, content: bytes) -> None:
+    global _pending
+    try:
+        job.status = "processing"
+        # 같은 내용의 PDF는 캐시된 추출 결과를 사용 (프로세스 풀로 보내지 않음)
+        digest = content_digest(content)
+        payslip_data = payslip_cache.get(digest)
+        if payslip_data is None:
+            loop = asyncio.get_running_loop()
+            payslip_data = await loop.run_in_executor(
+                get_executor(),
+                extract_and_validate_bytes,
+                content,
+                settings.PAYSLIP_EXTRACT_MODE,
+            )
+            payslip_cache.set(digest, payslip_data)
+        async with async_session_factory() as session:
+            job.salary_statement = await save_payslip(session, job.user_id, payslip_data)
+        job.status = "completed"
+    except ValueError as e:
+        job.status = "failed"
+        job.error = str(e)
+    except Exception as e:
+        logger.error(f"급여명세서 작업 실패 ({job.job_id}): {str(e)}")
+        job.status = "failed"
+        job.error = f"급여명세서 처리 중 오류가 발생했습니다: {str(e)}"
+    finally:
+        job.finished_at = datetime.utcnow()
+        _pending -= 1
+
+
+def submit(user_id: int, filename: str, content: bytes) -> PayslipJob:
+    """
+    PDF 추출 작업을 등록하고 즉시 반환합니다.
+
+    Raises:
+        QueueFullError: 대기+처리 중 작업이 PAYSLIP_QUEUE_SIZE에 도달한 경우
+    """
+    global _pending
+    if _pending >= settings.PAYSLIP_QUEUE_SIZE:
+        raise QueueFullError("급여명세서 처리 대기열이 가득 찼습니다. 잠시 후 다시 시도해주세요.")
+
+    job = PayslipJob(user_id=user_id, filename=filename)
+    _jobs.set(job.job_id, job)
+    _pending += 1
+    task = asyncio.create_task(_run_job(job, content))
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+    return job
+
+
+def get_job(job_id: str) -> Optional[PayslipJob]:
+    return _jobs.get(job_id)
+
+
+class BulkLimitError(ValueError):
+    """일괄 업로드 전체의 파일 개수 또는 압축 해제 후 합계 크기 한도 초과"""
+
+
+def collect_pdf_entries(
+    filename: str,
+    content: bytes,
+    max_entry_bytes: Optional[int] = None,
+    max_files: Optional[int] = None,
+    max_total_bytes: Optional[int] = None,
+) -> list[tuple[str, Union[bytes, ValueError]]]:
+    """
+    업로드 파일 하나를 (파일명, PDF 바이트) 목록으로 펼칩니다.
+    - .pdf: 그대로 반환
+    - .zip: 내부의 .pdf 파일만 추출 (디렉토리, macOS 메타데이터 제외)
+    - max_files / max_total_bytes: 이 파일에 남은 개수/크기 한도.
+      ZIP은 infolist()로 개수와 압축 해제 크기를 먼저 확인한 뒤에만 압축을 풉니다.
+      (zipfile은 헤더의 file_size보다 많이 풀지 않으므로 선언 크기로 상한을 걸 수 있음)
+    - ZIP 내부 파일 중 max_entry_bytes를 넘거나 읽을 수 없는 항목(암호화, 손상, 미지원 압축 방식)은
+      바이트 대신 ValueError를 담아 반환합니다. (해당 파일만 실패 처리)
+
+    Raises:
+        BulkLimitError: max_files 또는 max_total_bytes를 넘는 경우
+        ValueError: PDF/ZIP이 아니거나 ZIP을 열 수 없는 경우
+    """
+    lower = filename.lower()
+    if lower.endswith('.pdf'):
+        _check_bulk_limits(1, len(content), max_files, max_total_bytes)
+        return [(filename, content)]
+    if not lower.endswith('.zip'):
+        raise ValueError("PDF 또는 ZIP 파일만 업로드 가능합니다.")
+
+    try:
+        with zipfile.ZipFile(io.BytesIO(content)) as archive:
+            infos = [
+                info for info in archive.infolist()
+                if not info.is_dir()
+                and info.filename.lower().endswith('.pdf')
+                and not info.filename.startswith('__MACOSX/')
+            ]
+            # 압축 해제 전에 개수와 크기 확인 (압축 폭탄 방지)
+            _check_bulk_limits(
+                len(infos), sum(info.file_size for info in infos), max_files, max_total_bytes
+            )
+            return [
+                (f"{filename}/{info.filename}", _read_zip_entry(archive, info, max_entry_bytes))
+                for info in infos
+            ]
+    except zipfile.BadZipFile:
+        raise ValueError("ZIP 파일을 열 수 없습니다.")
+
+
+def _read_zip_entry(
+    archive: zipfile.ZipFile, info: zipfile.ZipInfo, max_entry_bytes: Optional[int]
+) -> Union[bytes, ValueError]:
+    """ZIP 내부 파일 하나를 읽습니다. 실패하면 예외를 발생시키지 않고 ValueError를 반환"""
+    if max_entry_bytes is not None and info.file_size > max_entry_bytes:
+        return ValueError("ZIP 내부 파일이 너무 큽니다.")
+    try:
+        return archive.read(info)
+    except NotImplementedError:
+        # RuntimeError의 하위 클래스이므로 먼저 확인
+        return ValueError("지원하지 않는 압축 방식입니다.")
+    except RuntimeError:
+        # 암호가 걸린 항목
+        return ValueError("암호화된 ZIP 내부 파일은 읽을 수 없습니다.")
+    except (zipfile.BadZipFile, zlib.error, EOFError) as e:
+        return ValueError(f"손상된 ZIP 내부 파일입니다: {e}")
+
+
+def _check_bulk_limits(
+    files: int, total_bytes: int, max_files: Optional[int], max_total_bytes: Optional[int]
+) -> None:
+    if max_files is not None and files > max_files:
+        raise BulkLimitError("일괄 업로드 가능한 PDF 개수를 초과했습니다.")
+    if max_total_bytes is not None and total_bytes > max_total_bytes:
+        raise BulkLimitError("일괄 업로드 가능한 PDF 전체 크기(압축 해제 기준)를 초과했습니다.")
+
+
+async def extract_many(contents: list[bytes]) -> list:
+    """
+    여러 PDF를 프로세스 풀에 분산하여 동시에 추출합니다.
+    결과 목록의 각 항목은 PayslipData 또는 발생한 예외입니다.
+    - 캐시에 있는 PDF와, 한 묶음 안에서 내용이 같은 PDF는 한 번만 추출합니다.
+    """
+    digests = [content_digest(content) for content in contents]
+    results: dict[str, object] = {}
+    to_extract: dict[str, bytes] = {}
+    for digest, content in zip(digests, contents):
+        if digest in results or digest in to_extract:
+            continue
+        cached = payslip_cache.get(digest)
+        if cached is not None:
+            results[digest] = cached
+        else:
+            to_extract[digest] = content
+
+    loop = asyncio.get_running_loop()
+    executor = get_executor()
+    extracted = await asyncio.gather(
+        *[
+            loop.run_in_executor(
+                executor,
+                extract_and_validate_bytes,
+                content,
+                settings.PAYSLIP_EXTRACT_MODE,
+            )
+            for content in to_extract.values()
+        ],
+        return_exceptions=True,
+    )
+    for digest, data in zip(to_extract, extracted):
+        results[digest] = data
+        if not isinstance(data, BaseException):
+            payslip_cache.set(digest, data)
+
+    return [results[digest] for digest in digests]
@@ -1,8 +1,13 @@
+import hashlib
+import io
 import re
 import pdfplumber
-from typing import Optional, Dict
+from typing import Optional
 import logging
 
+from core.cache import TTLCache
+from core.config import settings
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,67 +20,103 @@ class PayslipData:
         self.net_pay: Optional[int] = None  # 차인지급액
 
 
-def extract_payslip_data(pdf_file) -> PayslipData:
+# 추출 대상 필드를 하나의 정규식으로 미리 컴파일 (텍스트를 한 번만 훑음)
+# - 급여년월: "2025년 10월"
+# - 지급액계 / 공제액계 / 차인지급액: 글자 사이 공백 허용
+_FIELD_SCANNER = re.compile(
+    r'(?P<year>\d{4})년\s*(?P<month>\d{1,2})월'
+    r'|지\s*급\s*액\s*계\s+(?P<base_pay>[0-9,]+)'
+    r'|공\s*제\s*액\s*계\s+(?P<deductions>[0-9,]+)'
+    r'|차\s*인\s*지\s*급\s*액\s+(?P<net_pay>[0-9,]+)'
+)
+_AMOUNT_FIELDS = ("base_pay", "deductions", "net_pay")
+
+EXTRACT_MODES = ("text", "simple")
+
+
+def _scan_fields(text: str, data: PayslipData) -> None:
+    """텍스트에서 아직 찾지 못한 필드만 채웁니다. (필드별 첫 매칭 우선)"""
+    for match in _FIELD_SCANNER.finditer(text):
+        if match.group("year"):
+            if not data.pay_month:
+                data.pay_month = f"{match.group('year')}-{match.group('month').zfill(2)}"
+            continue
+        for field in _AMOUNT_FIELDS:
+            value = match.group(field)
+            if value is not None:
+                if getattr(data, field) is None:
+                    setattr(data, field, int(value.replace(',', '')))
+                break
+
+
+def _is_complete(data: PayslipData) -> bool:
+    return None not in (data.pay_month, data.base_pay, data.deductions, data.net_pay)
+
+
+def _page_order(page_count: int) -> list[int]:
+    """요약 정보가 있을 가능성이 높은 첫 페이지, 마지막 페이지를 먼저 확인"""
+    if page_count <= 2:
+        return list(range(page_count))
+    return [0, page_count - 1] + list(range(1, page_count - 1))
+
+
+def _page_text(page, mode: str) -> Optional[str]:
+    if mode == "simple":
+        # 레이아웃 계산 없이 줄 단위로만 묶음 (문자 파싱 외 추가 비용이 거의 없음)
+        return page.extract_text_simple()
+    return page.extract_text()
+
+
+def extract_payslip_data(pdf_file, mode: str = "text") -> PayslipData:
     """
     PDF 급여명세서에서 데이터를 추출합니다.
 
     Args:
-        pdf_file: 업로드된 PDF 파일 객체 (UploadFile 또는 파일 경로)
+        pdf_file: 업로드된 PDF 파일 객체 (파일 경로 또는 파일 객체)
+        mode: "text"(기본, 레이아웃 기반 텍스트) 또는 "simple"(단순 줄 단위 텍스트, 더 빠름).
+            simple 모드로 필드를 모두 찾지 못하면 text 모드로 다시 확인합니다.
 
     Returns:
         PayslipData: 추출된 급여명세서 데이터
     """
+    if mode not in EXTRACT_MODES:
+        raise ValueError(f"지원하지 않는 추출 모드입니다: {mode}")
+
     data = PayslipData()
 
     try:
         with pdfplumber.open(pdf_file) as pdf:
-            for page in pdf.pages:
-                text = page.extract_text()
-
-                if not text:
-                    logger.warning("PDF 페이지에서 텍스트를 추출할 수 없습니다.")
-                    continue
-
-                logger.info(f"추출된 텍스트:\n{text}\n")
-
-                # 급여년월 추출: "2025년 10월" 패턴 매칭
-                if not data.pay_month:
-                    year_month_match = re.search(r'(\d{4})년\s*(\d{1,2})월', text)
-                    if year_month_match:
-                        year = year_month_match.group(1)
-                        month = year_month_match.group(2).zfill(2)  # 한 자리 월을 두 자리로
-                        data.pay_month = f"{year}-{month}"
-                        logger.info(f"급여년월 매칭: {data.pay_month}")
-
-                # 지급액계 추출 (공백이 포함된 패턴으로 매칭)
-                if not data.base_pay and "지" in text and "급" in text and "액" in text and "계" in text:
-                    match = re.search(r'지\s*급\s*액\s*계\s+([0-9,]+)', text)
-                    if match:
-                        data.base_pay = int(match.group(1).replace(',', ''))
-                        logger.info(f"지급액계 매칭: {match.group(1)} -> {data.base_pay}")
-
-                # 공제액계 추출
-                if not data.deductions and "공" in text and "제" in text and "액" in text and "계" in text:
-                    match = re.search(r'공\s*제\s*액\s*계\s+([0-9,]+)', text)
-                    if match:
-                        data.deductions = int(match.group(1).replace(',', ''))
-                        logger.info(f"공제액계 매칭: {match.group(1)} -> {data.deductions}")
-
-                # 차인지급액 추출
-                if not data.net_pay and "차" in text and "인" in text and "지" in text and "급" in text and "액" in text:
-                    match = re.search(r'차\s*인\s*지\s*급\s*액\s+([0-9,]+)', text)
-                    if match:
-                        data.net_pay = int(match.group(1).replace(',', ''))
-                        logger.info(f"차인지급액 매칭: {match.group(1)} -> {data.net_pay}")
-
-                # 모든 데이터를 찾았으면 중단
-                if all([data.pay_month, data.base_pay, data.deductions, data.net_pay]):
+            passes = [mode] if mode == "text" else [mode, "text"]
+            for pass_mode in passes:
+                for index in _page_order(len(pdf.pages)):
+                    page = pdf.pages[index]
+                    text = _page_text(page, pass_mode)
+                    # 페이지별 캐시(문자/객체)를 바로 해제하여 메모리 사용량 억제
+                    page.close()
+
+                    if not text:
+                        logger.warning("PDF 페이지에서 텍스트를 추출할 수 없습니다.")
+                        continue
+
+                    logger.debug(f"추출된 텍스트 (page {index + 1}, {pass_mode}):\n{text}\n")
+                    _scan_fields(text, data)
+
+                    # 모든 데이터를 찾았으면 중단
+                    if _is_complete(data):
+                        break
+                if _is_complete(data):
                     break
+                logger.debug(f"{pass_mode} 모드로 일부 항목을 찾지 못했습니다. 다음 방식으로 재시도합니다.")
 
     except Exception as e:
         logger.error(f"PDF 파싱 에러: {str(e)}")
         raise ValueError(f"PDF 파일을 파싱하는 중 오류가 발생했습니다: {str(e)}")
 
+    logger.info(
+        f"급여명세서 추출: {data.pay_month} 지급액계={data.base_pay} "
+        f"공제액계={data.deductions} 차인지급액={data.net_pay}"
+    )
+
     # 필수 데이터 검증
     if not data.pay_month:
         raise ValueError("급여년월을 찾을 수 없습니다.")
@@ -122,3 +163,38 @@ def validate_payslip_data(data: PayslipData) -> bool:
         raise ValueError(f"급여년월 형식이 올바르지 않습니다: {data.pay_month}")
 
     return True
+
+
+def extract_and_validate_bytes(content: bytes, mode: str = "text") -> PayslipData:
+    """
+    PDF 바이트에서 데이터를 추출하고 검증합니다.
+    프로세스 풀에서 실행할 수 있도록 모듈 최상위 함수로 둡니다.
+
+    Raises:
+        ValueError: 추출 또는 검증 실패 시
+    """
+    data = extract_payslip_data(io.BytesIO(content), mode=mode)
+    validate_payslip_data(data)
+    return data
+
+
+# 동일 PDF 재업로드 시 다시 파싱하지 않도록 내용 해시(SHA-256) 기준으로 추출 결과를 보관
+payslip_cache = TTLCache(maxsize=settings.PAYSLIP_CACHE_SIZE)
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def content_digest(source) -> str:
+    """
+    PDF 내용의 SHA-256 해시를 반환합니다.
+    파일 객체는 청크 단위로 읽은 뒤 처음 위치로 되돌립니다. (내용을 복사하지 않음)
+    """
+    digest = hashlib.sha256()
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        digest.update(source)
+    else:
+        source.seek(0)
+        while chunk := source.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+        source.seek(0)
+    return digest.hexdigest()